@@ -15,7 +15,7 @@ class AbstractLogger(ABC):
         return self._tag
 
     @abstractmethod
-    def info(self, message: str):
+    def info(self, message: str, *args):
         pass
 
     @abstractmethod
@@ -23,5 +23,5 @@ class AbstractLogger(ABC):
         pass
 
     @abstractmethod
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         pass
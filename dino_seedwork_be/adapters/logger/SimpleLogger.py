@@ -1,5 +1,7 @@
 import logging
+from random import random
 from traceback import print_exception
+from typing import Any, Callable
 
 from .AbstractLogger import AbstractLogger
 
@@ -12,8 +14,11 @@ SIMPLE_LOGGER = logging.getLogger(__name__)
 
 
 class DomainLogger(AbstractLogger):
-    def info(self, message: str):
-        SIMPLE_LOGGER.info(f"[{self.tag()}] {message}")
+    # Share of the info_with_payload records that carry their payload
+    _payload_sample_rate: float = 1.0
+
+    def info(self, message: str, *args):
+        SIMPLE_LOGGER.info(f"[{self.tag()}] {message}", *args)
 
     def error(self, message: str, error: Exception | None = None):
         SIMPLE_LOGGER.error(f"[{self.tag()}] {message} f{print_exception(error)}")
@@ -21,5 +26,40 @@ class DomainLogger(AbstractLogger):
     def exception(self, error: Exception | None = None):
         SIMPLE_LOGGER.error(f"[{self.tag()}] f{print_exception(error)}")
 
-    def warning(self, message: str):
-        SIMPLE_LOGGER.warning(f"[{self.tag()}] {message}")
+    def warning(self, message: str, *args):
+        SIMPLE_LOGGER.warning(f"[{self.tag()}] {message}", *args)
+
+    def is_enabled_for(self, a_level: int) -> bool:
+        return SIMPLE_LOGGER.isEnabledFor(a_level)
+
+    def info_with_payload(
+        self, message: str, a_payload_factory: Callable[[], Any], *args
+    ):
+        """
+        Log message at INFO level followed by the payload a_payload_factory
+        builds. The payload is only built when INFO is enabled, and only for
+        the share of records given by my payload sample rate, the others
+        are logged without it.
+        """
+        match self.is_enabled_for(logging.INFO):
+            case False:
+                return
+        match random() < self.payload_sample_rate():
+            case True:
+                self.info(f"{message} %s", *args, a_payload_factory())
+            case False:
+                self.info(message, *args)
+
+    def payload_sample_rate(self) -> float:
+        return self._payload_sample_rate
+
+    def set_payload_sample_rate(self, a_rate: float):
+        self._payload_sample_rate = a_rate
+
+    @classmethod
+    def set_default_payload_sample_rate(cls, a_rate: float):
+        """
+        Sets the payload sample rate of every logger that has not been
+        given its own, e.g. 0.01 to keep one payload out of a hundred.
+        """
+        cls._payload_sample_rate = a_rate
@@ -0,0 +1,77 @@
+from hashlib import blake2b
+from math import ceil, log
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    I am a Bloom filter of strings, answering whether a string may have been
+    added, with a false positive rate of about my max false positive rate
+    as long as no more than my capacity strings were added, or whether it
+    was definitely never added
+    """
+
+    _capacity: int
+    _false_positive_rate: float
+    _bit_count: int
+    _hash_count: int
+    _bits: bytearray
+    _count: int
+
+    def __init__(self, a_capacity: int, a_false_positive_rate: float = 0.001) -> None:
+        """
+        @param a_capacity the number of strings I am sized for
+        @param a_false_positive_rate the rate of strings never added that I
+        answer as maybe added, once holding a_capacity strings
+        """
+        self._capacity = a_capacity
+        self._false_positive_rate = a_false_positive_rate
+        self._bit_count = max(
+            8, ceil(-a_capacity * log(a_false_positive_rate) / (log(2) ** 2))
+        )
+        self._hash_count = max(1, round(self._bit_count / a_capacity * log(2)))
+        self.clear()
+
+    def capacity(self) -> int:
+        return self._capacity
+
+    def false_positive_rate(self) -> float:
+        return self._false_positive_rate
+
+    def count(self) -> int:
+        return self._count
+
+    def size_in_bytes(self) -> int:
+        return len(self._bits)
+
+    def clear(self):
+        self._bits = bytearray(ceil(self._bit_count / 8))
+        self._count = 0
+
+    def add(self, a_string: str):
+        for offset in self._offsets_of(a_string):
+            self._bits[offset >> 3] |= 1 << (offset & 7)
+        self._count += 1
+
+    def add_all(self, some_strings: Iterable[str]):
+        for string in some_strings:
+            self.add(string)
+
+    def might_contain(self, a_string: str) -> bool:
+        return all(
+            self._bits[offset >> 3] & (1 << (offset & 7))
+            for offset in self._offsets_of(a_string)
+        )
+
+    def _offsets_of(self, a_string: str) -> Iterable[int]:
+        """
+        Answers my hash count bit offsets of a_string, derived from the two
+        halves of a single digest by double hashing
+        """
+        digest = blake2b(a_string.encode(), digest_size=16).digest()
+        first_hash = int.from_bytes(digest[:8], "little")
+        second_hash = int.from_bytes(digest[8:], "little") | 1
+        return (
+            (first_hash + idx * second_hash) % self._bit_count
+            for idx in range(self._hash_count)
+        )
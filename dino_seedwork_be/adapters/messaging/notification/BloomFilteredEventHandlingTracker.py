@@ -0,0 +1,152 @@
+from threading import Lock
+from typing import Any, List
+
+from returns.functions import tap
+from returns.future import FutureResult, FutureSuccess, future_safe
+from returns.unsafe import unsafe_perform_io
+
+from dino_seedwork_be.adapters.messaging.notification.BloomFilter import \
+    BloomFilter
+from dino_seedwork_be.adapters.messaging.notification.EventHandlingTracker import \
+    EventHandlingTracker
+
+
+class BloomFilteredEventHandlingTracker(EventHandlingTracker):
+    """
+    I front a tracker with a Bloom filter of the message ids marked through
+    me, answering the ones the filter has never seen as not handled without
+    a lookup, only the possible duplicates being looked up in the tracker.
+
+    My negatives are only definite for the marks made through me, which is
+    why I must be rebuilt from the tracker on startup, before which I look
+    every message up, and why I do not fit consumers competing for a queue
+    whose messages may be handled by another process. Since an ExchangeListener
+    consumes its own exclusive queue by default, I fit it as is.
+
+    A tracker cannot list the messages it holds, so whoever builds me, e.g.
+    the process starting an ExchangeListener, rebuilds me before consuming
+    with the ids that may still be delivered again: for notifications, the
+    range of the event store ids up to the last published one, as answered
+    by the get_last_published_notification_id of the publisher.
+    """
+
+    _tracker: EventHandlingTracker
+    _filter: BloomFilter
+    _is_rebuilt: bool = False
+    _lock: Lock
+
+    def __init__(
+        self,
+        a_tracker: EventHandlingTracker,
+        capacity: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+    ) -> None:
+        """
+        @param a_tracker the tracker I front
+        @param capacity the number of message ids my filter is sized for,
+        beyond which my false positive rate grows
+        @param false_positive_rate the rate of messages never marked which
+        are still looked up in the tracker
+        """
+        self._tracker = a_tracker
+        self._filter = BloomFilter(capacity, false_positive_rate)
+        self._lock = Lock()
+
+    def tracker(self) -> EventHandlingTracker:
+        return self._tracker
+
+    def filter(self) -> BloomFilter:
+        return self._filter
+
+    def is_rebuilt(self) -> bool:
+        return self._is_rebuilt
+
+    @future_safe
+    async def rebuild(self, a_message_ids: List[str], a_chunk_size: int = 1000):
+        """
+        Rebuilds my filter with the ones of a_message_ids which are handled in
+        the tracker, e.g. the ids of the notifications published lately,
+        looking them up by chunks of a_chunk_size, then trusts its negatives.
+        The marks made meanwhile are kept. An empty a_message_ids trusts my
+        filter as is, e.g. for a tracker with no history.
+        """
+        handled_ids: List[str] = []
+        for start in range(0, len(a_message_ids), a_chunk_size):
+            chunk = a_message_ids[start : start + a_chunk_size]
+            are_handled = unsafe_perform_io(
+                await self.tracker().check_many(chunk).awaitable()
+            ).unwrap()
+            handled_ids.extend(
+                message_id
+                for message_id, is_handled in zip(chunk, are_handled)
+                if is_handled
+            )
+        with self._lock:
+            self._filter.add_all(handled_ids)
+            self._is_rebuilt = True
+
+    def rebuild_range(
+        self, a_low_message_id: int, a_high_message_id: int, a_chunk_size: int = 1000
+    ) -> FutureResult:
+        """
+        Rebuilds my filter with the numeric message ids in [a_low_message_id,
+        a_high_message_id] which are handled in the tracker, e.g. the
+        notification ids of the event store still in the redelivery window
+        """
+        return self.rebuild(
+            [
+                str(a_message_id)
+                for a_message_id in range(a_low_message_id, a_high_message_id + 1)
+            ],
+            a_chunk_size,
+        )
+
+    def check_if_notif_handled(self, a_message_id: str) -> FutureResult[bool, Any]:
+        match self._might_be_handled(a_message_id):
+            case True:
+                return self.tracker().check_if_notif_handled(a_message_id)
+            case False:
+                return FutureSuccess(False)
+
+    def mark_notif_as_handled(self, a_message_id: str) -> FutureResult:
+        return (
+            self.tracker()
+            .mark_notif_as_handled(a_message_id)
+            .map(tap(lambda _: self._add([a_message_id])))
+        )
+
+    def check_many(self, a_message_ids: List[str]) -> FutureResult[List[bool], Any]:
+        possible_ids = [
+            message_id
+            for message_id in a_message_ids
+            if self._might_be_handled(message_id)
+        ]
+        match possible_ids:
+            case []:
+                return FutureSuccess([False for _ in a_message_ids])
+        return (
+            self.tracker()
+            .check_many(possible_ids)
+            .map(lambda are_handled: dict(zip(possible_ids, are_handled)))
+            .map(
+                lambda is_handled_by_id: [
+                    is_handled_by_id.get(message_id, False)
+                    for message_id in a_message_ids
+                ]
+            )
+        )
+
+    def mark_many(self, a_message_ids: List[str]) -> FutureResult:
+        return (
+            self.tracker()
+            .mark_many(a_message_ids)
+            .map(tap(lambda _: self._add(a_message_ids)))
+        )
+
+    def _might_be_handled(self, a_message_id: str) -> bool:
+        with self._lock:
+            return not self._is_rebuilt or self._filter.might_contain(a_message_id)
+
+    def _add(self, a_message_ids: List[str]):
+        with self._lock:
+            self._filter.add_all(a_message_ids)
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, List, Optional
+
+from returns.functions import tap
+from returns.future import FutureResult, FutureSuccess
+
+from dino_seedwork_be.adapters.messaging.notification.EventHandlingTracker import \
+    EventHandlingTracker
+
+
+class CachedEventHandlingTracker(EventHandlingTracker):
+    """
+    I front a tracker with an in-process LRU cache of the messages known as
+    handled, answering them without a lookup, e.g. on a redelivery storm
+    after a restart. Messages not handled are never cached, since another
+    consumer may handle them at any time. Marks are written through.
+    """
+
+    _tracker: EventHandlingTracker
+    _max_size: int
+    _expired_seconds: Optional[float]
+    # My handled message ids, from the least to the most recently used, with
+    # the monotonic time each one was cached at
+    _handled: "OrderedDict[str, float]"
+    _hit_count: int = 0
+    _miss_count: int = 0
+    _lock: Lock
+
+    def __init__(
+        self,
+        a_tracker: EventHandlingTracker,
+        max_size: int = 10_000,
+        expired_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        @param a_tracker the tracker I front
+        @param max_size the max number of message ids I cache
+        @param expired_seconds the seconds a message id stays cached, for as
+        long as it is used when None
+        """
+        self._tracker = a_tracker
+        self._max_size = max_size
+        self._expired_seconds = expired_seconds
+        self._handled = OrderedDict()
+        self._lock = Lock()
+
+    def tracker(self) -> EventHandlingTracker:
+        return self._tracker
+
+    def size(self) -> int:
+        return len(self._handled)
+
+    def hit_count(self) -> int:
+        return self._hit_count
+
+    def miss_count(self) -> int:
+        return self._miss_count
+
+    def check_if_notif_handled(self, a_message_id: str) -> FutureResult[bool, Any]:
+        match self._is_cached(a_message_id):
+            case True:
+                return FutureSuccess(True)
+            case False:
+                return (
+                    self.tracker()
+                    .check_if_notif_handled(a_message_id)
+                    .map(
+                        tap(
+                            lambda is_handled: self._remember(
+                                [a_message_id], [is_handled]
+                            )
+                        )
+                    )
+                )
+
+    def mark_notif_as_handled(self, a_message_id: str) -> FutureResult:
+        return (
+            self.tracker()
+            .mark_notif_as_handled(a_message_id)
+            .map(tap(lambda _: self._remember([a_message_id], [True])))
+        )
+
+    def check_many(self, a_message_ids: List[str]) -> FutureResult[List[bool], Any]:
+        missed_ids = [
+            message_id
+            for message_id in a_message_ids
+            if not self._is_cached(message_id)
+        ]
+        match missed_ids:
+            case []:
+                return FutureSuccess([True for _ in a_message_ids])
+        return (
+            self.tracker()
+            .check_many(missed_ids)
+            .map(tap(lambda are_handled: self._remember(missed_ids, are_handled)))
+            .map(lambda are_handled: dict(zip(missed_ids, are_handled)))
+            .map(
+                lambda is_handled_by_id: [
+                    is_handled_by_id.get(message_id, True)
+                    for message_id in a_message_ids
+                ]
+            )
+        )
+
+    def mark_many(self, a_message_ids: List[str]) -> FutureResult:
+        return (
+            self.tracker()
+            .mark_many(a_message_ids)
+            .map(
+                tap(
+                    lambda _: self._remember(
+                        a_message_ids, [True for _ in a_message_ids]
+                    )
+                )
+            )
+        )
+
+    def forget(self, a_message_id: str):
+        with self._lock:
+            self._handled.pop(a_message_id, None)
+
+    def _is_cached(self, a_message_id: str) -> bool:
+        """
+        Answers whether a_message_id is cached as handled, counting a hit or
+        a miss
+        """
+        with self._lock:
+            cached_at = self._handled.get(a_message_id)
+            match [cached_at, self._expired_seconds]:
+                case [None, _]:
+                    self._miss_count += 1
+                    return False
+                case [float(), float() | int()] if (
+                    monotonic() - cached_at >= self._expired_seconds
+                ):
+                    del self._handled[a_message_id]
+                    self._miss_count += 1
+                    return False
+                case _:
+                    self._handled.move_to_end(a_message_id)
+                    self._hit_count += 1
+                    return True
+
+    def _remember(self, a_message_ids: List[str], are_handled: List[bool]):
+        """
+        Caches the handled ones of a_message_ids, evicting the least recently
+        used ones beyond my max size
+        """
+        with self._lock:
+            for message_id, is_handled in zip(a_message_ids, are_handled):
+                match is_handled:
+                    case True:
+                        self._handled[message_id] = monotonic()
+                        self._handled.move_to_end(message_id)
+            while len(self._handled) > self._max_size:
+                self._handled.popitem(last=False)
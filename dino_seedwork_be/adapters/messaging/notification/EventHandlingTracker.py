@@ -1,7 +1,8 @@
 from abc import abstractmethod
-from typing import Any
+from typing import Any, List
 
-from returns.future import FutureResult
+from returns.future import FutureResult, FutureSuccess
+from returns.iterables import Fold
 
 
 class EventHandlingTracker:
@@ -12,3 +13,23 @@ class EventHandlingTracker:
     @abstractmethod
     def mark_notif_as_handled(self, a_message_id: str) -> FutureResult:
         pass
+
+    def check_many(self, a_message_ids: List[str]) -> FutureResult[List[bool], Any]:
+        """
+        Answers whether each message of a_message_ids is handled, in order.
+        Checks them one by one unless overridden with a batched lookup
+        """
+        return Fold.collect(
+            [self.check_if_notif_handled(message_id) for message_id in a_message_ids],
+            FutureSuccess(()),
+        ).map(list)
+
+    def mark_many(self, a_message_ids: List[str]) -> FutureResult:
+        """
+        Marks every message of a_message_ids as handled. Marks them one by one
+        unless overridden with a batched write
+        """
+        return Fold.collect(
+            [self.mark_notif_as_handled(message_id) for message_id in a_message_ids],
+            FutureSuccess(()),
+        )
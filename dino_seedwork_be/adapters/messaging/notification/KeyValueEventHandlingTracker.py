@@ -1,6 +1,9 @@
-from typing import Any
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
-from returns.future import FutureResult
+from returns.future import FutureResult, FutureSuccess
+from returns.iterables import Fold
+from returns.maybe import Maybe, Nothing, Some
 
 from dino_seedwork_be.adapters.messaging.notification.EventHandlingTracker import \
     EventHandlingTracker
@@ -8,36 +11,175 @@ from dino_seedwork_be.adapters.persistance.key_value.AbstractKeyValueRepository
     AbstractKeyValueRepository
 from dino_seedwork_be.utils.params import cast_bool_from_str
 
+# The bitmap segment of a message id, as its key and the offset of its bit
+Segment = Tuple[str, int]
+
 
 class KeyValueEventHandlingTracker(EventHandlingTracker):
+    """
+    I track the handled messages in a key value repository, under a key per
+    message, or when compact under a bit per message of bitmap segments
+    keyed by ranges of numeric message ids, e.g. the notification ids of the
+    event store. A segment of 2^20 ids takes 128KiB at most, against a key
+    of about a hundred bytes per message, and expires expired_seconds after
+    it was last marked, once the ids have moved past it.
+    """
+
     _key_value_repository: AbstractKeyValueRepository
     _prefix: str
+    _expired_seconds: Optional[int]
+    _is_compact: bool
+    _segment_size: int
 
     def __init__(
         self,
         key_value_repository: AbstractKeyValueRepository,
         prefix: str = "notification_tracker",
+        expired_seconds: Optional[int] = None,
+        is_compact: bool = False,
+        segment_size: int = 2**20,
     ) -> None:
+        """
+        @param expired_seconds the seconds a handled message is remembered,
+        for ever when None
+        @param is_compact whether numeric message ids are tracked as bits of
+        bitmap segments, others being still tracked under a key each
+        @param segment_size the number of message ids of a bitmap segment
+        """
         self._prefix = prefix
         self._key_value_repository = key_value_repository
+        self._expired_seconds = expired_seconds
+        self._is_compact = is_compact
+        self._segment_size = segment_size
 
     def prefix(self) -> str:
         return self._prefix
 
+    def expired_seconds(self) -> Optional[int]:
+        return self._expired_seconds
+
+    def is_compact(self) -> bool:
+        return self._is_compact
+
     def _key_with_prefix(self, key: str) -> str:
         return f"{self.prefix()}_{key}"
 
+    def _segment_of(self, a_message_id: str) -> Maybe[Segment]:
+        match self.is_compact() and a_message_id.isdigit():
+            case True:
+                return Some(
+                    (
+                        self._key_with_prefix(
+                            f"bitmap_{int(a_message_id) // self._segment_size}"
+                        ),
+                        int(a_message_id) % self._segment_size,
+                    )
+                )
+            case _:
+                return Nothing
+
+    def _locate(
+        self, a_message_ids: List[str]
+    ) -> Tuple[Dict[str, List[Tuple[int, int]]], List[int]]:
+        """
+        Answers the position and bit offset of a_message_ids by bitmap segment
+        key, and the positions of the ones tracked under a key each
+        """
+        segments: Dict[str, List[Tuple[int, int]]] = {}
+        keyed: List[int] = []
+        for idx, message_id in enumerate(a_message_ids):
+            match self._segment_of(message_id):
+                case Some((segment_key, offset)):
+                    segments.setdefault(segment_key, []).append((idx, offset))
+                case _:
+                    keyed.append(idx)
+        return segments, keyed
+
     def check_if_notif_handled(self, a_message_id: str) -> FutureResult[bool, Any]:
-        return self._key_value_repository.get(self._key_with_prefix(a_message_id)).map(
-            lambda maybe_result: maybe_result.map(cast_bool_from_str).value_or(False)
-        )
+        match self._segment_of(a_message_id):
+            case Some((segment_key, offset)):
+                return self._key_value_repository.get_bits(segment_key, [offset]).map(
+                    lambda bits: bits[0]
+                )
+            case _:
+                return self._key_value_repository.get(
+                    self._key_with_prefix(a_message_id)
+                ).map(
+                    lambda maybe_result: maybe_result.map(cast_bool_from_str).value_or(
+                        False
+                    )
+                )
 
     def mark_notif_as_handled(self, a_message_id: str) -> FutureResult:
-        return self._key_value_repository.set(
-            self._key_with_prefix(a_message_id), "True"
+        match self._segment_of(a_message_id):
+            case Some((segment_key, offset)):
+                return self._key_value_repository.set_bits(
+                    segment_key, [offset], True, self.expired_seconds()
+                )
+            case _:
+                return self._key_value_repository.set(
+                    self._key_with_prefix(a_message_id), "True", self.expired_seconds()
+                )
+
+    def check_many(self, a_message_ids: List[str]) -> FutureResult[List[bool], Any]:
+        segments, keyed = self._locate(a_message_ids)
+        lookups: List[FutureResult[List[Tuple[int, bool]], Any]] = [
+            self._key_value_repository.get_bits(
+                segment_key, [offset for _, offset in located]
+            ).map(
+                lambda bits, located=located: list(
+                    zip([idx for idx, _ in located], bits)
+                )
+            )
+            for segment_key, located in segments.items()
+        ]
+        match keyed:
+            case [_, *_]:
+                lookups.append(
+                    self._key_value_repository.get_many(
+                        [self._key_with_prefix(a_message_ids[idx]) for idx in keyed]
+                    ).map(
+                        lambda maybe_results: [
+                            (idx, maybe_result.map(cast_bool_from_str).value_or(False))
+                            for idx, maybe_result in zip(keyed, maybe_results)
+                        ]
+                    )
+                )
+        return Fold.collect(lookups, FutureSuccess(())).map(
+            lambda located_results: [
+                is_handled for _, is_handled in sorted(chain(*located_results))
+            ]
         )
 
+    def mark_many(self, a_message_ids: List[str]) -> FutureResult:
+        segments, keyed = self._locate(a_message_ids)
+        writes: List[FutureResult] = [
+            self._key_value_repository.set_bits(
+                segment_key,
+                [offset for _, offset in located],
+                True,
+                self.expired_seconds(),
+            )
+            for segment_key, located in segments.items()
+        ]
+        match keyed:
+            case [_, *_]:
+                writes.append(
+                    self._key_value_repository.set_many(
+                        {
+                            self._key_with_prefix(a_message_ids[idx]): "True"
+                            for idx in keyed
+                        },
+                        self.expired_seconds(),
+                    )
+                )
+        return Fold.collect(writes, FutureSuccess(()))
+
     def unmark_notif_as_handled(self, a_message_id: str) -> FutureResult:
-        return self._key_value_repository.set(
-            self._key_with_prefix(a_message_id), "False"
-        )
+        match self._segment_of(a_message_id):
+            case Some((segment_key, offset)):
+                return self._key_value_repository.set_bits(segment_key, [offset], False)
+            case _:
+                return self._key_value_repository.set(
+                    self._key_with_prefix(a_message_id), "False", self.expired_seconds()
+                )
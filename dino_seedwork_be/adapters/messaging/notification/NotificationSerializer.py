@@ -1,7 +1,9 @@
 import json
-from typing import Generic, TypeVar
+from base64 import b64encode
+from datetime import date, time
+from typing import Any, Generic, TypeVar
+from uuid import UUID as UUIDRaw
 
-import jsonpickle
 from returns.result import Failure, Result, Success
 
 from dino_seedwork_be.serializer.AbstractSerializer import AbstractSerializer
@@ -13,6 +15,30 @@ NotificationT = TypeVar("NotificationT", bound=Notification)
 __all__ = ["NotificationSerializer"]
 
 
+def _wire_value_of(a_value: Any) -> Any:
+    """
+    Answers what jsonpickle (unpicklable=False) flattens a value json cannot
+    encode into, so the wire format stays the one it used to emit.
+    """
+    match a_value:
+        case date() | time():
+            return a_value.isoformat()
+        case set():
+            return list(a_value)
+        case UUIDRaw():
+            return {"hex": a_value.hex}
+        case bytes():
+            return {"py/b64": b64encode(a_value).decode("ascii")}
+        case _ if getattr(type(a_value), "__getstate__", None) is not getattr(
+            object, "__getstate__", None
+        ):
+            return a_value.__getstate__()
+        case _ if hasattr(a_value, "__dict__"):
+            return vars(a_value)
+        case _:
+            return None
+
+
 class NotificationSerializer(
     AbstractSerializer,
     Generic[NotificationT],
@@ -25,9 +51,7 @@ class NotificationSerializer(
 
     def serialize(self, aNotification: NotificationT) -> Result[str, Exception]:
         try:
-            return Success(
-                "%s" % str(jsonpickle.encode(aNotification, unpicklable=False))
-            )
+            return Success(json.dumps(aNotification.as_dict(), default=_wire_value_of))
         except Exception as error:
             return Failure(error)
 
@@ -1,12 +1,14 @@
 from abc import abstractmethod
 from typing import Any, List
 
-from firebase_admin.messaging import Notification
-from returns.future import FutureResult
-from returns.maybe import Maybe
+from returns.future import FutureResult, FutureSuccess
+from returns.maybe import Maybe, Nothing, Some
 
+from dino_seedwork_be.adapters.messaging.notification.Notification import \
+    Notification
 from dino_seedwork_be.adapters.messaging.notification.PublishedNotificationTracker import \
     PublishedNotificationTracker
+from dino_seedwork_be.domain.DomainEvent import DomainEvent
 
 __all__ = ["PublishedNotificationTrackerStore"]
 
@@ -31,6 +33,26 @@ class PublishedNotificationTrackerStore:
         """
         pass
 
+    def track_most_recent_published_notification_id(
+        self, a_tracker: PublishedNotificationTracker, a_notification_id: Maybe[int]
+    ) -> FutureResult[Maybe[int], Any]:
+        """
+        persisting a_notification_id as the last published one in tracker, by
+        default tracking a notification of that id with
+        track_most_recent_published_notification
+        :param a_tracker: tracker
+        :param a_notification_id: id of the last published notification, if any
+        :return: return the last event int id that published already
+        """
+        match a_notification_id:
+            case Some(int(an_id)):
+                return self.track_most_recent_published_notification(
+                    a_tracker,
+                    [Notification(an_id, DomainEvent(name=a_tracker.type_name()))],
+                )
+            case _:
+                return FutureSuccess(Nothing)
+
     @abstractmethod
     def topic_name() -> str:
         ...
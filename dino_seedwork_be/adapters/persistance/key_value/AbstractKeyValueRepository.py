@@ -1,9 +1,14 @@
 from abc import abstractmethod
-from typing import Any, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-from returns.future import FutureResult
+from returns.future import FutureFailure, FutureResult, FutureSuccess
+from returns.iterables import Fold
 from returns.maybe import Maybe
 
+from dino_seedwork_be.exceptions import MainException
+
+Value = Union[bytes, memoryview, str, int, float]
+
 
 class AbstractKeyValueRepository:
     _prefix: str
@@ -18,7 +23,7 @@ class AbstractKeyValueRepository:
     def set(
         self,
         key: str,
-        value: Union[bytes, memoryview, str, int, float],
+        value: Value,
         expired_seconds: Optional[int] = None,
     ) -> FutureResult:
         pass
@@ -26,3 +31,56 @@ class AbstractKeyValueRepository:
     @abstractmethod
     def get(self, key: str) -> FutureResult[Maybe, Any]:
         pass
+
+    def get_many(self, keys: List[str]) -> FutureResult[List[Maybe], Any]:
+        """
+        Answers the value of each key of keys, in order. Gets them one by one
+        unless overridden with a batched read
+        """
+        return Fold.collect([self.get(key) for key in keys], FutureSuccess(())).map(
+            list
+        )
+
+    def set_many(
+        self,
+        values: Dict[str, Value],
+        expired_seconds: Optional[int] = None,
+    ) -> FutureResult:
+        """
+        Sets the value of each key of values. Sets them one by one unless
+        overridden with a batched write
+        """
+        return Fold.collect(
+            [self.set(key, value, expired_seconds) for key, value in values.items()],
+            FutureSuccess(()),
+        )
+
+    def get_bits(self, key: str, offsets: List[int]) -> FutureResult[List[bool], Any]:
+        """
+        Answers whether each bit of offsets is set in the bitmap of key, in
+        order, the bits of a missing key being unset
+        """
+        return FutureFailure(
+            MainException(
+                code="METHOD_NOT_IMPLEMENTED",
+                message="Bitmaps are not supported by this key value repository",
+            )
+        )
+
+    def set_bits(
+        self,
+        key: str,
+        offsets: List[int],
+        is_set: bool = True,
+        expired_seconds: Optional[int] = None,
+    ) -> FutureResult:
+        """
+        Sets, or clears when not is_set, each bit of offsets in the bitmap of
+        key, which then expires after expired_seconds if given
+        """
+        return FutureFailure(
+            MainException(
+                code="METHOD_NOT_IMPLEMENTED",
+                message="Bitmaps are not supported by this key value repository",
+            )
+        )
@@ -12,6 +12,7 @@ from toolz.dicttoolz import dissoc
 
 from dino_seedwork_be.adapters.persistance.sql.DBSessionUser import (
     DBSessionUser, SessionType)
+from dino_seedwork_be.domain.DomainEventPublisher import DomainEventPublisher
 from dino_seedwork_be.domain.event.EventStore import EventStore
 from dino_seedwork_be.utils.functional import (apply, tap_excute_future,
                                                tap_failure_execute_future)
@@ -127,11 +128,27 @@ class AbstractApplicationServiceLifeCycle(ABC, Generic[SessionType]):
                     0
                 ].get_session_users()
                 correlation_id = cls.get_new_correlation_id()
+
+                def run_in_scope(_) -> FutureResult:
+                    return flow(
+                        cls.begin(correlation_id, db_session_users, args[0]),
+                        managed(
+                            lambda _: target_function(*args, **kwargs),
+                            lambda _, result: cls.exit(correlation_id, result),
+                        ),
+                    )
+
+                # every invocation gets its own DomainEventPublisher, so
+                # concurrent requests on one event loop do not share it
                 return flow(
-                    cls.begin(correlation_id, db_session_users, args[0]),
+                    FutureResult.from_value(None).map(
+                        lambda _: DomainEventPublisher.open_scope()
+                    ),
                     managed(
-                        lambda _: target_function(*args, **kwargs),
-                        lambda _, result: cls.exit(correlation_id, result),
+                        run_in_scope,
+                        lambda token, _: FutureResult.from_value(
+                            DomainEventPublisher.close_scope(token)
+                        ),
                     ),
                 )
 
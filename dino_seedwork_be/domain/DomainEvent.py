@@ -7,7 +7,6 @@ from returns.maybe import Maybe, Some
 from returns.pipeline import flow
 from returns.pointfree import map_
 from returns.result import Result, Success, safe
-from toolz.dicttoolz import get_in
 
 from dino_seedwork_be.logic.assertion_concern import AssertionConcern
 from dino_seedwork_be.serializer.Serializable import JSONSerializable
@@ -128,15 +127,14 @@ class DomainEvent(AssertionConcern, JSONSerializable):
 
     @staticmethod
     def restore(a_dict):
+        occurred_on = a_dict.get("occurred_on")
+        an_id = a_dict.get("id")
         return DomainEvent(
-            version=get_in(["version"], a_dict, 0),
-            occurred_on=Maybe.from_optional(get_in(["occurred_on"], a_dict, None))
-            .map(str)
-            .map(datetime.fromisoformat)
-            .value_or(None),
-            name=str(get_in(["name"], a_dict)),
-            props=dict(get_in(["props"], a_dict, {})),
-            id=Maybe.from_optional(get_in(["id"], a_dict))
-            .map(lambda v: int(v))
-            .value_or(None),
+            version=a_dict.get("version", 0),
+            occurred_on=None
+            if occurred_on is None
+            else datetime.fromisoformat(str(occurred_on)),
+            name=str(a_dict.get("name")),
+            props=dict(a_dict.get("props", {})),
+            id=None if an_id is None else int(an_id),
         )
@@ -1,39 +1,70 @@
+import asyncio
 import json
-from typing import Any, List, Tuple, TypeVar
+from contextlib import contextmanager
+from contextvars import Token
+from typing import (Any, Callable, Dict, Iterator, List, Optional, Tuple,
+                    TypeVar)
 
 from returns.curry import partial
 from returns.future import FutureFailure, FutureResult, FutureSuccess
 from returns.iterables import Fold
 from returns.pipeline import flow, managed
+from returns.result import Failure, Result, Success
+from returns.unsafe import unsafe_perform_io
 
 from dino_seedwork_be.adapters.logger.SimpleLogger import DomainLogger
 from dino_seedwork_be.exceptions import MainException
-from dino_seedwork_be.utils import ThreadLocal
+from dino_seedwork_be.utils import ContextLocal, ThreadLocal
 
 from .DomainEvent import DomainEvent
 from .DomainEventSubscriber import DomainEventSubscriber
 
 EventType = TypeVar("EventType", bound=DomainEvent)
 
+WILDCARD_EVENT_TYPE = "*"
+
 # __all__ = ["DomainEventPublisher"]
 
 
 class DomainEventPublisher:
     ins: ThreadLocal["DomainEventPublisher"]
+    scoped_ins: ContextLocal["DomainEventPublisher"] = ContextLocal(
+        "domain_publisher_scope"
+    )
     _isLock: bool
     _subscribers: List[DomainEventSubscriber]
+    # event type -> subscribers interested in it (wildcard ones included),
+    # kept in subscription order so a publish costs one dict lookup
+    _dispatch_index: Dict[str, List[DomainEventSubscriber]]
+    _wildcard_subscribers: List[DomainEventSubscriber]
+    _is_concurrent: bool = False
+    _concurrency_limit: int = 10
+    _subscriber_timeout: Optional[float] = None
+    # My semaphore, which bounds the subscribers running at once across all
+    # my publishes, bound to the loop it was made in
+    _semaphore: Optional[asyncio.Semaphore] = None
+    _semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
     logger: DomainLogger = DomainLogger("DomainEventPublisher")
 
     def __init__(self) -> None:
         self._subscribers = []
         self._isLock = False
+        self._rebuild_dispatch_index()
 
     @classmethod
     def instance(cls) -> "DomainEventPublisher":
+        """
+        Answers the publisher of the current scope when one is open, the
+        publisher of the current thread otherwise.
+        """
+        try:
+            return DomainEventPublisher.scoped_ins.value()
+        except LookupError:
+            pass
         try:
             return DomainEventPublisher.ins.value()
         except AttributeError as error:
-            cls.logger.info(f"attribute error in publisher {error}")
+            cls.logger.info("attribute error in publisher %s", error)
             DomainEventPublisher.new_instance_for_publisher()
             return DomainEventPublisher.ins.value()
 
@@ -54,49 +85,216 @@ class DomainEventPublisher:
                 return True
 
     def publish(self, an_event: DomainEvent) -> FutureResult[Tuple, Any]:
-        def check_if_target_event(event_type: str, subscriber: DomainEventSubscriber):
-            match subscriber.event_type_subscribed():
-                case list(target_event_types):
-                    return event_type in target_event_types
-                case str(target_event_type):
-                    return target_event_type == event_type or target_event_type == "*"
-                case _:
-                    return False
-
         def execute(is_allow_to_run: bool):
             match is_allow_to_run:
                 case True:
                     self.lock()
-                    return flow(
-                        self._subscribers,
-                        partial(
-                            filter,
-                            partial(check_if_target_event, an_event.type()),
-                        ),
-                        partial(map, lambda sub: sub.handle_event(an_event)),
-                        lambda futureS: Fold.collect(futureS, FutureSuccess(())),
+                    return self._fan_out(
+                        self.subscribers_of(an_event.type()),
+                        lambda sub: sub.handle_event(an_event),
                     )
                 case False:
                     return FutureFailure(MainException(code="EVENT_PUBLISHER_LOCK"))
 
-        self.logger.info(
-            f"Publish domain event {json.dumps(an_event.as_dict())}, {self.is_lock()}, {self.has_subscribers()}",
+        self.logger.info_with_payload(
+            "Publish domain event %s, %s, %s",
+            lambda: json.dumps(an_event.as_dict()),
+            an_event.type(),
+            self.is_lock(),
+            self.has_subscribers(),
         )
         return flow(
             FutureSuccess((not self.is_lock()) and self.has_subscribers()),
             managed(execute, lambda *_: FutureResult.from_value(self.unlock())),
         )
 
+    def _fan_out(
+        self,
+        subscribers: List[DomainEventSubscriber],
+        handle: Callable[[DomainEventSubscriber], FutureResult],
+    ) -> FutureResult[Tuple, Any]:
+        match self.is_concurrent():
+            case True:
+                return FutureResult(self._gather(subscribers, handle))
+            case False:
+                return flow(
+                    subscribers,
+                    partial(map, handle),
+                    lambda futureS: Fold.collect(futureS, FutureSuccess(())),
+                )
+
+    async def _gather(
+        self,
+        subscribers: List[DomainEventSubscriber],
+        handle: Callable[[DomainEventSubscriber], FutureResult],
+    ) -> Result[Tuple, Any]:
+        """
+        Run the order insensitive subscribers side by side, and the order
+        sensitive ones one after another in subscription order as a single
+        lane among them, never more than my concurrency limit at once over
+        all my publishes. Answers their values in subscription order.
+        """
+        semaphore = self._running_loop_semaphore()
+
+        async def run(sub: DomainEventSubscriber) -> Result:
+            async with semaphore:
+                timeout = sub.timeout()
+                if timeout is None:
+                    timeout = self.subscriber_timeout()
+                try:
+                    io_result = await asyncio.wait_for(handle(sub).awaitable(), timeout)
+                    return unsafe_perform_io(io_result)
+                except asyncio.TimeoutError:
+                    return Failure(
+                        MainException(
+                            code="EVENT_SUBSCRIBER_TIMEOUT",
+                            message=f"{type(sub).__name__} timed out after {timeout}s",
+                        )
+                    )
+
+        async def run_in_order(subs: List[DomainEventSubscriber]) -> List[Result]:
+            results: List[Result] = []
+            for sub in subs:
+                result = await run(sub)
+                results.append(result)
+                match result:
+                    case Failure(_):
+                        break
+            return results
+
+        ordered = [sub for sub in subscribers if sub.is_order_sensitive()]
+        unordered = [sub for sub in subscribers if not sub.is_order_sensitive()]
+        ordered_results, *unordered_results = await asyncio.gather(
+            run_in_order(ordered), *map(run, unordered)
+        )
+        results_of_subscribers = {
+            id(sub): result
+            for sub, result in [
+                *zip(ordered, ordered_results),
+                *zip(unordered, unordered_results),
+            ]
+        }
+        values = []
+        for sub in subscribers:
+            match results_of_subscribers.get(id(sub)):
+                case Success(value):
+                    values.append(value)
+                case None:
+                    pass
+                case result:
+                    return result
+        return Success(tuple(values))
+
+    def _running_loop_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        match [self._semaphore, self._semaphore_loop is loop]:
+            case [asyncio.Semaphore() as semaphore, True]:
+                return semaphore
+            case _:
+                self._semaphore = asyncio.Semaphore(self.concurrency_limit())
+                self._semaphore_loop = loop
+                return self._semaphore
+
+    def is_concurrent(self) -> bool:
+        return self._is_concurrent
+
+    def concurrency_limit(self) -> int:
+        return self._concurrency_limit
+
+    def subscriber_timeout(self) -> Optional[float]:
+        return self._subscriber_timeout
+
+    def enable_concurrent_fan_out(
+        self, concurrency_limit: int = 10, subscriber_timeout: Optional[float] = None
+    ):
+        """
+        Hand an event to its subscribers concurrently instead of one after
+        another, so a slow subscriber no longer holds up the others.
+        @param concurrency_limit the max number of subscribers running at once
+        @param subscriber_timeout the default seconds a subscriber may take
+        @raise ValueError when concurrency_limit is less than 1 or
+        subscriber_timeout is negative
+        """
+        if concurrency_limit < 1:
+            raise ValueError(
+                f"The concurrency limit must be at least 1, got {concurrency_limit}"
+            )
+        if subscriber_timeout is not None and subscriber_timeout < 0:
+            raise ValueError(
+                f"The subscriber timeout cannot be negative, got {subscriber_timeout}"
+            )
+        self._is_concurrent = True
+        self._concurrency_limit = concurrency_limit
+        self._subscriber_timeout = subscriber_timeout
+        self._semaphore = None
+
+    def disable_concurrent_fan_out(self):
+        self._is_concurrent = False
+
     def is_processing(self):
         return self.is_lock()
 
     def publish_all(self, events: List[DomainEvent]) -> FutureResult[Tuple, Any]:
+        """
+        Publish events as one batch: I lock once and hand every subscriber
+        the events it is interested in, in their original order, through a
+        single handle_events call.
+        """
+
+        def execute(is_allow_to_run: bool):
+            match is_allow_to_run:
+                case True:
+                    self.lock()
+                    events_of_subscribers = self._events_of_subscribers(events)
+                    return self._fan_out(
+                        [sub for sub, _ in events_of_subscribers.values()],
+                        lambda sub: sub.handle_events(
+                            events_of_subscribers[id(sub)][1]
+                        ),
+                    )
+                case False:
+                    return FutureFailure(MainException(code="EVENT_PUBLISHER_LOCK"))
+
+        match len(events):
+            case 0:
+                return FutureSuccess(())
+        self.logger.info_with_payload(
+            "Publish %s domain events, %s, %s",
+            lambda: json.dumps([event.as_dict() for event in events]),
+            len(events),
+            self.is_lock(),
+            self.has_subscribers(),
+        )
         return flow(
-            events,
-            partial(map, lambda event: self.publish(event)),
-            lambda futureS: Fold.collect(futureS, FutureSuccess(())),
+            FutureSuccess((not self.is_lock()) and self.has_subscribers()),
+            managed(execute, lambda *_: FutureResult.from_value(self.unlock())),
         )
 
+    def _events_of_subscribers(
+        self, events: List[DomainEvent]
+    ) -> Dict[int, Tuple[DomainEventSubscriber, List[DomainEvent]]]:
+        """
+        Answers the events of each subscriber interested in some of events,
+        the subscribers in subscription order as publish hands them an event
+        """
+        subscriber_ids_of_type = {
+            event_type: {id(sub) for sub in self.subscribers_of(event_type)}
+            for event_type in {event.type() for event in events}
+        }
+        events_of_subscribers: Dict[
+            int, Tuple[DomainEventSubscriber, List[DomainEvent]]
+        ] = {}
+        for sub in self._subscribers:
+            sub_events = [
+                event
+                for event in events
+                if id(sub) in subscriber_ids_of_type[event.type()]
+            ]
+            match sub_events:
+                case [_, *_]:
+                    events_of_subscribers[id(sub)] = (sub, sub_events)
+        return events_of_subscribers
+
     def reset(self):
         match self.is_lock():
             case False:
@@ -104,11 +302,70 @@ class DomainEventPublisher:
 
     def set_subscribers(self, subs: List[DomainEventSubscriber]):
         self._subscribers = subs
+        self._rebuild_dispatch_index()
 
     def subscribe(self, sub: DomainEventSubscriber):
         match self.is_lock():
             case False:
                 self._subscribers.append(sub)
+                self._index_subscriber(sub)
+
+    def subscribers_of(self, an_event_type: str) -> List[DomainEventSubscriber]:
+        return self._dispatch_index.get(an_event_type, self._wildcard_subscribers)
+
+    def _rebuild_dispatch_index(self):
+        self._dispatch_index = {}
+        self._wildcard_subscribers = []
+        for sub in self._subscribers:
+            self._index_subscriber(sub)
+
+    def _index_subscriber(self, sub: DomainEventSubscriber):
+        """
+        Add sub to every bucket it listens to. The event types are read once
+        here instead of on every publish; a bucket for a type seen for the
+        first time starts from the wildcard subscribers registered so far.
+        """
+        match sub.event_type_subscribed():
+            case str(event_type) if event_type == WILDCARD_EVENT_TYPE:
+                self._wildcard_subscribers.append(sub)
+                for bucket in self._dispatch_index.values():
+                    bucket.append(sub)
+            case str(event_type):
+                self._bucket_of(event_type).append(sub)
+            case list(event_types):
+                for event_type in dict.fromkeys(event_types):
+                    self._bucket_of(event_type).append(sub)
+
+    def _bucket_of(self, an_event_type: str) -> List[DomainEventSubscriber]:
+        match self._dispatch_index.get(an_event_type):
+            case None:
+                bucket = list(self._wildcard_subscribers)
+                self._dispatch_index[an_event_type] = bucket
+                return bucket
+            case bucket:
+                return bucket
+
+    @staticmethod
+    def open_scope() -> Token["DomainEventPublisher"]:
+        """
+        Give the current context (e.g. the asyncio task serving a request) a
+        publisher of its own, with its own subscribers and lock, until the
+        scope is closed with the answered token.
+        """
+        return DomainEventPublisher.scoped_ins.set_value(DomainEventPublisher())
+
+    @staticmethod
+    def close_scope(a_token: Token["DomainEventPublisher"]):
+        DomainEventPublisher.scoped_ins.reset(a_token)
+
+    @staticmethod
+    @contextmanager
+    def scope() -> Iterator["DomainEventPublisher"]:
+        token = DomainEventPublisher.open_scope()
+        try:
+            yield DomainEventPublisher.instance()
+        finally:
+            DomainEventPublisher.close_scope(token)
 
     @staticmethod
     def new_instance_for_publisher():
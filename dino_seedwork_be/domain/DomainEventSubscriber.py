@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 
-from returns.future import FutureResult
+from returns.curry import partial
+from returns.future import FutureResult, FutureSuccess
+from returns.iterables import Fold
+from returns.pipeline import flow
 
 from dino_seedwork_be.domain import DomainEvent
 
@@ -13,6 +16,33 @@ class DomainEventSubscriber(ABC):
     def handle_event(self, an_event: DomainEvent) -> FutureResult[Any, Exception]:
         ...
 
+    def handle_events(self, events: List[DomainEvent]) -> FutureResult[Any, Exception]:
+        """
+        Handle a batch of events raised together, in their original order.
+        Override me when the events can be handled in one go, by default
+        every event goes through handle_event.
+        """
+        return flow(
+            events,
+            partial(map, self.handle_event),
+            lambda futureS: Fold.collect(futureS, FutureSuccess(())),
+        )
+
     @abstractmethod
     def event_type_subscribed(self) -> List[str] | str:
         ...
+
+    def is_order_sensitive(self) -> bool:
+        """
+        Answers whether I must receive events in subscription order, after
+        the order sensitive subscribers registered before me. Only matters
+        when the publisher fans out concurrently.
+        """
+        return False
+
+    def timeout(self) -> Optional[float]:
+        """
+        Answers the seconds I may take to handle an event when the publisher
+        fans out concurrently, None to fall back to the publisher timeout.
+        """
+        return None
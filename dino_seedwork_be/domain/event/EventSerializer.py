@@ -1,18 +1,39 @@
-import json
-from typing import Optional
+from typing import Dict, Optional
 
 from returns.maybe import Maybe, Some
 from returns.pipeline import pipe
 from returns.result import safe
 
 from dino_seedwork_be.domain.DomainEvent import DomainEvent
+from dino_seedwork_be.exceptions import MainException
 from dino_seedwork_be.serializer.AbstractSerializer import AbstractSerializer
+from dino_seedwork_be.serializer.EventCodec import EventCodec
+from dino_seedwork_be.serializer.JSONEventCodec import JSONEventCodec
+from dino_seedwork_be.serializer.MsgPackEventCodec import MsgPackEventCodec
+from dino_seedwork_be.serializer.OrJSONEventCodec import OrJSONEventCodec
 
 # __all__ = ["EventSerializer"]
 
 
 class EventSerializer(AbstractSerializer):
     ins: Optional["EventSerializer"] = None
+    _codecs: Dict[str, EventCodec]
+    _codec: EventCodec
+    _untagged_codec: EventCodec
+
+    def __init__(self, a_codec: Optional[EventCodec] = None) -> None:
+        """
+        @param a_codec the codec new bodies are encoded with, the stdlib json
+        one by default. Bodies are decoded with the codec of their tag, or the
+        untagged json codec, whatever codec I encode with, so every built-in
+        codec whose library is installed is registered.
+        """
+        self._untagged_codec = JSONEventCodec()
+        self._codecs = {}
+        self.register_codec(self._untagged_codec)
+        for codec_type in [OrJSONEventCodec, MsgPackEventCodec]:
+            safe(codec_type)().map(self.register_codec)
+        self.use_codec(a_codec or self._untagged_codec)
 
     @classmethod
     def instance(cls) -> "EventSerializer":
@@ -27,10 +48,43 @@ class EventSerializer(AbstractSerializer):
         cls.ins = EventSerializer()
         return cls.ins
 
+    def register_codec(self, a_codec: EventCodec):
+        self._codecs[a_codec.name()] = a_codec
+
+    def use_codec(self, a_codec: EventCodec):
+        self.register_codec(a_codec)
+        self._codec = a_codec
+
+    def codec(self) -> EventCodec:
+        return self._codec
+
+    def codec_of(self, a_body: str) -> EventCodec:
+        match a_body.startswith("{"):
+            case True:
+                return self._untagged_codec
+            case False:
+                tag = a_body.partition(":")[0]
+                match self._codecs.get(tag):
+                    case EventCodec() as codec:
+                        return codec
+                    case _:
+                        raise MainException(
+                            code="EVENT_CODEC_NOT_FOUND",
+                            message=f"No event codec registered for {tag}",
+                        )
+
+    def payload_of(self, a_body: str, a_codec: EventCodec) -> str:
+        match a_codec.is_tagged():
+            case True:
+                return a_body[len(a_codec.tag()) :]
+            case False:
+                return a_body
+
     @safe
     def serialize(self, an_event: DomainEvent) -> str:
-        return str(json.dumps(an_event.as_dict(), default=str))
+        return self._codec.encode_body(an_event.as_dict())
 
     @safe
     def deserialize(self, an_json: str) -> DomainEvent:
-        return DomainEvent.restore(json.loads(an_json))
+        codec = self.codec_of(an_json)
+        return DomainEvent.restore(codec.decode(self.payload_of(an_json, codec)))
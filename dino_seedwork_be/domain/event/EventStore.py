@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, AsyncIterator, List
 
-from returns.future import FutureResult
+from returns.curry import partial
+from returns.future import FutureResult, FutureSuccess
+from returns.iterables import Fold
+from returns.pipeline import flow
 
 from dino_seedwork_be.domain.DomainEvent import DomainEvent
+from dino_seedwork_be.domain.event.StoredEvent import StoredEvent
+from dino_seedwork_be.utils.functional import unwrap_future_result
 
 __all__ = ["EventStore"]
 
@@ -15,6 +20,20 @@ class EventStore(ABC):
     ) -> FutureResult[List[DomainEvent], Exception]:
         ...
 
+    async def stream_stored_events_since(
+        self, a_stored_event_id: int, a_page_size: int = 500
+    ) -> AsyncIterator[List[StoredEvent]]:
+        """
+        Answers the stored events after a_stored_event_id, ordered by id, in
+        pages of at most a_page_size events. Override me to read the pages
+        lazily, by default all the events are read at once then sliced.
+        """
+        stored_events = await unwrap_future_result(
+            self.all_stored_events_since(a_stored_event_id)
+        )
+        for start in range(0, len(stored_events), a_page_size):
+            yield stored_events[start : start + a_page_size]
+
     @abstractmethod
     def all_stored_events_between(
         self, a_low_stored_event_id: int, a_high_stored_event_id: int
@@ -27,6 +46,19 @@ class EventStore(ABC):
     ) -> FutureResult[DomainEvent, Exception]:
         ...
 
+    def append_all(
+        self, domain_events: List[DomainEvent]
+    ) -> FutureResult[List[Any], Exception]:
+        """
+        Append domain_events in their order. Override me when the store can
+        write them in one round trip, by default they are appended one by one.
+        """
+        return flow(
+            domain_events,
+            partial(map, self.append),
+            lambda futureS: Fold.collect(futureS, FutureSuccess(())),
+        ).map(list)
+
     @abstractmethod
     def close(self):
         ...
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List
 
 from returns.future import FutureResult
 
@@ -19,5 +19,13 @@ class EventStoreSubscriber(DomainEventSubscriber):
     ) -> FutureResult[DomainEvent, Exception]:
         return self._event_store.append(an_event)
 
+    def handle_events(
+        self, events: List[DomainEvent]
+    ) -> FutureResult[List[Any], Exception]:
+        return self._event_store.append_all(events)
+
     def event_type_subscribed(self) -> List[str] | str:
         return "*"
+
+    def is_order_sensitive(self) -> bool:
+        return True
@@ -40,6 +40,21 @@ class StoredEvent(AssertionConcern):
     ):
         return StoredEvent(body, occurred_on, type_name, id)
 
+    @staticmethod
+    def trusted(
+        body: str, occurred_on: datetime, type_name: str, id: int
+    ) -> "StoredEvent":
+        """
+        Answers a stored event rehydrated from the event store, skipping the
+        assertions already made when it was appended.
+        """
+        stored_event = StoredEvent.__new__(StoredEvent)
+        stored_event._body = body
+        stored_event._id = Some(id)
+        stored_event._occurred_on = occurred_on
+        stored_event._type_name = type_name
+        return stored_event
+
     def set_body(self, an_event_body: str):
         self.assert_argument_not_null(
             an_event_body, a_message=Some("Event body cannot be empty")
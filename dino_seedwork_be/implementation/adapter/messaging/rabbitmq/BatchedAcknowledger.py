@@ -0,0 +1,114 @@
+"""
+I am the acknowledger of the deliveries of a channel, which acknowledges them
+in batches. A delivery tracked is released once it and all the ones delivered
+before it are resolved, and the highest delivery acked among the released ones
+is acknowledged with multiple=True when enough acks are pending or when they
+have been pending long enough. Nacks are sent as soon as they are resolved,
+which is why a released range holding only nacks acknowledges nothing.
+Used from the io loop thread of the connection only.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict
+
+from pika.channel import Channel
+from returns.maybe import Maybe, Nothing, Some
+
+# __all__ = ["BatchedAcknowledger"]
+
+Schedule = Callable[[float, Callable[[], Any]], Any]
+
+
+class BatchedAcknowledger:
+    _channel: Channel
+    _batch_size: int
+    _flush_interval: float
+    _schedule: Schedule
+    _delivered: Deque[int]
+    _resolutions: Dict[int, bool]
+    _ackable_tag: Maybe[int]
+    _pending_ack_count: int
+    _is_flush_scheduled: bool = False
+
+    def __init__(
+        self,
+        a_channel: Channel,
+        a_batch_size: int,
+        a_flush_interval: float,
+        a_schedule: Schedule,
+    ) -> None:
+        """
+        @param a_batch_size the number of pending acks flushed at once
+        @param a_flush_interval the max seconds an ack stays pending
+        @param a_schedule calls a callback after a number of seconds, in the
+        io loop thread, e.g. the call_later of the io loop
+        """
+        self._channel = a_channel
+        self._batch_size = a_batch_size
+        self._flush_interval = a_flush_interval
+        self._schedule = a_schedule
+        self._delivered = deque()
+        self._resolutions = {}
+        self._ackable_tag = Nothing
+        self._pending_ack_count = 0
+
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def pending_ack_count(self) -> int:
+        return self._pending_ack_count
+
+    def unresolved_count(self) -> int:
+        return len(self._delivered)
+
+    def track(self, a_delivery_tag: int):
+        """
+        Tracks a delivery as soon as it arrives, in delivery order
+        """
+        self._delivered.append(a_delivery_tag)
+
+    def ack(self, a_delivery_tag: int):
+        self._resolutions[a_delivery_tag] = True
+        self._release()
+
+    def nack(self, a_delivery_tag: int, is_requeued: bool):
+        self._channel.basic_nack(a_delivery_tag, False, is_requeued)
+        self._resolutions[a_delivery_tag] = False
+        self._release()
+
+    def flush(self):
+        """
+        Acknowledges every pending ack with a single multiple ack, unless my
+        channel is closed as the broker then delivers them again anyway
+        """
+        match [self._ackable_tag, self._channel.is_open]:
+            case [Some(delivery_tag), True]:
+                self._channel.basic_ack(delivery_tag, True)
+        self._ackable_tag = Nothing
+        self._pending_ack_count = 0
+
+    def _release(self):
+        while self._delivered and self._delivered[0] in self._resolutions:
+            delivery_tag = self._delivered.popleft()
+            match self._resolutions.pop(delivery_tag):
+                case True:
+                    self._ackable_tag = Some(delivery_tag)
+                    self._pending_ack_count += 1
+        match [
+            self._pending_ack_count >= self._batch_size,
+            self._pending_ack_count > 0,
+        ]:
+            case [True, _]:
+                self.flush()
+            case [False, True]:
+                self._schedule_flush()
+
+    def _schedule_flush(self):
+        match self._is_flush_scheduled:
+            case False:
+                self._is_flush_scheduled = True
+                self._schedule(self._flush_interval, self._on_flush_due)
+
+    def _on_flush_due(self):
+        self._is_flush_scheduled = False
+        self.flush()
@@ -214,6 +214,19 @@ class BrokerComponent(ABC):
     def _set_is_open(self, is_open: bool):
         self._is_open = is_open
 
+    def is_connection_open(self) -> bool:
+        return self.connection().is_open
+
+    def is_connection_closed(self) -> bool:
+        """
+        Answers whether my connection is closed or closing, after which it
+        cannot be reopened and a new component has to be made
+        """
+        return self.connection().is_closed or self.connection().is_closing
+
+    def is_channel_open(self) -> bool:
+        return self.channel().map(lambda channel: channel.is_open).value_or(False)
+
     def _close_channel(self):
         """Invoke this command to close the channel with RabbitMQ by sending
         the Channel.Close RPC command.
@@ -0,0 +1,169 @@
+"""
+I am a window of messages published in confirm mode and not yet released,
+each one known by the channel number and delivery tag it was published with
+and answering the notification id it carries. Messages are released in
+publish order as soon as the broker acknowledges them, so the highest released
+notification id is the highest one confirmed with all the ones before it.
+"""
+
+import asyncio
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict, Optional, Tuple
+
+from returns.maybe import Maybe, Nothing, Some
+
+from .exceptions import MessageException
+
+# __all__ = ["ConfirmWindow"]
+
+DeliveryKey = Tuple[int, int]
+
+
+class ConfirmWindow:
+    _max_in_flight: int
+    _confirm_timeout: Optional[float]
+    _in_flight: Deque[Tuple[DeliveryKey, int]]
+    _resolutions: Dict[DeliveryKey, bool]
+    _confirmed_id: Maybe[int]
+    _lock: Lock
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _changed: Optional[asyncio.Event] = None
+
+    def __init__(
+        self, a_max_in_flight: int, a_confirm_timeout: Optional[float] = 30
+    ) -> None:
+        """
+        @param a_max_in_flight the max number of messages published and not
+        released yet
+        @param a_confirm_timeout the max seconds waited for the broker to
+        confirm a message, None to wait for ever
+        """
+        self._max_in_flight = a_max_in_flight
+        self._confirm_timeout = a_confirm_timeout
+        self._in_flight = deque()
+        self._resolutions = {}
+        self._confirmed_id = Nothing
+        self._lock = Lock()
+
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    def in_flight_count(self) -> int:
+        return len(self._in_flight)
+
+    def is_full(self) -> bool:
+        return self.in_flight_count() >= self.max_in_flight()
+
+    def is_drained(self) -> bool:
+        return self.in_flight_count() == 0
+
+    def has_nack(self) -> bool:
+        with self._lock:
+            return False in self._resolutions.values()
+
+    def confirmed_id(self) -> Maybe[int]:
+        """
+        Answers the highest notification id confirmed together with all the
+        ones published before it
+        """
+        return self._confirmed_id
+
+    def track(self, a_channel_number: int, a_delivery_tag: int, a_notification_id: int):
+        """
+        Tracks a message, before it is published so that its confirm cannot
+        arrive first
+        """
+        with self._lock:
+            self._in_flight.append(
+                ((a_channel_number, a_delivery_tag), a_notification_id)
+            )
+
+    def resolve(
+        self,
+        a_channel_number: int,
+        a_delivery_tag: int,
+        is_multiple: bool,
+        is_ack: bool,
+    ):
+        """
+        Resolves the message of a_delivery_tag, and all the ones before it on
+        the same channel when is_multiple, as the broker acked or nacked them.
+        Called from the io loop thread of the connection.
+        """
+        with self._lock:
+            for (channel_number, delivery_tag), _ in self._in_flight:
+                match channel_number == a_channel_number and (
+                    delivery_tag == a_delivery_tag
+                    or (is_multiple and delivery_tag < a_delivery_tag)
+                ):
+                    case True:
+                        self._resolutions.setdefault(
+                            (channel_number, delivery_tag), is_ack
+                        )
+            self._release()
+        self._notify_changed()
+
+    def reset(self):
+        """
+        Forgets every message in flight, whose confirms will be ignored, the
+        messages after my confirmed id being published again by the next cycle
+        """
+        with self._lock:
+            self._in_flight.clear()
+            self._resolutions.clear()
+            self._confirmed_id = Nothing
+        self._notify_changed()
+
+    async def wait_for_space(self):
+        """
+        Waits until a message can be published without exceeding my max in
+        flight, failing when a message is nacked as it will never be released
+        """
+        await self._wait_until(lambda: not self.is_full())
+
+    async def wait_until_drained(self):
+        await self._wait_until(self.is_drained)
+
+    async def _wait_until(self, a_condition):
+        self._bind_to_running_loop()
+        try:
+            await asyncio.wait_for(
+                self._wait_for_change_until(a_condition), self._confirm_timeout
+            )
+        except asyncio.TimeoutError:
+            raise MessageException(
+                code="PUBLISH_CONFIRM_TIMEOUT",
+                message=f"No publish confirm after {self._confirm_timeout}s",
+            )
+
+    async def _wait_for_change_until(self, a_condition):
+        while True:
+            self._changed.clear()
+            match [a_condition(), self.has_nack()]:
+                case [True, _]:
+                    return
+                case [False, True]:
+                    raise MessageException(
+                        code="PUBLISH_NACKED", message="A published message was nacked"
+                    )
+            await self._changed.wait()
+
+    def _release(self):
+        while self._in_flight and self._resolutions.get(self._in_flight[0][0]):
+            key, notification_id = self._in_flight.popleft()
+            del self._resolutions[key]
+            self._confirmed_id = Some(notification_id)
+
+    def _bind_to_running_loop(self):
+        loop = asyncio.get_running_loop()
+        match self._loop is loop:
+            case False:
+                self._loop = loop
+                self._changed = asyncio.Event()
+
+    def _notify_changed(self):
+        match [self._loop, self._changed]:
+            case [asyncio.AbstractEventLoop() as loop, asyncio.Event() as changed]:
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(changed.set)
@@ -12,6 +12,10 @@ class ConnectionSettings:
     _username: Optional[str]
     _password: Optional[str]
 
+    # My channelPoolSize, which is the number of channels an exchange
+    # publishes through
+    _channel_pool_size: int
+
     # My virtualHost, which is the name of the RabbitMQ virtual host
     _virtual_host: str
 
@@ -22,8 +26,10 @@ class ConnectionSettings:
         a_virtual_host: str,
         an_username: Optional[str],
         a_password: Optional[str],
+        a_channel_pool_size: int = 1,
     ) -> None:
         self._host_name = a_host_name
+        self._channel_pool_size = a_channel_pool_size
         self._password = a_password
         self._port = a_port
         self._username = an_username
@@ -45,14 +51,25 @@ class ConnectionSettings:
     def virtual_host(self) -> str:
         return self._virtual_host
 
+    def channel_pool_size(self) -> int:
+        return self._channel_pool_size
+
     @staticmethod
-    def factory(a_host_name, a_port, a_virtual_host, an_username, a_password):
+    def factory(
+        a_host_name,
+        a_port,
+        a_virtual_host,
+        an_username,
+        a_password,
+        a_channel_pool_size=1,
+    ):
         return ConnectionSettings(
             a_host_name=a_host_name,
             a_port=a_port,
             a_virtual_host=a_virtual_host,
             an_username=an_username,
             a_password=a_password,
+            a_channel_pool_size=a_channel_pool_size,
         )
 
     def has_user_credentials(self):
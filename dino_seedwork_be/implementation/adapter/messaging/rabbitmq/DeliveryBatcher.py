@@ -0,0 +1,91 @@
+"""
+I am a window of deliveries gathered from the io loop to be handled together.
+I hand my deliveries over once I hold as many as my batch size, or once my
+first one has waited my batch interval, so a quiet queue is not held back.
+Used from the io loop thread of the connection only.
+"""
+
+from typing import Any, Callable, List, NamedTuple
+
+from pika import BasicProperties
+from pika.amqp_object import Method
+from pika.channel import Channel
+
+# __all__ = ["DeliveryBatcher", "Delivery"]
+
+Schedule = Callable[[float, Callable[[], Any]], Any]
+
+
+class Delivery(NamedTuple):
+    channel: Channel
+    method: Method
+    properties: BasicProperties
+    body: bytes
+
+
+class DeliveryBatcher:
+    _batch_size: int
+    _batch_interval: float
+    _schedule: Schedule
+    _on_batch: Callable[[List[Delivery]], Any]
+    _deliveries: List[Delivery]
+    _is_flush_scheduled: bool = False
+
+    def __init__(
+        self,
+        a_batch_size: int,
+        a_batch_interval: float,
+        a_schedule: Schedule,
+        on_batch: Callable[[List[Delivery]], Any],
+    ) -> None:
+        """
+        @param a_batch_size the max number of deliveries handed over at once,
+        no more than the prefetch count of the consumer to ever be reached
+        @param a_batch_interval the max seconds a delivery waits for its batch
+        @param a_schedule calls a callback after a number of seconds, in the
+        io loop thread, e.g. the call_later of the io loop
+        @param on_batch handles the deliveries handed over, in delivery order
+        """
+        self._batch_size = a_batch_size
+        self._batch_interval = a_batch_interval
+        self._schedule = a_schedule
+        self._on_batch = on_batch
+        self._deliveries = []
+
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def pending_count(self) -> int:
+        return len(self._deliveries)
+
+    def add(
+        self,
+        channel: Channel,
+        method: Method,
+        properties: BasicProperties,
+        body: bytes,
+    ):
+        self._deliveries.append(Delivery(channel, method, properties, body))
+        match self.pending_count() >= self._batch_size:
+            case True:
+                self.flush()
+            case False:
+                self._schedule_flush()
+
+    def flush(self):
+        deliveries, self._deliveries = self._deliveries, []
+        match len(deliveries):
+            case 0:
+                pass
+            case _:
+                self._on_batch(deliveries)
+
+    def _schedule_flush(self):
+        match self._is_flush_scheduled:
+            case False:
+                self._is_flush_scheduled = True
+                self._schedule(self._batch_interval, self._on_flush_due)
+
+    def _on_flush_due(self):
+        self._is_flush_scheduled = False
+        self.flush()
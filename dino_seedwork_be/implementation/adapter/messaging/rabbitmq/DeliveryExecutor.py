@@ -0,0 +1,68 @@
+"""
+I am a bounded pool of threads handling the deliveries of a consumer
+concurrently. When serial per key, the deliveries of a same key (e.g. the
+routing key) are handled one after the other in their arrival order, while
+the ones of different keys still run concurrently.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Deque, Dict
+
+from dino_seedwork_be.adapters.logger.SimpleLogger import SIMPLE_LOGGER
+
+# __all__ = ["DeliveryExecutor"]
+
+Task = Callable[[], Any]
+
+
+class DeliveryExecutor:
+    _executor: ThreadPoolExecutor
+    _is_serial_per_key: bool
+    _lanes: Dict[str, Deque[Task]]
+    _lock: Lock
+
+    def __init__(self, a_max_concurrency: int, is_serial_per_key: bool = False):
+        self._executor = ThreadPoolExecutor(
+            max_workers=a_max_concurrency, thread_name_prefix="delivery"
+        )
+        self._is_serial_per_key = is_serial_per_key
+        self._lanes = {}
+        self._lock = Lock()
+
+    def is_serial_per_key(self) -> bool:
+        return self._is_serial_per_key
+
+    def submit(self, a_key: str, a_task: Task):
+        match self.is_serial_per_key():
+            case False:
+                self._executor.submit(self._run, a_task)
+            case True:
+                with self._lock:
+                    lane = self._lanes.get(a_key)
+                    if lane is not None:
+                        lane.append(a_task)
+                        return
+                    self._lanes[a_key] = deque()
+                self._executor.submit(self._run_lane, a_key, a_task)
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
+
+    def _run_lane(self, a_key: str, a_task: Task):
+        task = a_task
+        while True:
+            self._run(task)
+            with self._lock:
+                lane = self._lanes[a_key]
+                if not lane:
+                    del self._lanes[a_key]
+                    return
+                task = lane.popleft()
+
+    def _run(self, a_task: Task):
+        try:
+            a_task()
+        except Exception as error:
+            SIMPLE_LOGGER.error("Delivery handling failed: %s", error)
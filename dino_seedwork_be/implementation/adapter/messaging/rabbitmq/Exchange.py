@@ -1,7 +1,9 @@
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional
+from zlib import crc32
 
+from pika.channel import Channel
 from pika.exchange_type import ExchangeType
-from returns.maybe import Maybe
+from returns.maybe import Maybe, Nothing, Some
 from returns.result import Result, safe
 
 from dino_seedwork_be.adapters.logger.SimpleLogger import SIMPLE_LOGGER
@@ -18,6 +20,10 @@ class Exchange(BrokerComponent):
     _is_exchange_ready: bool = False
     _is_auto_delete: bool = False
 
+    # My pooledChannels, which are the channels I publish through besides my
+    # own one when my connection settings ask for a channel pool
+    _pooled_channels: List[Channel]
+
     def is_exchange(self) -> bool:
         return True
 
@@ -36,6 +42,7 @@ class Exchange(BrokerComponent):
         is_auto_delete: bool = False,
         on_setup_finish: Optional[Callable[..., Result]] = None,
     ) -> None:
+        self._pooled_channels = []
         super().__init__(a_name, a_con_settings, None, on_setup_finish)
         self.set_type(a_type)
         self.set_durable(is_durable)
@@ -127,6 +134,30 @@ class Exchange(BrokerComponent):
             on_setup_finish=on_setup_finish,
         )
 
+    def channels(self) -> List[Channel]:
+        return self.channel().map(lambda channel: [channel]).value_or([]) + list(
+            self._pooled_channels
+        )
+
+    def channel_for(self, a_routing_key: str) -> Maybe[Channel]:
+        """
+        Answers the channel of my pool that messages of a_routing_key are
+        always published through, so they keep their order
+        """
+        channels = self.channels()
+        match len(channels):
+            case 0:
+                return Nothing
+            case number_of_channels:
+                return Some(
+                    channels[crc32(a_routing_key.encode()) % number_of_channels]
+                )
+
+    def is_channel_open(self) -> bool:
+        return super().is_channel_open() and all(
+            channel.is_open for channel in self._pooled_channels
+        )
+
     def type(self) -> ExchangeType:
         return self._type
 
@@ -137,13 +168,16 @@ class Exchange(BrokerComponent):
     def setup(self, callback: Optional[Callable[[Any], Result]] = None):
         SIMPLE_LOGGER.info("setup an exchange %s", self.name())
 
-        def on_exchange_declare_ok(_):
-            SIMPLE_LOGGER.info("delare exchange %s successfully :)", self.name())
+        def on_ready():
             self.set_exchange_ready_status(True)
             Maybe.from_optional(execute(callback, self)).map(
                 lambda result: result.unwrap()
             )
 
+        def on_exchange_declare_ok(_):
+            SIMPLE_LOGGER.info("delare exchange %s successfully :)", self.name())
+            self._open_pooled_channels(on_ready)
+
         self.channel().unwrap().exchange_declare(
             exchange=self.name(),
             exchange_type=self.type(),
@@ -151,3 +185,37 @@ class Exchange(BrokerComponent):
             auto_delete=self._is_auto_delete,
             callback=on_exchange_declare_ok,
         )
+
+    def _open_pooled_channels(self, on_opened: Callable[[], Any]):
+        """
+        Opens the channels my connection settings pool besides my own one,
+        then calls on_opened, so that the pool does not change once I am ready
+        """
+        number_of_channels = self.connection_settings().channel_pool_size() - 1
+        self._pooled_channels = []
+
+        def on_channel_open(channel: Channel):
+            channel.add_on_close_callback(self._on_pooled_channel_closed)
+            self._pooled_channels.append(channel)
+            match len(self._pooled_channels) == number_of_channels:
+                case True:
+                    SIMPLE_LOGGER.info(
+                        "exchange %s publishes through %s channels",
+                        self.name(),
+                        number_of_channels + 1,
+                    )
+                    on_opened()
+
+        match number_of_channels > 0:
+            case True:
+                for _ in range(number_of_channels):
+                    self.connection().channel(on_open_callback=on_channel_open)
+            case False:
+                on_opened()
+
+    def _on_pooled_channel_closed(self, channel: Channel, reason: Exception):
+        SIMPLE_LOGGER.warning("Pooled channel %s was closed: %s", channel, reason)
+        self.set_exchange_ready_status(False)
+        match self.is_connection_open():
+            case True:
+                self.connection().close()
@@ -1,19 +1,21 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from pika.exchange_type import ExchangeType
 from returns.functions import tap
-from returns.future import FutureResult, FutureSuccess
+from returns.future import FutureResult, FutureSuccess, future_safe
 from returns.maybe import Maybe
 from returns.pipeline import flow
 from returns.pointfree import bind, map_
-from returns.result import Result, safe
+from returns.result import Failure, Result, Success, safe
+from returns.unsafe import unsafe_perform_io
 
 from dino_seedwork_be.adapters.logger.SimpleLogger import DomainLogger
 from dino_seedwork_be.adapters.messaging.notification.EventHandlingTracker import \
     EventHandlingTracker
-from dino_seedwork_be.utils.functional import feed_args, tap_excute_future
+from dino_seedwork_be.utils.functional import (feed_args, feed_kwargs,
+                                               tap_excute_future)
 
 from .ConnectionSettings import ConnectionSettings
 from .Exchange import Exchange
@@ -43,6 +45,14 @@ class ExchangeListener(ABC):
     is_auto_acknowledged: bool = False
     is_retry: bool = False
 
+    prefetch_count: int = 1
+    max_concurrency: int = 1
+    is_serial_per_routing_key: bool = False
+    ack_batch_size: int = 1
+    ack_flush_interval: float = 1.0
+    delivery_batch_size: int = 1
+    delivery_batch_interval: float = 0.05
+
     label: str = ""
     logger: DomainLogger
     event_handling_tracker: EventHandlingTracker
@@ -163,6 +173,61 @@ class ExchangeListener(ABC):
             idempotent_handle
         )
 
+    def itempotent_handle_dispatch_many(
+        self, a_messages: List[Tuple[str, str, bytes]]
+    ) -> FutureResult[List[Result], Any]:
+        """
+        " Dispatches the messages not handled yet of a window of messages,
+        " given as (message_id, type, binary_message), looking their ids up
+        " and marking the dispatched ones at once. Answers the result of
+        " each message, in order.
+        """
+        message_ids = [message_id for message_id, _, _ in a_messages]
+        self.logger.info("Handle message_ids %s", message_ids)
+        return self.event_handling_tracker.check_many(message_ids).bind(
+            lambda are_handled: self._dispatch_unhandled(a_messages, are_handled)
+        )
+
+    @future_safe
+    async def _dispatch_unhandled(
+        self, a_messages: List[Tuple[str, str, bytes]], are_handled: List[bool]
+    ) -> List[Result]:
+        results: List[Result] = []
+        dispatched_ids: List[str] = []
+        for (message_id, a_type, a_binary_message), is_handled in zip(
+            a_messages, are_handled
+        ):
+            match is_handled or message_id in dispatched_ids:
+                case True:
+                    results.append(Success(None))
+                case False:
+                    result = unsafe_perform_io(
+                        await self.filtered_dispatch(
+                            a_type, a_binary_message.decode()
+                        ).awaitable()
+                    )
+                    results.append(result)
+                    match result:
+                        case Success(_):
+                            dispatched_ids.append(message_id)
+        match dispatched_ids:
+            case []:
+                return results
+        match unsafe_perform_io(
+            await self.event_handling_tracker.mark_many(dispatched_ids).awaitable()
+        ):
+            case Failure(_) as failure:
+                return [
+                    failure
+                    if message_id in dispatched_ids and not is_handled
+                    else result
+                    for (message_id, _, _), is_handled, result in zip(
+                        a_messages, are_handled, results
+                    )
+                ]
+            case _:
+                return results
+
     def register_consumer(self, queue: Queue) -> Result:
         parent = self
 
@@ -180,6 +245,20 @@ class ExchangeListener(ABC):
                     a_message_id, a_type, a_binary_message
                 )
 
+            def handle_messages(
+                self, a_messages: List[Dict[str, Any]]
+            ) -> FutureResult[List[Result], Any]:
+                return parent.itempotent_handle_dispatch_many(
+                    [
+                        (
+                            message["a_message_id"],
+                            message["a_type"],
+                            message["a_binary_message"],
+                        )
+                        for message in a_messages
+                    ]
+                )
+
         rabbitmq_register_consumer: Callable[
             [MessageConsumer], Result
         ] = lambda msg_consumer: msg_consumer.receive_only(
@@ -187,8 +266,20 @@ class ExchangeListener(ABC):
         )
 
         return flow(
-            [self.is_auto_acknowledged, queue, self.is_retry, self.label],
-            feed_args(MessageConsumer.factory),
+            {
+                "a_queue": queue,
+                "is_auto_acknowledged": self.is_auto_acknowledged,
+                "is_retry": self.is_retry,
+                "label": self.label,
+                "prefetch_count": self.prefetch_count,
+                "max_concurrency": self.max_concurrency,
+                "is_serial_per_routing_key": self.is_serial_per_routing_key,
+                "ack_batch_size": self.ack_batch_size,
+                "ack_flush_interval": self.ack_flush_interval,
+                "delivery_batch_size": self.delivery_batch_size,
+                "delivery_batch_interval": self.delivery_batch_interval,
+            },
+            feed_kwargs(MessageConsumer.tuned_factory),
             map_(tap(self.set_message_consumer)),
             bind(rabbitmq_register_consumer),
         )
@@ -1,5 +1,6 @@
+import asyncio
 import traceback
-from typing import Any, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from multimethod import multimethod
 from pika import BasicProperties
@@ -8,6 +9,7 @@ from pika.channel import Channel
 from returns.curry import partial
 from returns.functions import tap
 from returns.future import FutureResult, FutureSuccess
+from returns.maybe import Maybe, Some
 from returns.pipeline import flow
 from returns.pointfree import alt, bind
 from returns.result import Failure, Result, Success, safe
@@ -15,10 +17,12 @@ from returns.result import Failure, Result, Success, safe
 from dino_seedwork_be.adapters.logger.SimpleLogger import DomainLogger
 from dino_seedwork_be.exceptions import MainException
 from dino_seedwork_be.utils.functional import (apply, async_execute,
-                                               feed_kwargs,
-                                               print_result_with_text,
-                                               return_v, tap_excute_future)
+                                               feed_kwargs, return_v,
+                                               tap_excute_future)
 
+from .BatchedAcknowledger import BatchedAcknowledger
+from .DeliveryBatcher import Delivery, DeliveryBatcher
+from .DeliveryExecutor import DeliveryExecutor
 from .exceptions import MessageException
 from .MessageListener import MessageListener
 from .Queue import Queue
@@ -43,6 +47,23 @@ class MessageConsumer:
 
     _prefetch_count: int = 1
 
+    # My deliveryExecutor, which handles my deliveries concurrently when my
+    # max concurrency is more than one, otherwise they are handled one by one
+    # in the io loop
+    _delivery_executor: Optional[DeliveryExecutor] = None
+
+    _delivery_batch_size: int = 1
+
+    _delivery_batch_interval: float = 0.05
+
+    _ack_batch_size: int = 1
+
+    _ack_flush_interval: float = 1.0
+
+    # My acknowledger, which acknowledges my deliveries in batches when my
+    # ack batch size is more than one, otherwise each one is acked alone
+    _acknowledger: Optional[BatchedAcknowledger] = None
+
     # My queue, which is where my messages come from.
     _queue: Queue
 
@@ -59,14 +80,72 @@ class MessageConsumer:
         is_auto_acknowledged: bool,
         is_retry: bool = False,
         label: str = "",
+        prefetch_count: int = 1,
+        max_concurrency: int = 1,
+        is_serial_per_routing_key: bool = False,
+        ack_batch_size: int = 1,
+        ack_flush_interval: float = 1.0,
+        delivery_batch_size: int = 1,
+        delivery_batch_interval: float = 0.05,
     ) -> None:
+        """
+        @param prefetch_count the max number of deliveries not acknowledged yet
+        @param max_concurrency the max number of deliveries handled at once,
+        acknowledged as each one is handled, whatever their order
+        @param is_serial_per_routing_key whether the deliveries of a routing
+        key are still handled one after the other, in order, when handled
+        concurrently
+        @param ack_batch_size the number of acks sent at once with a single
+        multiple ack, nacks being always sent at once, no more than
+        prefetch_count since no more deliveries are ever pending
+        @param ack_flush_interval the max seconds an ack waits for its batch
+        @param delivery_batch_size the max number of deliveries handed at once
+        to the handle_messages() of my listener, each one being handled alone
+        by its handle_message() when 1, no more than prefetch_count
+        @param delivery_batch_interval the max seconds a delivery waits for
+        its batch
+        """
         super().__init__()
         self.set_queue(a_queue)
         self.set_auto_acknowledged(is_auto_acknowledged)
         self.set_message_types(set([]))
         self._is_retry = is_retry
         self._label = label
+        self._prefetch_count = prefetch_count
+        self._ack_flush_interval = ack_flush_interval
+        self._delivery_batch_interval = delivery_batch_interval
+        match max_concurrency > 1:
+            case True:
+                self._delivery_executor = DeliveryExecutor(
+                    max_concurrency, is_serial_per_routing_key
+                )
         self.domain_logger = DomainLogger(self.label())
+        self._ack_batch_size = self._within_prefetch_window(
+            ack_batch_size, "ack_batch_size"
+        )
+        self._delivery_batch_size = self._within_prefetch_window(
+            delivery_batch_size, "delivery_batch_size"
+        )
+
+    def _within_prefetch_window(self, a_batch_size: int, a_name: str) -> int:
+        """
+        Answers a_batch_size clamped to my prefetch count, a batch larger than
+        the deliveries the broker leaves pending never filling up. A prefetch
+        count of 0 leaves them unlimited.
+        """
+        match [self._prefetch_count, a_batch_size]:
+            case [int(prefetch_count), int(batch_size)] if (
+                0 < prefetch_count < batch_size
+            ):
+                self.domain_logger.warning(
+                    "%s %s clamped to the prefetch count %s",
+                    a_name,
+                    batch_size,
+                    prefetch_count,
+                )
+                return prefetch_count
+            case _:
+                return a_batch_size
 
     @multimethod
     @staticmethod
@@ -102,6 +181,21 @@ class MessageConsumer:
             )
         )
 
+    @staticmethod
+    def tuned_factory(
+        a_queue: Queue, is_auto_acknowledged: bool, **options: Any
+    ) -> Result["MessageConsumer", Any]:
+        """
+        Answers a consumer of a_queue built with the keyword options of my
+        constructor, e.g. its prefetch count and batch sizes, once its
+        prefetch count is applied
+        """
+        return Success(MessageConsumer(a_queue, is_auto_acknowledged, **options)).bind(
+            lambda consumer: consumer.equalize_message_distribution().map(
+                return_v(consumer)
+            )
+        )
+
     def is_auto_acknowledged(self) -> bool:
         return self._auto_acknowledged
 
@@ -147,6 +241,24 @@ class MessageConsumer:
     def is_closed(self):
         return self._closed
 
+    def prefetch_count(self) -> int:
+        return self._prefetch_count
+
+    def is_concurrent(self) -> bool:
+        return self._delivery_executor is not None
+
+    def ack_batch_size(self) -> int:
+        return self._ack_batch_size
+
+    def delivery_batch_size(self) -> int:
+        return self._delivery_batch_size
+
+    def is_ack_batched(self) -> bool:
+        return not self.is_auto_acknowledged() and self._ack_batch_size > 1
+
+    def acknowledger(self) -> Maybe[BatchedAcknowledger]:
+        return Maybe.from_optional(self._acknowledger)
+
     def equalize_message_distribution(self) -> Result[None, MessageException]:
         """
         Ensure an equalization of message distribution
@@ -161,7 +273,7 @@ class MessageConsumer:
             return Failure(MessageException(code="MESSAGE_EQUALIZE_DIS_FAILED"))
 
     def on_basic_qos_ok(self, _):
-        self.domain_logger.info(f"QOS set to: {self._prefetch_count}")
+        self.domain_logger.info("QOS set to: %s", self._prefetch_count)
         self.set_is_ready(True)
 
     def receive_all(self, a_message_listener: MessageListener) -> Result:
@@ -194,9 +306,17 @@ class MessageConsumer:
             try:
                 match self.is_auto_acknowledged():
                     case False:
-                        channel.basic_ack(delivery_tag, False)
+                        self._on_io_loop(
+                            self.acknowledger()
+                            .map(
+                                lambda acknowledger: partial(
+                                    acknowledger.ack, delivery_tag
+                                )
+                            )
+                            .value_or(lambda: channel.basic_ack(delivery_tag, False))
+                        )
                         self.domain_logger.info(
-                            f"ACK handle message success {self.message_types()}",
+                            "ACK handle message success %s", self.message_types()
                         )
                 return FutureSuccess(None)
             except Exception as error:
@@ -208,16 +328,28 @@ class MessageConsumer:
                 match self.is_auto_acknowledged():
                     case False:
                         self.domain_logger.info(
-                            f"NonACK handle message failed, would retry ? {is_retry}"
+                            "NonACK handle message failed, would retry ? %s", is_retry
+                        )
+                        self._on_io_loop(
+                            self.acknowledger()
+                            .map(
+                                lambda acknowledger: partial(
+                                    acknowledger.nack, delivery_tag, is_retry
+                                )
+                            )
+                            .value_or(
+                                lambda: channel.basic_nack(
+                                    delivery_tag, False, is_retry
+                                )
+                            )
                         )
-                        channel.basic_nack(delivery_tag, False, is_retry)
             except Exception as error:
                 raise error
 
         def handle_delivery_exception(
             channel: Channel, delivery_tag: int, is_retry: bool, exception: Exception
         ):
-            self.domain_logger.info(f"Exception on handle delivery {exception}")
+            self.domain_logger.info("Exception on handle delivery %s", exception)
             traceback.print_exc()
             match exception:
                 case MessageException():
@@ -227,28 +359,39 @@ class MessageConsumer:
             # do not shutdown
             # raise exception
 
+        def message_of(
+            method: Method, properties: BasicProperties, body: bytes
+        ) -> Dict[str, Any]:
+            return {
+                "a_type": properties.type,
+                "a_message_id": properties.message_id,
+                "a_time_stamp": properties.timestamp,
+                "a_binary_message": body,
+                "a_delivery_tag": getattr(method, "delivery_tag", 0),
+                "is_redelivery": getattr(method, "delivered", False),
+            }
+
         def handle_delivery(
             channel: Channel, method: Method, properties: BasicProperties, body: bytes
         ) -> FutureResult:
             match self.is_target_message_type(properties.type):
                 case True:
-                    self.domain_logger.info(f"Handle delivery {properties.type}")
+                    self.domain_logger.info("Handle delivery %s", properties.type)
                     return flow(
-                        {
-                            "a_type": properties.type,
-                            "a_message_id": properties.message_id,
-                            "a_time_stamp": properties.timestamp,
-                            "a_binary_message": body,
-                            "a_delivery_tag": getattr(method, "delivery_tag", 0),
-                            "is_redelivery": getattr(method, "delivered", False),
-                        },
+                        message_of(method, properties, body),
                         feed_kwargs(a_message_listener.handle_message),
                         bind(
                             tap_excute_future(
                                 apply(ack, channel, getattr(method, "delivery_tag", 0))
                             )
                         ),
-                        alt(tap(print_result_with_text("error here"))),
+                        alt(
+                            tap(
+                                lambda error: self.domain_logger.info(
+                                    "Handle delivery failed %s", error
+                                )
+                            )
+                        ),
                         alt(
                             tap(
                                 partial(
@@ -265,11 +408,70 @@ class MessageConsumer:
                         return_v(FutureSuccess("NOT_TARGET_MESSAGE"))
                     )
 
+        def resolve_delivery(a_delivery: Delivery, a_result: Result):
+            delivery_tag = getattr(a_delivery.method, "delivery_tag", 0)
+            match a_result:
+                case Success(_):
+                    ack(a_delivery.channel, delivery_tag)
+                case Failure(error):
+                    self.domain_logger.info("Handle delivery failed %s", error)
+                    handle_delivery_exception(
+                        a_delivery.channel, delivery_tag, self.is_retry(), error
+                    )
+
+        def handle_deliveries(deliveries: List[Delivery]) -> FutureResult:
+            targets = [
+                delivery
+                for delivery in deliveries
+                if self.is_target_message_type(delivery.properties.type)
+            ]
+            for delivery in deliveries:
+                match delivery in targets:
+                    case False:
+                        ack(
+                            delivery.channel,
+                            getattr(delivery.method, "delivery_tag", 0),
+                        )
+            self.domain_logger.info("Handle %s deliveries", len(targets))
+            return (
+                a_message_listener.handle_messages(
+                    [
+                        message_of(delivery.method, delivery.properties, delivery.body)
+                        for delivery in targets
+                    ]
+                )
+                .map(
+                    lambda results: [
+                        resolve_delivery(delivery, result)
+                        for delivery, result in zip(targets, results)
+                    ]
+                )
+                .alt(
+                    tap(
+                        lambda error: [
+                            resolve_delivery(delivery, Failure(error))
+                            for delivery in targets
+                        ]
+                    )
+                )
+            )
+
+        match self.is_ack_batched():
+            case True:
+                self._acknowledger = BatchedAcknowledger(
+                    channel,
+                    self._ack_batch_size,
+                    self._ack_flush_interval,
+                    queue.connection().ioloop.call_later,
+                )
+
         try:
             tag = channel.basic_consume(
                 queue.name(),
                 auto_ack=self.is_auto_acknowledged(),
-                on_message_callback=async_execute(handle_delivery),
+                on_message_callback=self._tracking_deliveries(
+                    self._delivery_callback_of(handle_delivery, handle_deliveries)
+                ),
             )
             channel.add_on_cancel_callback(self.on_consumer_cancelled)
             self.domain_logger.info("Register message listener success")
@@ -279,13 +481,111 @@ class MessageConsumer:
         except Exception:
             return Failure(MainException(code="INITIATE_CONSUMER_FAILED"))
 
+    def _delivery_callback_of(
+        self,
+        a_handle_delivery: Callable[..., FutureResult],
+        a_handle_deliveries: Callable[[List[Delivery]], FutureResult],
+    ) -> Callable[..., Any]:
+        """
+        Answers the callback of my deliveries, which handles them in the io
+        loop or hands them to my delivery executor, keyed by routing key, or
+        gathers them in batches first when my delivery batch size is more
+        than one
+        """
+        match self._delivery_batch_size > 1:
+            case True:
+                return DeliveryBatcher(
+                    self._delivery_batch_size,
+                    self._delivery_batch_interval,
+                    self.queue().connection().ioloop.call_later,
+                    self._batch_callback_of(a_handle_deliveries),
+                ).add
+        match self._delivery_executor:
+            case None:
+                return async_execute(a_handle_delivery)
+            case DeliveryExecutor() as delivery_executor:
+
+                def submit_delivery(channel, method, properties, body):
+                    delivery_executor.submit(
+                        getattr(method, "routing_key", ""),
+                        lambda: asyncio.run(
+                            a_handle_delivery(
+                                channel, method, properties, body
+                            ).awaitable()
+                        ),
+                    )
+
+                return submit_delivery
+
+    def _batch_callback_of(
+        self, a_handle_deliveries: Callable[[List[Delivery]], FutureResult]
+    ) -> Callable[[List[Delivery]], Any]:
+        """
+        Answers the callback of my batches of deliveries, which handles them
+        in the io loop or hands them to my delivery executor, split by
+        routing key when the deliveries of a routing key are serial
+        """
+        match self._delivery_executor:
+            case None:
+                return async_execute(a_handle_deliveries)
+            case DeliveryExecutor() as delivery_executor:
+
+                def submit_batch(deliveries: List[Delivery]):
+                    batches: Dict[str, List[Delivery]] = {}
+                    for delivery in deliveries:
+                        batches.setdefault(
+                            getattr(delivery.method, "routing_key", "")
+                            if delivery_executor.is_serial_per_key()
+                            else "",
+                            [],
+                        ).append(delivery)
+                    for routing_key, batch in batches.items():
+                        delivery_executor.submit(
+                            routing_key,
+                            lambda batch=batch: asyncio.run(
+                                a_handle_deliveries(batch).awaitable()
+                            ),
+                        )
+
+                return submit_batch
+
+    def _tracking_deliveries(
+        self, a_delivery_callback: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """
+        Answers a_delivery_callback, tracking each delivery first in the io
+        loop when my acks are batched, so that they are acked in order
+        """
+        match self.acknowledger():
+            case Some(acknowledger):
+
+                def track_delivery(channel, method, properties, body):
+                    acknowledger.track(getattr(method, "delivery_tag", 0))
+                    return a_delivery_callback(channel, method, properties, body)
+
+                return track_delivery
+            case _:
+                return a_delivery_callback
+
+    def _on_io_loop(self, a_callback: Callable[[], Any]):
+        """
+        Calls a_callback, from the io loop thread of my connection when my
+        deliveries are handled in other threads, since pika channels are not
+        thread safe
+        """
+        match self.is_concurrent():
+            case True:
+                self.queue().connection().ioloop.add_callback_threadsafe(a_callback)
+            case False:
+                a_callback()
+
     def on_consumer_cancelled(self, method_frame):
         """Invoked by pika when RabbitMQ sends a Basic.Cancel for a consumer
         receiving messages.
         :param pika.frame.Method method_frame: The Basic.Cancel frame
         """
         self.domain_logger.info(
-            f"Consumer was cancelled remotely, shutting down: {method_frame}"
+            "Consumer was cancelled remotely, shutting down: %s", method_frame
         )
         self.close_channel()
 
@@ -313,6 +613,12 @@ class MessageConsumer:
         the IOLoop will be buffered but not processed.
         """
         self._closed = True
+        self.acknowledger().map(
+            lambda acknowledger: self._on_io_loop(acknowledger.flush)
+        )
+        Maybe.from_optional(self._delivery_executor).map(
+            lambda delivery_executor: delivery_executor.shutdown(wait=False)
+        )
         match self.is_consuming():
             case True:
                 self._stop_consuming()
@@ -1,8 +1,11 @@
 from abc import abstractmethod
 from datetime import datetime
+from typing import Any, Dict, List
 
 from multimethod import multimethod
-from returns.future import FutureFailure, FutureResult
+from returns.future import FutureFailure, FutureResult, future_safe
+from returns.result import Result
+from returns.unsafe import unsafe_perform_io
 
 from dino_seedwork_be.exceptions import MainException
 
@@ -108,3 +111,19 @@ class MessageListener:
                 message="Handle message method must be implemented",
             )
         )
+
+    @future_safe
+    async def handle_messages(self, a_messages: List[Dict[str, Any]]) -> List[Result]:
+        """
+        * Handles a window of messages received together, answering the
+        * result of each one in order, which is acked or nack'd as if it
+        * were handled by handle_message(). By default each message is
+        * handled in turn by handle_message(); may be overridden to handle
+        * them as a whole, e.g. to look their ids up at once.
+        * @param a_messages the keyword arguments of handle_message() of
+        * each message, in delivery order
+        """
+        return [
+            unsafe_perform_io(await self.handle_message(**message).awaitable())
+            for message in a_messages
+        ]
@@ -4,16 +4,21 @@ A BrokerChannel may be either an Exchange or a Queue
 """
 
 
-from typing import Union
+from typing import Dict, Optional, Union
 
 from multimethod import multimethod
 from pika import BasicProperties, DeliveryMode
+from pika.channel import Channel
+from pika.frame import Method
+from pika.spec import Basic
+from returns.future import future_safe
 from returns.maybe import Maybe, Nothing, Some
 from returns.result import Failure, Result, Success, safe
 
 from dino_seedwork_be.adapters.logger.SimpleLogger import SIMPLE_LOGGER
 from dino_seedwork_be.logic.assertion_concern import AssertionConcern
 
+from .ConfirmWindow import ConfirmWindow
 from .exceptions import MessageException
 from .Exchange import Exchange
 from .MessageParameters import MessageParameters
@@ -23,10 +28,15 @@ from .MessageParameters import MessageParameters
 
 class MessageProducer(AssertionConcern):
     _exchange: Exchange
+    _confirm_window: Optional[ConfirmWindow] = None
+    _confirming_channels: Dict[int, Channel]
+    _delivery_tags: Dict[int, int]
 
     def __init__(self, an_exchange: Exchange) -> None:
         super().__init__()
         self._exchange = an_exchange
+        self._confirming_channels = {}
+        self._delivery_tags = {}
 
     @staticmethod
     def factory(an_exchange: Exchange) -> "MessageProducer":
@@ -35,9 +45,81 @@ class MessageProducer(AssertionConcern):
     def is_ready_for_publish(self) -> bool:
         return self.exchange().is_exchange_ready()
 
+    def is_healthy(self) -> bool:
+        """
+        Answers whether I can publish right now: my exchange is declared and
+        both its connection and channel are still open
+        """
+        return (
+            self.is_ready_for_publish()
+            and self.exchange().is_connection_open()
+            and self.exchange().is_channel_open()
+        )
+
+    def is_closed(self) -> bool:
+        return self.exchange().is_connection_closed()
+
     def exchange(self) -> Exchange:
         return self._exchange
 
+    def enable_confirm_delivery(
+        self, a_max_in_flight: int, a_confirm_timeout: Optional[float] = 30
+    ):
+        """
+        Publishes my confirmed messages in publisher confirm mode, with at
+        most a_max_in_flight of them not confirmed yet.
+        """
+        self._confirm_window = ConfirmWindow(a_max_in_flight, a_confirm_timeout)
+
+    def confirm_window(self) -> Maybe[ConfirmWindow]:
+        return Maybe.from_optional(self._confirm_window)
+
+    @future_safe
+    async def send_confirmed(
+        self,
+        a_message_parameters: MessageParameters,
+        a_message: Union[str, bytes],
+        a_routing_key: str,
+        a_confirm_id: int,
+    ) -> None:
+        """
+        Sends a_message like send, once my confirm window has room for it,
+        tracking it in the window as a_confirm_id until the broker confirms it.
+        """
+        window = self.confirm_window().unwrap()
+        await window.wait_for_space()
+        self._check(a_message_parameters).unwrap()
+        channel = self._confirming_channel_of(
+            self.exchange().channel_for(a_routing_key).unwrap()
+        )
+        delivery_tag = self._delivery_tags[channel.channel_number] + 1
+        self._delivery_tags[channel.channel_number] = delivery_tag
+        window.track(channel.channel_number, delivery_tag, a_confirm_id)
+        channel.basic_publish(
+            self.exchange().exchange_name().value_or(""),
+            a_routing_key,
+            properties=a_message_parameters.properties(),
+            body=a_message,
+        )
+
+    def _confirming_channel_of(self, a_channel: Channel) -> Channel:
+        match self._confirming_channels.get(a_channel.channel_number) is a_channel:
+            case False:
+                a_channel.confirm_delivery(self._on_delivery_confirmation)
+                self._confirming_channels[a_channel.channel_number] = a_channel
+                self._delivery_tags[a_channel.channel_number] = 0
+        return a_channel
+
+    def _on_delivery_confirmation(self, a_method_frame: Method):
+        self.confirm_window().map(
+            lambda window: window.resolve(
+                a_method_frame.channel_number,
+                a_method_frame.method.delivery_tag,
+                a_method_frame.method.multiple,
+                isinstance(a_method_frame.method, Basic.Ack),
+            )
+        )
+
     @multimethod
     def send(self, a_message: Union[str, bytes], a_routing_key: str = "") -> Result:
         """
@@ -49,7 +131,7 @@ class MessageProducer(AssertionConcern):
         @return MessageProducer
         """
         try:
-            self.exchange().channel().unwrap().basic_publish(
+            self.exchange().channel_for(a_routing_key).unwrap().basic_publish(
                 self.exchange().exchange_name().value_or(""),
                 a_routing_key,
                 properties=self.text_durability().value_or(None),
@@ -85,7 +167,7 @@ class MessageProducer(AssertionConcern):
         return self._check(a_message_parameters).bind(
             safe(
                 lambda _: self.exchange()
-                .channel()
+                .channel_for(a_routing_key)
                 .unwrap()
                 .basic_publish(
                     self.exchange().exchange_name().value_or(""),
@@ -120,7 +202,7 @@ class MessageProducer(AssertionConcern):
         return self._check(a_message_parameters).bind(
             safe(
                 lambda _: self.exchange()
-                .channel()
+                .channel_for(a_routing_key)
                 .unwrap()
                 .basic_publish(
                     an_exchange,
@@ -1,30 +1,36 @@
-from typing import Any, List, Optional
+from datetime import datetime
+from threading import Lock
+from time import sleep
+from typing import Any, Callable, List, Optional
 
 from pika.exchange_type import ExchangeType
 from returns.curry import partial
 from returns.functions import tap
-from returns.future import FutureFailure, FutureResult, FutureSuccess
+from returns.future import (FutureFailure, FutureResult, FutureSuccess,
+                            future_safe)
+from returns.io import IOFailure
 from returns.iterables import Fold
-from returns.maybe import Maybe
-from returns.pipeline import flow, managed, pipe
+from returns.maybe import Maybe, Nothing, Some
+from returns.pipeline import flow, pipe
 from returns.pointfree import bind, map_
-from returns.result import Result, Success
+from returns.result import Failure, Result, Success
 
+from dino_seedwork_be.adapters.logger.SimpleLogger import DomainLogger
 from dino_seedwork_be.adapters.messaging.notification import (
     Notification, NotificationPublisher, NotificationSerializer,
-    PublishedNotificationTrackerStore)
+    PublishedNotificationTracker, PublishedNotificationTrackerStore)
 from dino_seedwork_be.adapters.persistance.sql.DBSessionUser import \
     SuperDBSessionUser
 from dino_seedwork_be.domain.event.EventSerializer import EventSerializer
 from dino_seedwork_be.domain.event.EventStore import EventStore
 from dino_seedwork_be.domain.event.StoredEvent import StoredEvent
 from dino_seedwork_be.exceptions import MainException
-from dino_seedwork_be.utils import (feed_args, feed_kwargs,
-                                    print_result_with_text)
-from dino_seedwork_be.utils.functional import return_v
+from dino_seedwork_be.utils import feed_args, feed_kwargs
+from dino_seedwork_be.utils.functional import return_v, unwrap_future_result
 
-from . import (RabbitMQConnectionSettings, RabbitMQExchange,
-               RabbitMQMessageParameters, RabbitMQMessageProducer)
+from . import (RabbitMQConfirmWindow, RabbitMQConnectionSettings,
+               RabbitMQExchange, RabbitMQMessageParameters,
+               RabbitMQMessageProducer)
 
 # __all__ = ["RabbitMQPublisher"]
 
@@ -34,9 +40,19 @@ class RabbitMQPublisher(NotificationPublisher, SuperDBSessionUser):
     _exchange_name: str
     _exchange_type: ExchangeType
     _published_notif_tracker_store: PublishedNotificationTrackerStore
+    # My producer, only ever built by run() whose thread runs its io loop
     _message_producer_ins: Optional[RabbitMQMessageProducer] = None
+    _message_producer_lock: Lock
     _event_serializer: EventSerializer
     _connection_settings: RabbitMQConnectionSettings
+    _page_size: int
+    _is_pass_through: bool
+    _is_closed: bool = False
+    _confirm_window_size: Optional[int]
+    _confirm_timeout: Optional[float]
+    _reconnect_delay: float
+    _max_reconnect_delay: float
+    logger: DomainLogger = DomainLogger("RabbitMQPublisher")
 
     def __init__(
         self,
@@ -46,66 +62,73 @@ class RabbitMQPublisher(NotificationPublisher, SuperDBSessionUser):
         published_notif_tracker_store: PublishedNotificationTrackerStore,
         event_serializer: EventSerializer,
         connection_settings: RabbitMQConnectionSettings,
+        page_size: int = 500,
+        is_pass_through: bool = False,
+        confirm_window_size: Optional[int] = None,
+        confirm_timeout: Optional[float] = 30,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30,
     ) -> None:
+        """
+        @param page_size the max number of stored events read and published
+        before the tracker is checkpointed
+        @param is_pass_through whether notifications are framed around the
+        stored event bodies as they are, instead of being restored then
+        serialized again. Bodies whose codec is not JSON still are.
+        @param confirm_window_size the max number of notifications published
+        and not confirmed yet, when notifications are published in publisher
+        confirm mode, the tracker then only advances to the highest
+        notification confirmed with all the ones before it
+        @param confirm_timeout the max seconds waited for a confirm
+        @param reconnect_delay the seconds waited before building my producer
+        again once it could not be, doubled on every failure in a row
+        @param max_reconnect_delay the max seconds waited between two attempts
+        """
         # session = session_factory()
         self.set_exchange_name(exchange_name)
         self.set_event_store(event_store)
         # self._event_store.set_session(session)
         self._connection_settings = connection_settings
+        self._confirm_window_size = confirm_window_size
+        self._confirm_timeout = confirm_timeout
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
 
-        def init_message_producer():
-            self._exchange_type = exchange_type
-            self._message_producer()
-
-        init_message_producer()
+        self._exchange_type = exchange_type
+        self._message_producer_lock = Lock()
         self.set_published_notif_tracker_store(published_notif_tracker_store)
         # self._published_notif_tracker_store.set_session(session)
         self.set_session_users(
             [self.event_store(), self.published_notif_tracker_store()]
         )
         self._event_serializer = event_serializer
+        self._page_size = page_size
+        self._is_pass_through = is_pass_through
         super().__init__()
 
     def event_serializer(self):
         return self._event_serializer
 
+    def page_size(self) -> int:
+        return self._page_size
+
+    def is_pass_through(self) -> bool:
+        return self._is_pass_through
+
+    def confirm_window_size(self) -> Maybe[int]:
+        return Maybe.from_optional(self._confirm_window_size)
+
     def publish_notifications(self) -> FutureResult[Maybe[int], Any]:
         """
-        publish unpublished event in event store
+        publish unpublished event in event store, page by page, tracking the
+        last published one after every page, through my long lived producer
         :return: return the last event int id that published already
         """
 
-        def notifications_from(
-            events: List[StoredEvent],
-        ) -> Result[List[Notification], Any]:
-            return flow(
-                events,
-                partial(
-                    map,
-                    lambda stored_event: flow(
-                        None,
-                        lambda _: self.event_serializer().deserialize(
-                            stored_event.body()
-                        ),
-                        map_(
-                            lambda domain_event: list(
-                                [
-                                    stored_event.id().value_or(None),
-                                    domain_event,
-                                ]
-                            )
-                        ),
-                        bind(feed_args(Notification.factory)),
-                    ),
-                ),
-                list,
-                lambda results: Fold.collect(results, Success(())),
-            )
-
         def publish_future(
             msg_producer: RabbitMQMessageProducer,
         ) -> FutureResult[Maybe[int], Any]:
-            match msg_producer.is_ready_for_publish():
+            match msg_producer.is_healthy():
                 case False:
                     return FutureFailure(
                         MainException("RabbitMQMessageProducer not ready yet")
@@ -114,80 +137,291 @@ class RabbitMQPublisher(NotificationPublisher, SuperDBSessionUser):
                     return (
                         self.published_notif_tracker_store()
                         .published_notification_tracker()
-                        .bind(
-                            lambda tracker: flow(
-                                tracker.most_recent_published_notification_id().value_or(
-                                    0
-                                ),
-                                self.event_store().all_stored_events_since,
-                                bind(
-                                    pipe(notifications_from, FutureResult.from_result)
-                                ),
-                                map_(
-                                    print_result_with_text("notification from results")
-                                ),
-                                bind(
-                                    pipe(
-                                        partial(
-                                            map,
-                                            lambda notif: flow(
-                                                notif,
-                                                partial(self._publish, msg_producer),
-                                                map_(return_v(notif)),
-                                            ),
-                                        ),
-                                        lambda publish_results: Fold.collect(
-                                            publish_results, FutureSuccess(())
-                                        ),
-                                    )
-                                ),
-                                bind(
-                                    partial(
-                                        self.published_notif_tracker_store().track_most_recent_published_notification,
-                                        tracker,
-                                    )
-                                ),
+                        .bind(partial(self._publish_pages, msg_producer))
+                    )
+
+        return flow(
+            self._message_producer(),
+            FutureResult.from_result,
+            bind(publish_future),
+        )
+
+    @future_safe
+    async def _publish_pages(
+        self,
+        a_message_producer: RabbitMQMessageProducer,
+        a_tracker: PublishedNotificationTracker,
+    ) -> Maybe[int]:
+        last_published_id: Maybe[int] = Nothing
+        try:
+            async for stored_events in self.event_store().stream_stored_events_since(
+                a_tracker.most_recent_published_notification_id().value_or(0),
+                self.page_size(),
+            ):
+                last_published_id = await unwrap_future_result(
+                    self._publish_page(a_message_producer, a_tracker, stored_events)
+                )
+            match a_message_producer.confirm_window():
+                case Some(window):
+                    await window.wait_until_drained()
+        except Exception:
+            match a_message_producer.confirm_window():
+                case Some(window):
+                    # Track what was confirmed before the failure, without
+                    # letting a tracking failure hide it
+                    tracked = await self._track_confirmed(a_tracker, window).awaitable()
+                    window.reset()
+                    match tracked:
+                        case IOFailure(Failure(error)):
+                            self.logger.warning(
+                                "Cannot track the confirmed notifications: %s", error
                             )
+            raise
+        else:
+            match a_message_producer.confirm_window():
+                case Some(window):
+                    try:
+                        last_published_id = await unwrap_future_result(
+                            self._track_confirmed(a_tracker, window)
+                        )
+                    finally:
+                        window.reset()
+        return last_published_id
+
+    def _publish_page(
+        self,
+        a_message_producer: RabbitMQMessageProducer,
+        a_tracker: PublishedNotificationTracker,
+        stored_events: List[StoredEvent],
+    ) -> FutureResult[Maybe[int], Any]:
+        match self.is_pass_through():
+            case True:
+                return self._publish_page_passing_through(
+                    a_message_producer, a_tracker, stored_events
+                )
+            case False:
+                return self._publish_page_of_notifications(
+                    a_message_producer, a_tracker, stored_events
+                )
+
+    def _publish_page_passing_through(
+        self,
+        a_message_producer: RabbitMQMessageProducer,
+        a_tracker: PublishedNotificationTracker,
+        stored_events: List[StoredEvent],
+    ) -> FutureResult[Maybe[int], Any]:
+        self.logger.info("Stored events to publish %s", len(stored_events))
+        return flow(
+            stored_events,
+            partial(
+                map,
+                lambda stored_event: flow(
+                    stored_event,
+                    self._pass_through_frame,
+                    FutureResult.from_result,
+                    bind(
+                        lambda frame: self._send(
+                            a_message_producer,
+                            self._stored_event_routing_key(stored_event),
+                            stored_event.type_name(),
+                            stored_event.id().unwrap(),
+                            stored_event.occurred_on(),
+                            frame,
                         )
+                    ),
+                ),
+            ),
+            lambda publish_results: Fold.collect(publish_results, FutureSuccess(())),
+            bind(
+                lambda _: self._track_page(
+                    a_message_producer,
+                    a_tracker,
+                    lambda: self.published_notif_tracker_store().track_most_recent_published_notification_id(
+                        a_tracker, stored_events[-1].id()
+                    ),
+                )
+            ),
+        )
+
+    def _track_page(
+        self,
+        a_message_producer: RabbitMQMessageProducer,
+        a_tracker: PublishedNotificationTracker,
+        a_track_sent: Callable[[], FutureResult[Maybe[int], Any]],
+    ) -> FutureResult[Maybe[int], Any]:
+        """
+        Tracks the notifications confirmed so far in confirm mode, otherwise
+        the ones sent with a_track_sent
+        """
+        match a_message_producer.confirm_window():
+            case Some(window):
+                return self._track_confirmed(a_tracker, window)
+            case _:
+                return a_track_sent()
+
+    def _track_confirmed(
+        self, a_tracker: PublishedNotificationTracker, a_window: RabbitMQConfirmWindow
+    ) -> FutureResult[Maybe[int], Any]:
+        return self.published_notif_tracker_store().track_most_recent_published_notification_id(
+            a_tracker, a_window.confirmed_id()
+        )
+
+    def _pass_through_frame(self, a_stored_event: StoredEvent) -> Result[str, Any]:
+        """
+        Answers the notification of a_stored_event, framing its JSON body as
+        is, the way NotificationSerializer would frame the restored event
+        """
+        body = a_stored_event.body()
+        codec = self.event_serializer().codec_of(body)
+        match codec.is_json():
+            case True:
+                return Success(
+                    '{"id": %d, "event": %s}'
+                    % (
+                        a_stored_event.id().unwrap(),
+                        self.event_serializer().payload_of(body, codec),
                     )
+                )
+            case False:
+                return flow(
+                    self._notifications_from([a_stored_event]),
+                    map_(lambda notifications: notifications[0]),
+                    bind(NotificationSerializer.instance().serialize),
+                )
 
-        def close_producer(producer: RabbitMQMessageProducer, _):
-            producer.close()
-            return FutureSuccess(None)
+    def _publish_page_of_notifications(
+        self,
+        a_message_producer: RabbitMQMessageProducer,
+        a_tracker: PublishedNotificationTracker,
+        stored_events: List[StoredEvent],
+    ) -> FutureResult[Maybe[int], Any]:
+        return flow(
+            stored_events,
+            self._notifications_from,
+            FutureResult.from_result,
+            map_(
+                tap(
+                    lambda notifications: self.logger.info_with_payload(
+                        "Notifications to publish %s",
+                        lambda: [
+                            notification.as_dict() for notification in notifications
+                        ],
+                        len(notifications),
+                    )
+                )
+            ),
+            bind(
+                pipe(
+                    partial(
+                        map,
+                        lambda notif: flow(
+                            notif,
+                            partial(self._publish, a_message_producer),
+                            map_(return_v(notif)),
+                        ),
+                    ),
+                    lambda publish_results: Fold.collect(
+                        publish_results, FutureSuccess(())
+                    ),
+                )
+            ),
+            bind(
+                lambda notifications: self._track_page(
+                    a_message_producer,
+                    a_tracker,
+                    lambda: self.published_notif_tracker_store().track_most_recent_published_notification(
+                        a_tracker, notifications
+                    ),
+                )
+            ),
+        )
 
-        return managed(publish_future, close_producer)(
-            FutureResult.from_result(self._message_producer())
+    def _notifications_from(
+        self,
+        events: List[StoredEvent],
+    ) -> Result[List[Notification], Any]:
+        return flow(
+            events,
+            partial(
+                map,
+                lambda stored_event: flow(
+                    None,
+                    lambda _: self.event_serializer().deserialize(stored_event.body()),
+                    map_(
+                        lambda domain_event: list(
+                            [
+                                stored_event.id().value_or(None),
+                                domain_event,
+                            ]
+                        )
+                    ),
+                    bind(feed_args(Notification.factory)),
+                ),
+            ),
+            list,
+            lambda results: Fold.collect(results, Success(())),
         )
 
     def _notification_routing_key(self, notification: Notification):
         return notification.type_name()
 
+    def _stored_event_routing_key(self, a_stored_event: StoredEvent):
+        return a_stored_event.type_name()
+
     def _publish(
         self,
         a_message_producer: RabbitMQMessageProducer,
         a_notification: Notification,
     ) -> FutureResult[None, Exception]:
         return flow(
-            {
-                "a_type": a_notification.type_name(),
-                "a_message_id": str(a_notification.id()),
-                "a_timestamp": int(a_notification.occurred_on().timestamp()),
-            },
-            feed_kwargs(RabbitMQMessageParameters.durable_text_parameters),
-            lambda text_parameters: flow(
-                a_notification,
-                NotificationSerializer.instance().serialize,
-                map_(tap(print_result_with_text("notification serialized"))),
-                lambda notif_string: FutureResult.from_result(
-                    a_message_producer.send(
-                        text_parameters,
-                        notif_string,
-                        self._notification_routing_key(a_notification),
+            a_notification,
+            NotificationSerializer.instance().serialize,
+            map_(
+                tap(
+                    lambda notif_string: self.logger.info_with_payload(
+                        "Notification %s serialized",
+                        lambda: notif_string,
+                        a_notification.id(),
                     )
-                ),
+                )
+            ),
+            FutureResult.from_result,
+            bind(
+                partial(
+                    self._send,
+                    a_message_producer,
+                    self._notification_routing_key(a_notification),
+                    a_notification.type_name(),
+                    a_notification.id(),
+                    a_notification.occurred_on(),
+                )
             ),
         )
 
+    def _send(
+        self,
+        a_message_producer: RabbitMQMessageProducer,
+        a_routing_key: str,
+        a_type_name: str,
+        a_notification_id: int,
+        an_occurred_on: datetime,
+        a_message: str,
+    ) -> FutureResult[None, Exception]:
+        text_parameters = RabbitMQMessageParameters.durable_text_parameters(
+            a_type=a_type_name,
+            a_message_id=str(a_notification_id),
+            a_timestamp=int(an_occurred_on.timestamp()),
+        )
+        match a_message_producer.confirm_window():
+            case Some(_):
+                return a_message_producer.send_confirmed(
+                    text_parameters, a_message, a_routing_key, a_notification_id
+                )
+            case _:
+                return FutureResult.from_result(
+                    a_message_producer.send(text_parameters, a_message, a_routing_key)
+                )
+
     def event_store(self) -> EventStore:
         return self._event_store
 
@@ -207,26 +441,62 @@ class RabbitMQPublisher(NotificationPublisher, SuperDBSessionUser):
         self._exchange_name = a_name
 
     def _set_message_producer(self, message_producer: RabbitMQMessageProducer):
-        self._message_producer_ins = message_producer
+        with self._message_producer_lock:
+            self._message_producer_ins = message_producer
 
     def _message_producer(self) -> Result[RabbitMQMessageProducer, Any]:
-        match self._message_producer_ins:
-            case None:
-                return flow(
-                    [
-                        self._connection_settings,
-                        self.exchange_name(),
-                        self.exchange_type(),
-                        True,
-                    ],
-                    feed_args(RabbitMQExchange.factory),
-                    map_(RabbitMQMessageProducer.factory),
-                    map_(tap(self._set_message_producer)),
-                )
-            case RabbitMQMessageProducer():
-                return Success(self._message_producer_ins)
-            case _:
-                print("not message producer in case", self._message_producer_ins)
+        """
+        Answers my producer, shared by every publish cycle, failing while I
+        have none yet or the connection of the one I have is closed, until
+        run() builds a new one
+        """
+        with self._message_producer_lock:
+            match self._message_producer_ins:
+                case RabbitMQMessageProducer() as producer if not producer.is_closed():
+                    return Success(producer)
+                case _:
+                    return Failure(
+                        MainException(code="RABBITMQ_MESSAGE_PRODUCER_NOT_RUNNING")
+                    )
+
+    def _producer_to_run(self) -> Result[RabbitMQMessageProducer, Any]:
+        """
+        Answers my producer, or a new one stored in its place when I have
+        none yet or the connection of the one I have is closed. Only called
+        by run(), so every producer built has its io loop run. None is built
+        once I am closed.
+        """
+        with self._message_producer_lock:
+            match [self._is_closed, self._message_producer_ins]:
+                case [True, _]:
+                    return Failure(MainException(code="RABBITMQ_PUBLISHER_CLOSED"))
+                case [False, RabbitMQMessageProducer() as producer] if (
+                    not producer.is_closed()
+                ):
+                    return Success(producer)
+            return self._build_message_producer().map(
+                tap(lambda producer: setattr(self, "_message_producer_ins", producer))
+            )
+
+    def _build_message_producer(self) -> Result[RabbitMQMessageProducer, Any]:
+        return flow(
+            [
+                self._connection_settings,
+                self.exchange_name(),
+                self.exchange_type(),
+                True,
+            ],
+            feed_args(RabbitMQExchange.factory),
+            map_(RabbitMQMessageProducer.factory),
+            map_(tap(self._enable_confirm_delivery)),
+        )
+
+    def _enable_confirm_delivery(self, a_message_producer: RabbitMQMessageProducer):
+        self.confirm_window_size().map(
+            lambda window_size: a_message_producer.enable_confirm_delivery(
+                window_size, self._confirm_timeout
+            )
+        )
 
     def set_published_notif_tracker_store(
         self, a_published_notif_tracker_store: PublishedNotificationTrackerStore
@@ -234,12 +504,47 @@ class RabbitMQPublisher(NotificationPublisher, SuperDBSessionUser):
         self._published_notif_tracker_store = a_published_notif_tracker_store
 
     def run(self):
-        self._message_producer().unwrap().run()
+        """
+        Runs the io loop of my producer, then of a new one whenever the
+        connection is lost, until I am closed, backing off while a producer
+        cannot be built
+        """
+        self._is_closed = False
+        delay = self._reconnect_delay
+        while not self._is_closed:
+            match self._producer_to_run():
+                case Success(producer):
+                    delay = self._reconnect_delay
+                    producer.run()
+                case Failure(_) if self._is_closed:
+                    pass
+                case Failure(error):
+                    self.logger.warning(
+                        "Cannot build the message producer, retry in %ss: %s",
+                        delay,
+                        error,
+                    )
+                    sleep(delay)
+                    delay = min(delay * 2, self._max_reconnect_delay)
+
+    def close(self):
+        """
+        Stops run() and closes my producer from the thread of its io loop,
+        pika connections not being thread safe
+        """
+        with self._message_producer_lock:
+            self._is_closed = True
+            producer = self._message_producer_ins
+        match producer:
+            case RabbitMQMessageProducer() if not producer.is_closed():
+                producer.exchange().connection().ioloop.add_callback_threadsafe(
+                    producer.close
+                )
 
     def is_ready(self) -> Result[bool, Any]:
         return (
             self._message_producer()
-            .map(lambda producer: producer.is_ready_for_publish())
+            .map(lambda producer: producer.is_healthy())
             .lash(lambda _: Success(False))
         )
 
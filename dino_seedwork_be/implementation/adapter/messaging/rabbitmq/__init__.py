@@ -1,4 +1,7 @@
+from .BatchedAcknowledger import \
+    BatchedAcknowledger as RabbitMQBatchedAcknowledger
 from .BrokerComponent import BrokerComponent as RabbitMQBrokerComponent
+from .ConfirmWindow import ConfirmWindow as RabbitMQConfirmWindow
 from .ConnectionSettings import \
     ConnectionSettings as RabbitMQConnectionSettings
 from .exceptions import MessageException as MessageException
@@ -12,7 +15,9 @@ from .MessageType import MessageType as RabbitMQMessageType
 from .Queue import Queue as RabbitMQQueue
 
 __all__ = [
+    "RabbitMQBatchedAcknowledger",
     "RabbitMQBrokerComponent",
+    "RabbitMQConfirmWindow",
     "RabbitMQConnectionSettings",
     "MessageException",
     "RabbitMQExchange",
@@ -0,0 +1,202 @@
+import asyncio
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+from returns.future import future_safe
+from returns.maybe import Maybe
+
+from dino_seedwork_be.adapters.persistance.key_value.AbstractKeyValueRepository import (
+    AbstractKeyValueRepository, Value)
+
+
+class AsyncRedisRepository(AbstractKeyValueRepository):
+    """
+    I am a key value repository on the asyncio client of redis, whose calls
+    wait for redis without blocking the event loop, sharing the connections of
+    the pool of my client. The connections of a pool are bound to the loop
+    they were opened on, so I keep a client per running loop, e.g. when each
+    delivery of a consumer is handled by its own asyncio.run.
+
+    Such a loop per call gets no connection reuse: every loop opens the
+    connections of its own pool, which cannot be disconnected once the loop
+    is closed, only dropped and left to garbage collection. Await my close()
+    before the loop ends to release them at once, or run the consumer on one
+    long lived loop to share them.
+    """
+
+    # The client I was given, used on the first loop I run on only
+    _redis: Optional[Redis]
+    # My clients by the loop they run on, the ones of closed loops dropped
+    _clients: Dict[asyncio.AbstractEventLoop, Redis]
+    _clients_lock: Lock
+    _pool_options: Dict[str, Any]
+
+    def __init__(self, redis: Redis, prefix: str = "") -> None:
+        """
+        @param redis the client of the first loop I run on, the clients of the
+        other loops being built with the options of its pool
+        """
+        self._redis = redis
+        self._clients = {}
+        self._clients_lock = Lock()
+        self._pool_options = {
+            "connection_class": redis.connection_pool.connection_class,
+            "max_connections": redis.connection_pool.max_connections,
+            **redis.connection_pool.connection_kwargs,
+        }
+        super().__init__(prefix)
+
+    @staticmethod
+    def from_url(
+        url: str, prefix: str = "", max_connections: Optional[int] = None, **kwargs
+    ) -> "AsyncRedisRepository":
+        """
+        @param url the redis url, e.g. redis://:password@localhost:6379/0
+        @param max_connections the max number of connections of the pool
+        @param kwargs the other options of the connections, e.g.
+        decode_responses
+        """
+        return AsyncRedisRepository(
+            Redis(
+                connection_pool=ConnectionPool.from_url(
+                    url, max_connections=max_connections, **kwargs
+                )
+            ),
+            prefix,
+        )
+
+    def redis(self) -> Redis:
+        """
+        Answers my client of the running loop, built on its first use there
+        """
+        loop = asyncio.get_running_loop()
+        with self._clients_lock:
+            match self._clients.get(loop):
+                case Redis() as client:
+                    return client
+            self._clients = {
+                client_loop: client
+                for client_loop, client in self._clients.items()
+                if not client_loop.is_closed()
+            }
+            match self._redis:
+                case Redis() as client:
+                    self._redis = None
+                case None:
+                    client = Redis(connection_pool=ConnectionPool(**self._pool_options))
+            self._clients[loop] = client
+            return client
+
+    def _key_with_prefix(self, key: str) -> str:
+        prefix = self._prefix
+        return f"{prefix}:{key}" if len(prefix) > 0 else key
+
+    def pipeline(self, transaction: bool = False) -> Pipeline:
+        """
+        Answers a pipeline of my client, whose commands are sent in a single
+        round trip once executed. Its keys are not prefixed.
+        """
+        return self.redis().pipeline(transaction=transaction)
+
+    @future_safe
+    async def set(
+        self,
+        key: str,
+        value: Value,
+        expired_seconds: Optional[int] = None,
+    ):
+        return await self.redis().set(
+            name=self._key_with_prefix(key), value=value, ex=expired_seconds
+        )
+
+    @future_safe
+    async def get(self, key: str) -> Maybe:
+        return Maybe.from_optional(
+            await self.redis().get(name=self._key_with_prefix(key))
+        )
+
+    @future_safe
+    async def get_many(self, keys: List[str]) -> List[Maybe]:
+        """
+        Gets every key with a single MGET
+        """
+        return [
+            Maybe.from_optional(value)
+            for value in await self.redis().mget(
+                [self._key_with_prefix(key) for key in keys]
+            )
+        ]
+
+    @future_safe
+    async def set_many(
+        self,
+        values: Dict[str, Value],
+        expired_seconds: Optional[int] = None,
+    ):
+        """
+        Sets every key with a single MSET, or with a pipeline of SETs when
+        they expire as MSET cannot set a TTL
+        """
+        match expired_seconds:
+            case None:
+                return await self.redis().mset(
+                    {self._key_with_prefix(key): value for key, value in values.items()}
+                )
+            case _:
+                async with self.pipeline() as pipeline:
+                    for key, value in values.items():
+                        pipeline.set(
+                            name=self._key_with_prefix(key),
+                            value=value,
+                            ex=expired_seconds,
+                        )
+                    return await pipeline.execute()
+
+    @future_safe
+    async def get_bits(self, key: str, offsets: List[int]) -> List[bool]:
+        async with self.pipeline() as pipeline:
+            for offset in offsets:
+                pipeline.getbit(self._key_with_prefix(key), offset)
+            return [bit == 1 for bit in await pipeline.execute()]
+
+    @future_safe
+    async def set_bits(
+        self,
+        key: str,
+        offsets: List[int],
+        is_set: bool = True,
+        expired_seconds: Optional[int] = None,
+    ):
+        async with self.pipeline() as pipeline:
+            for offset in offsets:
+                pipeline.setbit(self._key_with_prefix(key), offset, int(is_set))
+            match expired_seconds:
+                case int():
+                    pipeline.expire(self._key_with_prefix(key), expired_seconds)
+            return await pipeline.execute()
+
+    @future_safe
+    async def expire(self, key: str, expired_seconds: int) -> bool:
+        return await self.redis().expire(self._key_with_prefix(key), expired_seconds)
+
+    @future_safe
+    async def ttl(self, key: str) -> Maybe[int]:
+        """
+        Answers the seconds left before key expires, Nothing when key does not
+        exist or does not expire
+        """
+        seconds: Any = await self.redis().ttl(self._key_with_prefix(key))
+        return Maybe.from_optional(seconds if seconds >= 0 else None)
+
+    @future_safe
+    async def close(self):
+        """
+        Closes my client of the running loop
+        """
+        client = self.redis()
+        with self._clients_lock:
+            self._clients.pop(asyncio.get_running_loop(), None)
+        await client.close()
+        await client.connection_pool.disconnect()
@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
 from redis import Redis
 from returns.future import future_safe
@@ -37,3 +37,52 @@ class RedisPyRepository(AbstractKeyValueRepository):
     @future_safe
     async def get(self, key: str) -> Maybe:
         return Maybe.from_optional(self.redis().get(name=self._key_with_prefix(key)))
+
+    @future_safe
+    async def get_many(self, keys: List[str]) -> List[Maybe]:
+        """
+        Gets every key with a single MGET
+        """
+        return [
+            Maybe.from_optional(value)
+            for value in self.redis().mget([self._key_with_prefix(key) for key in keys])
+        ]
+
+    @future_safe
+    async def set_many(
+        self,
+        values: Dict[str, Union[bytes, memoryview, str, int, float]],
+        expired_seconds: Optional[int] = None,
+    ):
+        """
+        Sets every key in a single round trip, through a pipeline of SETs
+        """
+        pipeline = self.redis().pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.set(
+                name=self._key_with_prefix(key), value=value, ex=expired_seconds
+            )
+        return pipeline.execute()
+
+    @future_safe
+    async def get_bits(self, key: str, offsets: List[int]) -> List[bool]:
+        pipeline = self.redis().pipeline(transaction=False)
+        for offset in offsets:
+            pipeline.getbit(self._key_with_prefix(key), offset)
+        return [bit == 1 for bit in pipeline.execute()]
+
+    @future_safe
+    async def set_bits(
+        self,
+        key: str,
+        offsets: List[int],
+        is_set: bool = True,
+        expired_seconds: Optional[int] = None,
+    ):
+        pipeline = self.redis().pipeline(transaction=False)
+        for offset in offsets:
+            pipeline.setbit(self._key_with_prefix(key), offset, int(is_set))
+        match expired_seconds:
+            case int():
+                pipeline.expire(self._key_with_prefix(key), expired_seconds)
+        return pipeline.execute()
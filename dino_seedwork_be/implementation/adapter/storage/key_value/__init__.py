@@ -1,3 +1,4 @@
+from .AsyncRedisRepository import AsyncRedisRepository
 from .RedisRepository import RedisPyRepository
 
-__all__ = ["RedisPyRepository"]
+__all__ = ["AsyncRedisRepository", "RedisPyRepository"]
@@ -1,6 +1,7 @@
 from .AlchemyQuerier import AlchemyQuerier as AlchemyQuerier
 from .BaseModel import UUIDBaseModel as UUIDBaseModel
 from .connection import alchemy_session_factory as alchemy_session_factory
+from .connection import alchemy_sessionmaker as alchemy_sessionmaker
 from .connection import engine_factory as engine_factory
 from .Repository import StandardAlchemyRepository as StandardAlchemyRepository
 from .SerializableBase import SerializableEntity as SerializableEntity
@@ -13,6 +14,7 @@ __all__ = [
     "UUIDBaseModel",
     "alchemy_execute_query_on_repository",
     "alchemy_session_factory",
+    "alchemy_sessionmaker",
     "engine_factory",
     "tuple_row_to_dict",
     "tuple_rows_to_dict",
@@ -1,23 +1,113 @@
+import logging
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
                                     create_async_engine)
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
-__all__ = ["engine_factory", "alchemy_session_factory"]
+__all__ = ["engine_factory", "alchemy_sessionmaker", "alchemy_session_factory"]
+
+SessionOptions = Tuple[bool, bool]
+
+# The attribute of the sync engine of an engine holding its sessionmakers, by
+# their expire_on_commit and autoflush, so they are collected with it
+_SESSIONMAKERS_ATTRIBUTE = "_dino_seedwork_sessionmakers"
+_sessionmakers_lock = Lock()
 
 
-def engine_factory(uri: str, pool_size: int = 20, max_overflow: int = 20):
+def engine_factory(
+    uri: str,
+    pool_size: int = 20,
+    max_overflow: int = 20,
+    is_null_pool: bool = False,
+    pool_pre_ping: bool = True,
+    pool_recycle: int = 1800,
+    pool_timeout: float = 30,
+    statement_cache_size: Optional[int] = None,
+    log_level: int = logging.WARNING,
+) -> AsyncEngine:
+    """
+    The pooled connections are bound to the event loop they were opened on,
+    so a pooled engine must be used from one long lived loop. Callers running
+    a loop per call, e.g. consumers handling each delivery in its own
+    asyncio.run through async_execute, pass is_null_pool=True instead.
+    @param pool_size the number of connections kept open by the pool
+    @param max_overflow the number of connections opened beyond pool_size
+    under load, closed once returned
+    @param is_null_pool whether each session opens and closes its own
+    connection instead, e.g. on serverless deployments where the pool would
+    not outlive the request, or for a loop per call
+    @param pool_pre_ping whether a pooled connection is checked before use,
+    so that one dropped by the server is replaced instead of failing
+    @param pool_recycle the seconds after which a pooled connection is
+    replaced, -1 to never replace it
+    @param pool_timeout the seconds waited for a pooled connection
+    @param statement_cache_size the number of prepared statements cached per
+    asyncpg connection, 0 to disable them e.g. behind pgbouncer, None for
+    the asyncpg default
+    @param log_level the level the statements are logged at, INFO logging
+    them and DEBUG logging their rows too
+    """
+    pool_options: Dict[str, Any] = (
+        {"poolclass": NullPool}
+        if is_null_pool
+        else {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_pre_ping": pool_pre_ping,
+            "pool_recycle": pool_recycle,
+            "pool_timeout": pool_timeout,
+        }
+    )
+    connect_args: Dict[str, Any] = {}
+    match [make_url(uri).get_driver_name(), statement_cache_size]:
+        case ["asyncpg", int()]:
+            connect_args = {
+                "prepared_statement_cache_size": statement_cache_size,
+                "statement_cache_size": statement_cache_size,
+            }
     engine = create_async_engine(
         uri,
         isolation_level="READ COMMITTED",
-        echo=True,
+        echo="debug" if log_level <= logging.DEBUG else log_level <= logging.INFO,
         future=True,
-        # pool_size=pool_size,
-        # max_overflow=max_overflow,
-        poolclass=NullPool,
+        connect_args=connect_args,
+        **pool_options,
     )
     return engine
 
 
-def alchemy_session_factory(engine: AsyncEngine) -> AsyncSession:
-    return sessionmaker(bind=engine, class_=AsyncSession)()
+def alchemy_sessionmaker(
+    engine: AsyncEngine, expire_on_commit: bool = False, autoflush: bool = True
+) -> sessionmaker:
+    """
+    Answers the sessionmaker of engine, built once per engine and options.
+    @param expire_on_commit whether the instances of a session are expired on
+    commit, their next attribute access then loading them again
+    @param autoflush whether a session flushes its pending changes before
+    each query
+    """
+    with _sessionmakers_lock:
+        sessionmakers: Dict[SessionOptions, sessionmaker] = getattr(
+            engine.sync_engine, _SESSIONMAKERS_ATTRIBUTE, {}
+        )
+        setattr(engine.sync_engine, _SESSIONMAKERS_ATTRIBUTE, sessionmakers)
+        options = (expire_on_commit, autoflush)
+        match sessionmakers.get(options):
+            case None:
+                sessionmakers[options] = sessionmaker(
+                    bind=engine,
+                    class_=AsyncSession,
+                    expire_on_commit=expire_on_commit,
+                    autoflush=autoflush,
+                )
+        return sessionmakers[options]
+
+
+def alchemy_session_factory(
+    engine: AsyncEngine, expire_on_commit: bool = False, autoflush: bool = True
+) -> AsyncSession:
+    return alchemy_sessionmaker(engine, expire_on_commit, autoflush)()
@@ -14,6 +14,7 @@ from dino_seedwork_be.application.ApplicationLifeCycleUseCase import \
     ApplicationLifeCycleUsecase
 from dino_seedwork_be.domain import DomainEventSubscriber
 from dino_seedwork_be.domain.DomainEventPublisher import DomainEventPublisher
+from dino_seedwork_be.domain.event.EventStore import EventStore
 from dino_seedwork_be.domain.event.EventStoreSubscriber import \
     EventStoreSubscriber
 from dino_seedwork_be.implementation.event.sqlalchemy.SqlAlchemyEventStore import (
@@ -33,12 +34,29 @@ class AlchemyApplicationLifeCycle(AbstractApplicationServiceLifeCycle):
         pass
 
     @classmethod
-    def initialize(cls, event_store_model: Type[SqlAlchemyBaseEvent]):
+    def initialize(
+        cls, event_store_model: Type[SqlAlchemyBaseEvent], is_outbox: bool = False
+    ):
+        """
+        @param is_outbox whether the domain events of a use case are staged in
+        its own session and committed together with it by commit_db, instead
+        of being committed by the event store on every append
+        """
         session = cls.session_factory()
-        cls._event_store = SqlAlchemyEventStore(event_store_model)
+        cls._event_store = SqlAlchemyEventStore(event_store_model, is_outbox)
         cls._event_store.set_session(session)
         return super().initialize()
 
+    @classmethod
+    def event_store_of(cls, correlation_id: str) -> EventStore:
+        match cls.event_store():
+            case SqlAlchemyEventStore() as event_store if event_store.is_outbox():
+                return event_store.bound_to(
+                    cls.get_session_by_correlation(correlation_id)
+                )
+            case event_store:
+                return event_store
+
     @classmethod
     def start_db(
         cls,
@@ -85,7 +103,7 @@ class AlchemyApplicationLifeCycle(AbstractApplicationServiceLifeCycle):
     @classmethod
     def event_listen(cls, correlation_id: str) -> FutureResult:
         DomainEventPublisher.instance().reset()
-        event_store = cls.event_store()
+        event_store = cls.event_store_of(correlation_id)
 
         DomainEventPublisher.instance().subscribe(EventStoreSubscriber(event_store))
         for publisher_factory in cls._domain_event_subscribers:
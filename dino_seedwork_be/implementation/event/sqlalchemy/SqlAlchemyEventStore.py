@@ -1,14 +1,18 @@
 from datetime import datetime
-from typing import Any, List, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
 
 from returns.curry import partial
 from returns.functions import tap
 from returns.future import FutureResult, FutureSuccess, future_safe
+from returns.iterables import Fold
 from returns.pipeline import flow
-from returns.pointfree import alt, bind, map_
-from sqlalchemy import Column, DateTime, Integer, String, select
+from returns.pointfree import alt, bind, lash, map_
+from returns.result import Result, Success
+from sqlalchemy import Column, DateTime, Integer, String, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.functions import count
 
+from dino_seedwork_be.adapters.logger.SimpleLogger import DomainLogger
 from dino_seedwork_be.adapters.persistance.sql.DBSessionUser import \
     DBSessionUser
 from dino_seedwork_be.domain.DomainEvent import DomainEvent
@@ -16,7 +20,7 @@ from dino_seedwork_be.domain.event.EventSerializer import EventSerializer
 from dino_seedwork_be.domain.event.EventStore import EventStore
 from dino_seedwork_be.domain.event.StoredEvent import StoredEvent
 from dino_seedwork_be.utils import (async_to_future_result, feed_kwargs,
-                                    print_result_with_text, return_v)
+                                    return_v, tap_failure_execute_future)
 
 # __all__ = ["SqlAlchemyBaseEvent", "SqlAlchemyEventStore"]
 
@@ -31,35 +35,234 @@ class SqlAlchemyBaseEvent:
 
 class SqlAlchemyEventStore(EventStore, DBSessionUser):
     _db_model: Type[SqlAlchemyBaseEvent]
+    _is_outbox: bool
+    _page_size: int
+    _max_batch_size: int
+    logger: DomainLogger = DomainLogger("SqlAlchemyEventStore")
 
-    def __init__(self, db_model: Type[SqlAlchemyBaseEvent]) -> None:
+    def __init__(
+        self,
+        db_model: Type[SqlAlchemyBaseEvent],
+        is_outbox: bool = False,
+        page_size: int = 500,
+        max_batch_size: int = 5000,
+    ) -> None:
+        """
+        @param db_model the mapped model of the event store table
+        @param is_outbox whether I only stage appended events in my session,
+        leaving the commit (or rollback) to the unit of work that owns it,
+        so the aggregate and its events are written in one transaction
+        @param page_size the default number of events per streamed page
+        @param max_batch_size the max number of events a range read answers
+        """
         self._db_model = db_model
+        self._is_outbox = is_outbox
+        self._page_size = page_size
+        self._max_batch_size = max_batch_size
+
+    def is_outbox(self) -> bool:
+        return self._is_outbox
+
+    def bound_to(self, a_session: AsyncSession) -> "SqlAlchemyEventStore":
+        """
+        Answers a store like me that works in a_session, e.g. the session of
+        the request whose events are appended in outbox mode.
+        """
+        event_store = SqlAlchemyEventStore(
+            self._db_model, self.is_outbox(), self.page_size(), self.max_batch_size()
+        )
+        event_store.set_session(a_session)
+        return event_store
 
     @future_safe
     async def all_stored_events_since(self, an_event_id: int) -> List[StoredEvent]:
-        stmt = select(self._db_model).where(self._db_model.id > an_event_id)
-        result = (await self.session().execute(stmt)).scalars().all()
+        stmt = (
+            select(*self._event_columns())
+            .where(self._db_model.id > an_event_id)
+            .order_by(self._db_model.id)
+        )
+        rows = (await self.session().execute(stmt)).all()
+        return [self._stored_event_from_row(row) for row in rows]
+
+    async def stream_stored_events_since(
+        self, an_event_id: int, a_page_size: Optional[int] = None
+    ) -> AsyncIterator[List[StoredEvent]]:
+        """
+        Answers the stored events after an_event_id in pages ordered by id,
+        each page read by its own keyset query (id > last id of the previous
+        page), so only one page is held in memory and the session may be
+        committed between pages.
+        """
+        page_size = a_page_size or self.page_size()
+        last_event_id = an_event_id
+        while True:
+            stmt = (
+                select(*self._event_columns())
+                .where(self._db_model.id > last_event_id)
+                .order_by(self._db_model.id)
+                .limit(page_size)
+            )
+            rows = (await self.session().execute(stmt)).all()
+            if rows:
+                yield [self._stored_event_from_row(row) for row in rows]
+            if len(rows) < page_size:
+                return
+            last_event_id = rows[-1][0]
+
+    def _event_columns(self) -> Tuple[Any, Any, Any, Any]:
+        """
+        Answers the columns a stored event is read from, in the order
+        _stored_event_from_row expects them, so reads skip ORM hydration
+        """
+        return (
+            self._db_model.id,
+            self._db_model.occurred_on,
+            self._db_model.type_name,
+            self._db_model.body,
+        )
+
+    def _stored_event_from_row(self, a_row: Tuple[int, datetime, str, str]):
+        an_id, occurred_on, type_name, body = a_row
+        return StoredEvent.trusted(body, occurred_on, type_name, an_id)
+
+    def page_size(self) -> int:
+        return self._page_size
+
+    @future_safe
+    async def all_stored_events_between(
+        self,
+        a_low_stored_event_id: int,
+        a_high_stored_event_id: int,
+        a_limit: Optional[int] = None,
+    ) -> List[StoredEvent]:
+        """
+        Answers the stored events whose id is in [a_low_stored_event_id,
+        a_high_stored_event_id], ordered by id, as a range scan on the primary
+        key reading only the event columns.
+        @param a_limit the max number of events answered, capped by my
+        max_batch_size
+        """
+        limit = (
+            self.max_batch_size()
+            if a_limit is None
+            else min(a_limit, self.max_batch_size())
+        )
+        stmt = (
+            select(*self._event_columns())
+            .where(
+                self._db_model.id.between(a_low_stored_event_id, a_high_stored_event_id)
+            )
+            .order_by(self._db_model.id)
+            .limit(limit)
+        )
+        rows = (await self.session().execute(stmt)).all()
+        return [self._stored_event_from_row(row) for row in rows]
+
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    def append(self, an_domain_event: DomainEvent) -> FutureResult[StoredEvent, Any]:
+        stored_event_result = self._stored_event_of(an_domain_event)
         return flow(
-            result,
-            partial(
-                map,
-                lambda r: StoredEvent(
-                    id=r.id,
-                    occurred_on=r.occurred_on,
-                    type_name=r.type_name,
-                    body=r.body,
-                ),
+            stored_event_result.map(self._row_of),
+            map_(feed_kwargs(self._db_model)),
+            map_(tap(self.session().add)),
+            bind(lambda _: self._commit()),
+            map_(
+                tap(
+                    lambda _: self.logger.info(
+                        "Write event %s to event store", an_domain_event.type()
+                    )
+                )
             ),
-            list,
+            bind(return_v(FutureResult.from_result(stored_event_result))),
+            alt(tap(lambda _: self._rollback())),
+        )
+
+    def _commit(self) -> FutureResult[None, Any]:
+        match self.is_outbox():
+            case True:
+                return FutureSuccess(None)
+            case False:
+                return async_to_future_result(self.session().commit)()
+
+    def _rollback(self) -> FutureResult[None, Any]:
+        match self.is_outbox():
+            case True:
+                return FutureSuccess(None)
+            case False:
+                return async_to_future_result(self.session().rollback)()
+
+    def append_all(
+        self, domain_events: List[DomainEvent]
+    ) -> FutureResult[List[StoredEvent], Any]:
+        """
+        Append domain_events with a single multi-row INSERT ... RETURNING
+        and one commit (none in outbox mode), answering their stored events
+        with the given ids.
+        """
+        return flow(
+            domain_events,
+            partial(map, self._stored_event_of),
+            lambda results: Fold.collect(results, Success(())),
+            FutureResult.from_result,
+            bind(self._insert_stored_events),
         )
 
-    def all_stored_events_between(
-        self, a_low_stored_event_id: int, a_high_stored_event_id: int
+    def _insert_stored_events(
+        self, stored_events: Tuple[StoredEvent, ...]
     ) -> FutureResult[List[StoredEvent], Any]:
-        return FutureSuccess([])
+        match len(stored_events):
+            case 0:
+                return FutureSuccess([])
+        return flow(
+            self._execute_insert(stored_events),
+            bind(lambda rows: self._commit().map(return_v(rows))),
+            map_(
+                tap(
+                    lambda _: self.logger.info(
+                        "Write %s events to event store", len(stored_events)
+                    )
+                )
+            ),
+            map_(partial(self._with_returned_ids, stored_events)),
+            lash(tap_failure_execute_future(lambda _: self._rollback())),
+        )
 
-    def append(self, an_domain_event: DomainEvent) -> FutureResult[StoredEvent, Any]:
-        stored_event_result = flow(
+    @future_safe
+    async def _execute_insert(
+        self, stored_events: Tuple[StoredEvent, ...]
+    ) -> List[Tuple[int, str, str]]:
+        stmt = (
+            insert(self._db_model)
+            .values([self._row_of(stored_event) for stored_event in stored_events])
+            .returning(self._db_model.id, self._db_model.type_name, self._db_model.body)
+        )
+        return (await self.session().execute(stmt)).all()
+
+    def _with_returned_ids(
+        self,
+        stored_events: Tuple[StoredEvent, ...],
+        rows: List[Tuple[int, str, str]],
+    ) -> List[StoredEvent]:
+        """
+        Sets the ids of the returned rows on stored_events, matched by their
+        type name and body since RETURNING does not keep the VALUES order;
+        events alike are given their ids in ascending order
+        """
+        ids_by_event: Dict[Tuple[str, str], List[int]] = {}
+        for an_id, type_name, body in sorted(rows):
+            ids_by_event.setdefault((type_name, body), []).append(an_id)
+        for stored_event in stored_events:
+            stored_event.set_id(
+                ids_by_event[(stored_event.type_name(), stored_event.body())].pop(0)
+            )
+        return list(stored_events)
+
+    def _stored_event_of(
+        self, an_domain_event: DomainEvent
+    ) -> Result[StoredEvent, Any]:
+        return flow(
             an_domain_event,
             EventSerializer.instance().serialize,
             map_(
@@ -71,21 +274,13 @@ class SqlAlchemyEventStore(EventStore, DBSessionUser):
             ),
             map_(feed_kwargs(StoredEvent)),
         )
-        return flow(
-            stored_event_result.map(
-                lambda v: {
-                    "occurred_on": v.occurred_on(),
-                    "type_name": v.type_name(),
-                    "body": v.body(),
-                }
-            ),
-            map_(feed_kwargs(self._db_model)),
-            map_(tap(self.session().add)),
-            bind(lambda _: async_to_future_result(self.session().commit)()),
-            map_(print_result_with_text("Commit event to event store")),
-            bind(return_v(FutureResult.from_result(stored_event_result))),
-            alt(tap(lambda _: async_to_future_result(self.session().rollback)())),
-        )
+
+    def _row_of(self, a_stored_event: StoredEvent) -> dict:
+        return {
+            "occurred_on": a_stored_event.occurred_on(),
+            "type_name": a_stored_event.type_name(),
+            "body": a_stored_event.body(),
+        }
 
     def close(self):
         ...
@@ -1,6 +1,6 @@
-from typing import List, Type
+from typing import Any, List, Type
 
-from returns.future import future_safe
+from returns.future import FutureResult, FutureSuccess, future_safe
 from returns.maybe import Maybe, Nothing, Some
 from sqlalchemy import Column, Integer, String, select, update
 
@@ -58,29 +58,34 @@ class SqlAlchemyPublishedNotificationTrackerStore(
                     most_recent_published_notification_id=tracker.last_published_event_id,
                 ).unwrap()
 
-    @future_safe
-    async def track_most_recent_published_notification(
+    def track_most_recent_published_notification(
         self, a_tracker: PublishedNotificationTracker, notifications: List[Notification]
-    ) -> Maybe[int]:
+    ) -> FutureResult[Maybe[int], Any]:
         match len(notifications):
             case 0:
-                return Nothing
+                return FutureSuccess(Nothing)
             case _:
-                last_notfi = notifications[-1]
-                a_tracker.set_most_recent_published_notification_id(last_notfi.id())
-                last_published_notif_id = (
-                    a_tracker.most_recent_published_notification_id().value_or(None)
+                return self.track_most_recent_published_notification_id(
+                    a_tracker, Some(notifications[-1].id())
                 )
-                match last_published_notif_id:
-                    case int(an_id):
-                        stmt = (
-                            update(self.db_model())
-                            .where(self.db_model().type_name == a_tracker.type_name())
-                            .values(last_published_event_id=an_id)
-                        )
-                        await self.session().execute(stmt)
+
+    @future_safe
+    async def track_most_recent_published_notification_id(
+        self, a_tracker: PublishedNotificationTracker, a_notification_id: Maybe[int]
+    ) -> Maybe[int]:
+        match a_notification_id:
+            case Some(int(an_id)):
+                a_tracker.set_most_recent_published_notification_id(an_id)
+                stmt = (
+                    update(self.db_model())
+                    .where(self.db_model().type_name == a_tracker.type_name())
+                    .values(last_published_event_id=an_id)
+                )
+                await self.session().execute(stmt)
                 await self.session().commit()
-                return Some(last_notfi.id())
+                return Some(an_id)
+            case _:
+                return Nothing
 
     def db_model(self) -> Type[SqlAlchemyBasePublishedNotifTracker]:
         return self._db_model
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+
+
+class EventCodec(ABC):
+    """
+    Encodes the dict of a domain event into a stored event body and back.
+    Bodies are prefixed by "<name>:" so the codec of a body is known when it
+    is read, except for untagged codecs (the stdlib json one) whose bodies
+    stay as they were before codecs were pluggable.
+    """
+
+    @abstractmethod
+    def name(self) -> str:
+        ...
+
+    @abstractmethod
+    def encode(self, a_dict: dict) -> str:
+        ...
+
+    @abstractmethod
+    def decode(self, a_payload: str) -> dict:
+        ...
+
+    def is_tagged(self) -> bool:
+        return True
+
+    def is_json(self) -> bool:
+        """
+        Answers whether my payloads are JSON text, that can be embedded as is
+        in a JSON document
+        """
+        return False
+
+    def tag(self) -> str:
+        return self.name() + ":"
+
+    def encode_body(self, a_dict: dict) -> str:
+        match self.is_tagged():
+            case True:
+                return self.tag() + self.encode(a_dict)
+            case False:
+                return self.encode(a_dict)
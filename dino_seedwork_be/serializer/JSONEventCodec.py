@@ -0,0 +1,20 @@
+import json
+
+from .EventCodec import EventCodec
+
+
+class JSONEventCodec(EventCodec):
+    def name(self) -> str:
+        return "json"
+
+    def is_tagged(self) -> bool:
+        return False
+
+    def is_json(self) -> bool:
+        return True
+
+    def encode(self, a_dict: dict) -> str:
+        return json.dumps(a_dict, default=str)
+
+    def decode(self, a_payload: str) -> dict:
+        return json.loads(a_payload)
@@ -0,0 +1,34 @@
+from base64 import b64decode, b64encode
+
+from dino_seedwork_be.exceptions import MainException
+
+from .EventCodec import EventCodec
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+
+class MsgPackEventCodec(EventCodec):
+    """
+    Compact binary bodies through msgpack, base64 encoded since stored event
+    bodies are text. Unknown types are written with str.
+    """
+
+    def __init__(self) -> None:
+        if msgpack is None:
+            raise MainException(
+                code="EVENT_CODEC_UNAVAILABLE", message="msgpack is not installed"
+            )
+
+    def name(self) -> str:
+        return "msgpack"
+
+    def encode(self, a_dict: dict) -> str:
+        return b64encode(msgpack.packb(a_dict, default=str, use_bin_type=True)).decode(
+            "ascii"
+        )
+
+    def decode(self, a_payload: str) -> dict:
+        return msgpack.unpackb(b64decode(a_payload), raw=False, strict_map_key=False)
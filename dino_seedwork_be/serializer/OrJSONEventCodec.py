@@ -0,0 +1,37 @@
+from dino_seedwork_be.exceptions import MainException
+
+from .EventCodec import EventCodec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class OrJSONEventCodec(EventCodec):
+    """
+    JSON through orjson. Datetimes and unknown types are written with str,
+    like the stdlib json codec, so both answer the same dict when decoded.
+    """
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise MainException(
+                code="EVENT_CODEC_UNAVAILABLE", message="orjson is not installed"
+            )
+
+    def name(self) -> str:
+        return "orjson"
+
+    def is_json(self) -> bool:
+        return True
+
+    def encode(self, a_dict: dict) -> str:
+        return orjson.dumps(
+            a_dict,
+            default=str,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+    def decode(self, a_payload: str) -> dict:
+        return orjson.loads(a_payload)
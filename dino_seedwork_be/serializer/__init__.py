@@ -1,5 +1,17 @@
 from .AbstractSerializer import AbstractSerializer
+from .EventCodec import EventCodec
+from .JSONEventCodec import JSONEventCodec
+from .MsgPackEventCodec import MsgPackEventCodec
+from .OrJSONEventCodec import OrJSONEventCodec
 from .Serializable import JSONSerializable
 from .SimpleJSONSerializer import SimpleJSONSerializer
 
-__all__ = ["AbstractSerializer", "JSONSerializable", "SimpleJSONSerializer"]
+__all__ = [
+    "AbstractSerializer",
+    "EventCodec",
+    "JSONEventCodec",
+    "JSONSerializable",
+    "MsgPackEventCodec",
+    "OrJSONEventCodec",
+    "SimpleJSONSerializer",
+]
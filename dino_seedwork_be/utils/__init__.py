@@ -106,6 +106,7 @@ from .params import cast_bool_from_str, get_env, get_env_with, get_environment
 
 __all__.extend(["cast_bool_from_str", "get_env_with", "get_env", "get_environment"])
 
+from .process.ContextLocal import ContextLocal
 from .process.ThreadLocal import ThreadLocal
 
-__all__.extend(["ThreadLocal"])
+__all__.extend(["ContextLocal", "ThreadLocal"])
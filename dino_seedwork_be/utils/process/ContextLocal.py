@@ -0,0 +1,29 @@
+from contextvars import ContextVar, Token
+from typing import Generic, TypeVar
+
+InnerValue = TypeVar("InnerValue")
+
+
+class ContextLocal(Generic[InnerValue]):
+    """
+    Like ThreadLocal, but the value belongs to the current contextvars
+    context, so every asyncio task sees its own value even though many
+    tasks share one thread.
+    """
+
+    _var: ContextVar[InnerValue]
+
+    def __init__(self, key: str):
+        self._var = ContextVar(key)
+
+    def value(self) -> InnerValue:
+        """
+        @raise LookupError when no value has been set in the current context
+        """
+        return self._var.get()
+
+    def set_value(self, aValue: InnerValue) -> Token[InnerValue]:
+        return self._var.set(aValue)
+
+    def reset(self, a_token: Token[InnerValue]):
+        self._var.reset(a_token)
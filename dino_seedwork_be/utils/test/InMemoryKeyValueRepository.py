@@ -0,0 +1,123 @@
+from time import monotonic
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
+from returns.future import FutureResult, FutureSuccess
+from returns.maybe import Maybe, Nothing, Some
+
+from dino_seedwork_be.adapters.persistance.key_value.AbstractKeyValueRepository import (
+    AbstractKeyValueRepository, Value)
+
+
+class InMemoryKeyValueRepository(AbstractKeyValueRepository):
+    """
+    I am a key value repository in memory, standing in for redis in tests with
+    the same interface and TTLs as the AsyncRedisRepository
+    """
+
+    # My store, which holds each key with its value and the monotonic time it
+    # expires at, if it does, a bitmap being held as the offsets of its set
+    # bits
+    _store: Dict[str, Tuple[Union[Value, FrozenSet[int]], Optional[float]]]
+
+    def __init__(self, prefix: str = "") -> None:
+        self._store = {}
+        super().__init__(prefix)
+
+    def _key_with_prefix(self, key: str) -> str:
+        prefix = self._prefix
+        return f"{prefix}:{key}" if len(prefix) > 0 else key
+
+    def _entry(
+        self, key: str
+    ) -> Maybe[Tuple[Union[Value, FrozenSet[int]], Optional[float]]]:
+        match self._store.get(self._key_with_prefix(key)):
+            case (_, float() as expires_at) if expires_at <= monotonic():
+                del self._store[self._key_with_prefix(key)]
+                return Nothing
+            case None:
+                return Nothing
+            case entry:
+                return Some(entry)
+
+    def set(
+        self,
+        key: str,
+        value: Value,
+        expired_seconds: Optional[int] = None,
+    ) -> FutureResult:
+        self._set(key, value, expired_seconds)
+        return FutureSuccess(True)
+
+    def _set(self, key: str, value: Value, expired_seconds: Optional[int]):
+        self._store[self._key_with_prefix(key)] = (
+            value,
+            None if expired_seconds is None else monotonic() + expired_seconds,
+        )
+
+    def get(self, key: str) -> FutureResult[Maybe, Exception]:
+        return FutureSuccess(self._entry(key).map(lambda entry: entry[0]))
+
+    def get_many(self, keys: List[str]) -> FutureResult[List[Maybe], Exception]:
+        return FutureSuccess(
+            [self._entry(key).map(lambda entry: entry[0]) for key in keys]
+        )
+
+    def set_many(
+        self,
+        values: Dict[str, Value],
+        expired_seconds: Optional[int] = None,
+    ) -> FutureResult:
+        for key, value in values.items():
+            self._set(key, value, expired_seconds)
+        return FutureSuccess(True)
+
+    def expire(self, key: str, expired_seconds: int) -> FutureResult[bool, Exception]:
+        match self._entry(key):
+            case Some((value, _)):
+                self._set(key, value, expired_seconds)
+                return FutureSuccess(True)
+            case _:
+                return FutureSuccess(False)
+
+    def ttl(self, key: str) -> FutureResult[Maybe[int], Exception]:
+        return FutureSuccess(
+            self._entry(key).bind(
+                lambda entry: Maybe.from_optional(entry[1]).map(
+                    lambda expires_at: round(expires_at - monotonic())
+                )
+            )
+        )
+
+    def get_bits(
+        self, key: str, offsets: List[int]
+    ) -> FutureResult[List[bool], Exception]:
+        bits = self._bits(key)
+        return FutureSuccess([offset in bits for offset in offsets])
+
+    def set_bits(
+        self,
+        key: str,
+        offsets: List[int],
+        is_set: bool = True,
+        expired_seconds: Optional[int] = None,
+    ) -> FutureResult:
+        bits = self._bits(key)
+        expires_at = self._entry(key).map(lambda entry: entry[1]).value_or(None)
+        match expired_seconds:
+            case int():
+                expires_at = monotonic() + expired_seconds
+        self._store[self._key_with_prefix(key)] = (
+            bits.union(offsets) if is_set else bits.difference(offsets),
+            expires_at,
+        )
+        return FutureSuccess(True)
+
+    def _bits(self, key: str) -> FrozenSet[int]:
+        match self._entry(key):
+            case Some((frozenset() as bits, _)):
+                return bits
+            case _:
+                return frozenset()
+
+    def close(self) -> FutureResult:
+        return FutureSuccess(None)
@@ -1,3 +1,4 @@
+from .InMemoryKeyValueRepository import InMemoryKeyValueRepository
 from .MockRepository import MockRepository
 
-__all__ = ["MockRepository"]
+__all__ = ["InMemoryKeyValueRepository", "MockRepository"]
@@ -0,0 +1,43 @@
+import asyncio
+
+from redis.asyncio import Redis
+
+from dino_seedwork_be.implementation.adapter.storage.key_value.AsyncRedisRepository import \
+    AsyncRedisRepository
+
+
+async def client_of(a_repository: AsyncRedisRepository) -> Redis:
+    return a_repository.redis()
+
+
+class TestAsyncRedisRepository:
+    def test_a_client_per_running_loop(self):
+        given_client = Redis(host="localhost", max_connections=4, decode_responses=True)
+        repository = AsyncRedisRepository(given_client, "test")
+
+        first_client = asyncio.run(client_of(repository))
+        second_client = asyncio.run(client_of(repository))
+
+        assert first_client is given_client
+        assert second_client is not given_client
+        assert second_client.connection_pool is not given_client.connection_pool
+        assert second_client.connection_pool.max_connections == 4
+        assert second_client.connection_pool.connection_kwargs["decode_responses"]
+        assert list(repository._clients.values()) == [second_client]
+
+    async def test_one_client_on_a_loop(self):
+        repository = AsyncRedisRepository.from_url("redis://localhost:6379/0")
+
+        assert repository.redis() is repository.redis()
+
+    def test_close_releases_the_client_of_the_running_loop(self):
+        repository = AsyncRedisRepository.from_url("redis://localhost:6379/0")
+
+        async def use_then_close():
+            repository.redis()
+            await repository.close().awaitable()
+
+        asyncio.run(use_then_close())
+        asyncio.run(use_then_close())
+
+        assert repository._clients == {}
@@ -0,0 +1,36 @@
+import logging
+
+from dino_seedwork_be.adapters.logger.SimpleLogger import DomainLogger
+
+
+class TestDomainLogger:
+    def test_payload_not_built_when_info_disabled(self, caplog):
+        built = False
+
+        def payload():
+            nonlocal built
+            built = True
+            return "payload"
+
+        caplog.set_level(logging.WARNING)
+        DomainLogger("test").info_with_payload("Publish %s", payload, "event")
+
+        assert built is False
+        assert caplog.records == []
+
+    def test_payload_logged_lazily(self, caplog):
+        caplog.set_level(logging.INFO)
+        DomainLogger("test").info_with_payload(
+            "Publish %s", lambda: '{"name": "event"}', "event"
+        )
+
+        assert caplog.messages == ['[test] Publish event {"name": "event"}']
+
+    def test_payload_sampled_out(self, caplog):
+        caplog.set_level(logging.INFO)
+        logger = DomainLogger("test")
+        logger.set_payload_sample_rate(0)
+        logger.info_with_payload("Publish %s", lambda: '{"name": "event"}', "event")
+
+        assert caplog.messages == ["[test] Publish event"]
+        assert DomainLogger("other").payload_sample_rate() == 1.0
@@ -1,11 +1,18 @@
+import asyncio
 from datetime import datetime
-from typing import Any, List, Type
+from typing import Any, List, Optional, Type
 
-from returns.future import FutureResult, FutureSuccess
+import pytest
+from returns.future import FutureResult, FutureSuccess, future_safe
+from returns.io import IOFailure
+from returns.result import Failure
 
+from dino_seedwork_be.domain.DomainEvent import DomainEvent
 from dino_seedwork_be.domain.DomainEventPublisher import DomainEventPublisher
 from dino_seedwork_be.domain.DomainEventSubscriber import DomainEventSubscriber
-from dino_seedwork_be.utils.functional import return_v, throw_exception
+from dino_seedwork_be.exceptions import MainException
+from dino_seedwork_be.utils.functional import (return_v, throw_exception,
+                                               unwrap_future_result)
 
 from .TestableDomainEvent import (AnotherTestableDomainEvent,
                                   TestableDomainEvent)
@@ -86,3 +93,306 @@ class TestDomainEventPublisher:
 
         assert TestDomainEventPublisher.event_handled == True
         assert TestDomainEventPublisher.another_event_handled == False
+
+    async def test_domain_event_publisher_dispatch_index(self):
+        handled: List[str] = []
+
+        class RecordingSubscriber(DomainEventSubscriber):
+            def __init__(self, label: str, event_types: List[str] | str) -> None:
+                self._label = label
+                self._event_types = event_types
+
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                handled.append(f"{self._label}:{an_event.type()}")
+                return FutureSuccess(None)
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return self._event_types
+
+        publisher = DomainEventPublisher()
+        publisher.subscribe(RecordingSubscriber("first_wildcard", "*"))
+        publisher.subscribe(RecordingSubscriber("typed", "typed_event"))
+        publisher.subscribe(RecordingSubscriber("listed", ["typed_event", "other"]))
+        publisher.subscribe(RecordingSubscriber("last_wildcard", "*"))
+
+        await publisher.publish(DomainEvent(name="typed_event")).awaitable()
+        await publisher.publish(DomainEvent(name="other")).awaitable()
+        await publisher.publish(DomainEvent(name="unknown")).awaitable()
+
+        assert handled == [
+            "first_wildcard:typed_event",
+            "typed:typed_event",
+            "listed:typed_event",
+            "last_wildcard:typed_event",
+            "first_wildcard:other",
+            "listed:other",
+            "last_wildcard:other",
+            "first_wildcard:unknown",
+            "last_wildcard:unknown",
+        ]
+
+        publisher.set_subscribers([])
+        assert publisher.subscribers_of("typed_event") == []
+
+    async def test_domain_event_publisher_concurrent_fan_out(self):
+        handled: List[str] = []
+
+        class SlowSubscriber(DomainEventSubscriber):
+            def __init__(self, label: str, delay: float, is_ordered: bool) -> None:
+                self._label = label
+                self._delay = delay
+                self._is_ordered = is_ordered
+
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                async def handle():
+                    await asyncio.sleep(self._delay)
+                    handled.append(self._label)
+                    return self._label
+
+                return future_safe(handle)()
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return "*"
+
+            def is_order_sensitive(self) -> bool:
+                return self._is_ordered
+
+        publisher = DomainEventPublisher()
+        publisher.enable_concurrent_fan_out(concurrency_limit=5)
+        publisher.set_subscribers(
+            [
+                SlowSubscriber("slow", 0.1, False),
+                SlowSubscriber("first_ordered", 0.05, True),
+                SlowSubscriber("fast", 0.0, False),
+                SlowSubscriber("second_ordered", 0.0, True),
+            ]
+        )
+
+        result = await unwrap_future_result(
+            publisher.publish(DomainEvent(name="any_event"))
+        )
+
+        assert result == ("slow", "first_ordered", "fast", "second_ordered")
+        assert handled.index("fast") < handled.index("first_ordered")
+        assert handled.index("first_ordered") < handled.index("second_ordered")
+        assert handled[-1] == "slow"
+        assert publisher.is_lock() == False
+
+    async def test_domain_event_publisher_concurrent_fan_out_timeout(self):
+        class StuckSubscriber(DomainEventSubscriber):
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                return future_safe(asyncio.sleep)(1)
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return "*"
+
+        publisher = DomainEventPublisher()
+        publisher.enable_concurrent_fan_out(subscriber_timeout=0.01)
+        publisher.subscribe(StuckSubscriber())
+
+        result = await publisher.publish(DomainEvent(name="any_event")).awaitable()
+
+        match result:
+            case IOFailure(Failure(MainException() as error)):
+                assert error.code().unwrap() == "EVENT_SUBSCRIBER_TIMEOUT"
+            case _:
+                assert False, result
+
+    async def test_domain_event_publisher_explicit_zero_timeout(self):
+        class ImpatientSubscriber(DomainEventSubscriber):
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                return future_safe(asyncio.sleep)(0.01)
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return "*"
+
+            def timeout(self) -> Optional[float]:
+                return 0
+
+        publisher = DomainEventPublisher()
+        publisher.enable_concurrent_fan_out()
+        publisher.subscribe(ImpatientSubscriber())
+
+        result = await publisher.publish(DomainEvent(name="any_event")).awaitable()
+
+        match result:
+            case IOFailure(Failure(MainException() as error)):
+                assert error.code().unwrap() == "EVENT_SUBSCRIBER_TIMEOUT"
+            case _:
+                assert False, result
+
+    def test_domain_event_publisher_rejects_invalid_fan_out_settings(self):
+        publisher = DomainEventPublisher()
+
+        for settings in [
+            {"concurrency_limit": 0},
+            {"concurrency_limit": -1},
+            {"subscriber_timeout": -0.5},
+        ]:
+            with pytest.raises(ValueError):
+                publisher.enable_concurrent_fan_out(**settings)
+
+        assert not publisher.is_concurrent()
+
+    async def test_domain_event_publisher_concurrency_limit_spans_publishes(self):
+        running = 0
+        max_running = 0
+
+        class CountingSubscriber(DomainEventSubscriber):
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                async def handle():
+                    nonlocal running, max_running
+                    running += 1
+                    max_running = max(max_running, running)
+                    await asyncio.sleep(0.01)
+                    running -= 1
+
+                return future_safe(handle)()
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return "*"
+
+        publisher = DomainEventPublisher()
+        publisher.enable_concurrent_fan_out(concurrency_limit=2)
+        subscribers: List[DomainEventSubscriber] = [
+            CountingSubscriber() for _ in range(2)
+        ]
+
+        await asyncio.gather(
+            *[
+                publisher._fan_out(
+                    subscribers, lambda sub: sub.handle_event(test_event)
+                ).awaitable()
+                for _ in range(3)
+            ]
+        )
+
+        assert max_running == 2
+
+    async def test_domain_event_publisher_publish_all(self):
+        batches: List[List[str]] = []
+        handled: List[str] = []
+
+        class BatchSubscriber(DomainEventSubscriber):
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                assert False, "handle_events should be used for a batch"
+
+            def handle_events(
+                self, events: List[DomainEvent]
+            ) -> FutureResult[Any, Exception]:
+                batches.append([event.type() for event in events])
+                return FutureSuccess(None)
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return "*"
+
+        class SingleSubscriber(DomainEventSubscriber):
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                handled.append(an_event.type())
+                return FutureSuccess(None)
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return ["created", "deleted"]
+
+        publisher = DomainEventPublisher()
+        publisher.set_subscribers([BatchSubscriber(), SingleSubscriber()])
+
+        await unwrap_future_result(
+            publisher.publish_all(
+                [
+                    DomainEvent(name="created"),
+                    DomainEvent(name="updated"),
+                    DomainEvent(name="deleted"),
+                ]
+            )
+        )
+
+        assert batches == [["created", "updated", "deleted"]]
+        assert handled == ["created", "deleted"]
+        assert publisher.is_lock() == False
+
+    async def test_domain_event_publisher_publish_all_in_subscription_order(self):
+        calls: List[str] = []
+
+        class RecordingSubscriber(DomainEventSubscriber):
+            def __init__(self, label: str, event_type: str) -> None:
+                self.label = label
+                self.event_type = event_type
+
+            def handle_event(
+                self, an_event: DomainEvent
+            ) -> FutureResult[Any, Exception]:
+                calls.append(f"{self.label}:{an_event.type()}")
+                return FutureSuccess(None)
+
+            def event_type_subscribed(self) -> List[str] | str:
+                return self.event_type
+
+        publisher = DomainEventPublisher()
+        publisher.set_subscribers(
+            [
+                RecordingSubscriber("first", "deleted"),
+                RecordingSubscriber("second", "created"),
+                RecordingSubscriber("third", "*"),
+            ]
+        )
+
+        await unwrap_future_result(
+            publisher.publish_all(
+                [DomainEvent(name="created"), DomainEvent(name="deleted")]
+            )
+        )
+
+        assert calls == [
+            "first:deleted",
+            "second:created",
+            "third:created",
+            "third:deleted",
+        ]
+
+    async def test_domain_event_publisher_scope_per_task(self):
+        thread_publisher = DomainEventPublisher.instance()
+
+        async def request(label: str) -> List[str]:
+            handled: List[str] = []
+
+            class RequestSubscriber(DomainEventSubscriber):
+                def handle_event(
+                    self, an_event: DomainEvent
+                ) -> FutureResult[Any, Exception]:
+                    async def handle():
+                        await asyncio.sleep(0.01)
+                        handled.append(f"{label}:{an_event.type()}")
+
+                    return future_safe(handle)()
+
+                def event_type_subscribed(self) -> List[str] | str:
+                    return "*"
+
+            with DomainEventPublisher.scope() as publisher:
+                assert publisher is DomainEventPublisher.instance()
+                assert publisher is not thread_publisher
+                publisher.subscribe(RequestSubscriber())
+                await unwrap_future_result(
+                    DomainEventPublisher.instance().publish(DomainEvent(name=label))
+                )
+            return handled
+
+        results = await asyncio.gather(request("first"), request("second"))
+
+        assert results == [["first:first"], ["second:second"]]
+        assert DomainEventPublisher.instance() is thread_publisher
@@ -1,11 +1,19 @@
+from importlib.util import find_spec
 from uuid import uuid4
 
+import pytest
+
 from dino_seedwork_be.domain.DomainEvent import DomainEvent
 from dino_seedwork_be.domain.event.EventSerializer import EventSerializer
 from dino_seedwork_be.domain.value_object.UUID import UUID
+from dino_seedwork_be.serializer import (JSONEventCodec, MsgPackEventCodec,
+                                         OrJSONEventCodec)
 
 from .TestableDomainEvent import TestableDomainEvent
 
+is_orjson_installed = find_spec("orjson") is not None
+is_msgpack_installed = find_spec("msgpack") is not None
+
 
 class TestEventSerializer:
     def test_serialize(self):
@@ -32,3 +40,42 @@ class TestEventSerializer:
 
         assert deserialized_event.name() == "HaiChan"
         assert deserialized_event.props()["age"] == 12
+
+    @pytest.mark.skipif(not is_orjson_installed, reason="orjson is not installed")
+    def test_deserialize_untagged_json_body(self):
+        event_serializer = EventSerializer(OrJSONEventCodec())
+        legacy_body = JSONEventCodec().encode_body(
+            TestableDomainEvent(name="HaiChan", props={"age": 12}, id=10).as_dict()
+        )
+
+        deserialized_event = event_serializer.deserialize(legacy_body).unwrap()
+
+        assert legacy_body.startswith("{")
+        assert deserialized_event.name() == "HaiChan"
+
+    @pytest.mark.skipif(
+        not (is_orjson_installed and is_msgpack_installed),
+        reason="orjson or msgpack is not installed",
+    )
+    def test_serialize_with_tagged_codecs(self):
+        test_domain_event = TestableDomainEvent(
+            name="HaiChan", props={"age": 12}, id=10
+        )
+        for codec in [OrJSONEventCodec(), MsgPackEventCodec()]:
+            event_serializer = EventSerializer(codec)
+            serialized_event = event_serializer.serialize(test_domain_event).unwrap()
+            deserialized_event = EventSerializer.instance().deserialize(
+                serialized_event
+            )
+
+            assert serialized_event.startswith(codec.name() + ":")
+            assert deserialized_event.map(DomainEvent.as_dict).unwrap() == (
+                EventSerializer.instance()
+                .serialize(test_domain_event)
+                .bind(EventSerializer.instance().deserialize)
+                .map(DomainEvent.as_dict)
+                .unwrap()
+            )
+
+    def test_deserialize_unknown_codec(self):
+        assert EventSerializer.instance().deserialize("unknown:{}").failure()
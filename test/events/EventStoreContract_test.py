@@ -4,10 +4,14 @@ from returns.pipeline import flow
 from returns.pointfree import bind, map_
 
 from dino_seedwork_be.domain.event.EventStore import EventStore
+from dino_seedwork_be.domain.event.EventStoreSubscriber import \
+    EventStoreSubscriber
 from dino_seedwork_be.utils.functional import (assert_equal,
+                                               unwrap_future_result,
                                                unwrap_future_result_io)
 
 from .MockEventStore import MockEventStore
+from .TestableDomainEvent import TestableDomainEvent
 
 
 class TestEventStoreContract:
@@ -39,6 +43,39 @@ class TestEventStoreContract:
             tap(partial(assert_equal, 10))
         ).awaitable()
 
+    async def test_append_all(self):
+        event_store = self.event_store()
+        count_event = await unwrap_future_result(event_store.count_events())
+        events = [TestableDomainEvent(f"appended {idx}") for idx in range(3)]
+
+        await unwrap_future_result(
+            EventStoreSubscriber(event_store).handle_events(events)
+        )
+
+        stored_events = await unwrap_future_result(
+            event_store.all_stored_events_since(count_event)
+        )
+        assert [
+            stored_event.to_domain_event().unwrap().name()
+            for stored_event in stored_events
+        ] == ["appended 0", "appended 1", "appended 2"]
+
+    async def test_stream_stored_events_since(self):
+        event_store = self.event_store()
+        count_event = await unwrap_future_result(event_store.count_events())
+
+        pages = [
+            page
+            async for page in event_store.stream_stored_events_since(
+                count_event - 20, 8
+            )
+        ]
+
+        assert [len(page) for page in pages] == [8, 8, 4]
+        assert [
+            stored_event.id().unwrap() for page in pages for stored_event in page
+        ] == list(range(count_event - 19, count_event + 1))
+
     def event_store(self) -> EventStore:
         event_store = MockEventStore()
         assert event_store is not None
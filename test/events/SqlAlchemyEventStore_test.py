@@ -0,0 +1,163 @@
+from datetime import datetime
+from test.events.TestableDomainEvent import TestableDomainEvent
+from types import SimpleNamespace
+from typing import Any, List
+
+from returns.io import IOFailure
+from sqlalchemy.orm import declarative_base
+
+from dino_seedwork_be.implementation.event.sqlalchemy.SqlAlchemyEventStore import (
+    SqlAlchemyBaseEvent, SqlAlchemyEventStore)
+from dino_seedwork_be.utils.functional import unwrap_future_result
+
+Base: Any = declarative_base()
+
+
+class EventStoreModel(Base, SqlAlchemyBaseEvent):
+    pass
+
+
+class RecordingSession:
+    calls: List[str]
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def add(self, _):
+        self.calls.append("add")
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+
+class RowsSession:
+    pages: List[List[tuple]]
+    params: List[dict]
+
+    def __init__(self, *pages: List[tuple]) -> None:
+        self.pages = list(pages)
+        self.params = []
+
+    async def execute(self, stmt):
+        self.params.append(stmt.compile().params)
+        rows = self.pages.pop(0)
+        return SimpleNamespace(all=lambda: rows)
+
+
+class InsertSession(RecordingSession):
+    returned_ids: List[int]
+    is_failing: bool
+
+    def __init__(self, returned_ids: List[int], is_failing: bool = False) -> None:
+        super().__init__()
+        self.returned_ids = returned_ids
+        self.is_failing = is_failing
+
+    async def execute(self, stmt):
+        self.calls.append("execute")
+        if self.is_failing:
+            raise RuntimeError("insert failed")
+        values = stmt.compile().params
+        rows = [
+            (an_id, values[f"type_name_m{idx}"], values[f"body_m{idx}"])
+            for idx, an_id in enumerate(self.returned_ids)
+        ]
+        return SimpleNamespace(all=lambda: list(reversed(rows)))
+
+
+def event_rows(ids: List[int]) -> List[tuple]:
+    return [(an_id, datetime.now(), "name", "{}") for an_id in ids]
+
+
+class TestSqlAlchemyEventStore:
+    async def test_append_commits(self):
+        session = RecordingSession()
+        event_store = SqlAlchemyEventStore(EventStoreModel)
+        event_store.set_session(session)
+
+        await unwrap_future_result(event_store.append(TestableDomainEvent("name")))
+
+        assert session.calls == ["add", "commit"]
+
+    async def test_append_in_outbox_mode_only_stages(self):
+        session = RecordingSession()
+        event_store = SqlAlchemyEventStore(EventStoreModel, is_outbox=True)
+
+        await unwrap_future_result(
+            event_store.bound_to(session).append(TestableDomainEvent("name"))
+        )
+
+        assert session.calls == ["add"]
+
+    async def test_stream_stored_events_since_reads_keyset_pages(self):
+        session = RowsSession(event_rows([3, 4]), event_rows([5]))
+        event_store = SqlAlchemyEventStore(EventStoreModel, page_size=2)
+        event_store.set_session(session)
+
+        pages = [page async for page in event_store.stream_stored_events_since(2)]
+
+        assert [
+            [stored_event.id().unwrap() for stored_event in page] for page in pages
+        ] == [[3, 4], [5]]
+        assert [params["id_1"] for params in session.params] == [2, 4]
+
+    async def test_all_stored_events_between_caps_the_range_read(self):
+        session = RowsSession(event_rows([2, 3]))
+        event_store = SqlAlchemyEventStore(EventStoreModel, max_batch_size=2)
+        event_store.set_session(session)
+
+        stored_events = await unwrap_future_result(
+            event_store.all_stored_events_between(2, 9, 100)
+        )
+
+        assert [stored_event.id().unwrap() for stored_event in stored_events] == [2, 3]
+        assert session.params == [{"id_1": 2, "id_2": 9, "param_1": 2}]
+
+    async def test_all_stored_events_between_honors_a_zero_limit(self):
+        session = RowsSession([])
+        event_store = SqlAlchemyEventStore(EventStoreModel, max_batch_size=2)
+        event_store.set_session(session)
+
+        stored_events = await unwrap_future_result(
+            event_store.all_stored_events_between(2, 9, 0)
+        )
+
+        assert stored_events == []
+        assert session.params == [{"id_1": 2, "id_2": 9, "param_1": 0}]
+
+    async def test_append_all_matches_returned_ids_to_events(self):
+        session = InsertSession([7, 8, 9])
+        event_store = SqlAlchemyEventStore(EventStoreModel)
+        event_store.set_session(session)
+        events = [TestableDomainEvent(f"appended {idx}") for idx in range(3)]
+
+        stored_events = await unwrap_future_result(event_store.append_all(events))
+
+        assert [
+            (stored_event.id().unwrap(), stored_event.to_domain_event().unwrap().name())
+            for stored_event in stored_events
+        ] == [(7, "appended 0"), (8, "appended 1"), (9, "appended 2")]
+        assert session.calls == ["execute", "commit"]
+
+    async def test_append_all_rolls_back_a_failed_insert(self):
+        session = InsertSession([], is_failing=True)
+        event_store = SqlAlchemyEventStore(EventStoreModel)
+        event_store.set_session(session)
+
+        result = await event_store.append_all([TestableDomainEvent("name")]).awaitable()
+
+        assert isinstance(result, IOFailure)
+        assert session.calls == ["execute", "rollback"]
+
+    async def test_append_all_in_outbox_mode_leaves_the_commit(self):
+        session = InsertSession([1])
+        event_store = SqlAlchemyEventStore(EventStoreModel, is_outbox=True)
+
+        await unwrap_future_result(
+            event_store.bound_to(session).append_all([TestableDomainEvent("name")])
+        )
+
+        assert session.calls == ["execute"]
@@ -0,0 +1,87 @@
+"""
+Rows per second of an event store replay, hydrating ORM entities into
+validated StoredEvents (before) versus selecting the event columns into
+trusted StoredEvents (after).
+
+    python -m test.events.event_store_replay_benchmark [number_of_events]
+"""
+import sys
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Callable, List
+
+from returns.maybe import Some
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session, declarative_base
+
+from dino_seedwork_be.domain.event.StoredEvent import StoredEvent
+from dino_seedwork_be.implementation.event.sqlalchemy.SqlAlchemyEventStore import \
+    SqlAlchemyBaseEvent
+
+Base: Any = declarative_base()
+
+
+class EventStoreModel(Base, SqlAlchemyBaseEvent):
+    pass
+
+
+def replay_entities(session: Session) -> List[StoredEvent]:
+    rows = session.execute(select(EventStoreModel)).scalars().all()
+    return [
+        StoredEvent(
+            id=Some(row.id),
+            occurred_on=row.occurred_on,
+            type_name=row.type_name,
+            body=row.body,
+        )
+        for row in rows
+    ]
+
+
+def replay_columns(session: Session) -> List[StoredEvent]:
+    rows = session.execute(
+        select(
+            EventStoreModel.id,
+            EventStoreModel.occurred_on,
+            EventStoreModel.type_name,
+            EventStoreModel.body,
+        )
+    ).all()
+    return [
+        StoredEvent.trusted(body, occurred_on, type_name, an_id)
+        for an_id, occurred_on, type_name, body in rows
+    ]
+
+
+def rows_per_second(
+    session: Session, replay: Callable[[Session], List[StoredEvent]]
+) -> float:
+    session.expunge_all()
+    started_at = perf_counter()
+    number_of_events = len(replay(session))
+    return number_of_events / (perf_counter() - started_at)
+
+
+def main(number_of_events: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(
+            insert(EventStoreModel),
+            [
+                {
+                    "occurred_on": datetime.now(),
+                    "type_name": "benchmark_event",
+                    "body": '{"name": "benchmark_event", "props": {"idx": %d}}' % idx,
+                }
+                for idx in range(number_of_events)
+            ],
+        )
+        session.commit()
+        print("replay of %d events" % number_of_events)
+        print("entities: %.0f rows/s" % rows_per_second(session, replay_entities))
+        print("columns:  %.0f rows/s" % rows_per_second(session, replay_columns))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,107 @@
+from typing import Any, Callable, List, Tuple
+
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq.BatchedAcknowledger import \
+    BatchedAcknowledger
+
+
+class RecordingChannel:
+    is_open: bool = True
+
+    def __init__(self) -> None:
+        self.frames: List[Tuple] = []
+
+    def basic_ack(self, delivery_tag: int, multiple: bool):
+        self.frames.append(("ack", delivery_tag, multiple))
+
+    def basic_nack(self, delivery_tag: int, multiple: bool, requeue: bool):
+        self.frames.append(("nack", delivery_tag, multiple, requeue))
+
+
+class ManualSchedule:
+    def __init__(self) -> None:
+        self.callbacks: List[Tuple[float, Callable[[], Any]]] = []
+
+    def __call__(self, a_delay: float, a_callback: Callable[[], Any]):
+        self.callbacks.append((a_delay, a_callback))
+
+    def run_due(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for _, callback in callbacks:
+            callback()
+
+
+def acknowledger_of(
+    a_batch_size: int, *delivery_tags: int
+) -> Tuple[BatchedAcknowledger, RecordingChannel, ManualSchedule]:
+    channel = RecordingChannel()
+    schedule = ManualSchedule()
+    acknowledger = BatchedAcknowledger(channel, a_batch_size, 0.5, schedule)  # type: ignore
+    for delivery_tag in delivery_tags:
+        acknowledger.track(delivery_tag)
+    return acknowledger, channel, schedule
+
+
+class TestBatchedAcknowledger:
+    def test_a_full_batch_is_acked_with_a_single_multiple_ack(self):
+        acknowledger, channel, _ = acknowledger_of(3, 1, 2, 3, 4)
+
+        for delivery_tag in [1, 2, 3, 4]:
+            acknowledger.ack(delivery_tag)
+
+        assert channel.frames == [("ack", 3, True)]
+        assert acknowledger.pending_ack_count() == 1
+
+    def test_acks_wait_for_the_deliveries_before_them(self):
+        acknowledger, channel, _ = acknowledger_of(2, 1, 2, 3)
+
+        acknowledger.ack(3)
+        acknowledger.ack(2)
+        assert channel.frames == []
+
+        acknowledger.ack(1)
+        assert channel.frames == [("ack", 3, True)]
+        assert acknowledger.unresolved_count() == 0
+
+    def test_nacks_are_sent_at_once_and_never_acked(self):
+        acknowledger, channel, _ = acknowledger_of(2, 1, 2, 3, 4)
+
+        acknowledger.ack(1)
+        acknowledger.nack(2, True)
+        acknowledger.nack(4, False)
+        acknowledger.ack(3)
+
+        assert channel.frames == [
+            ("nack", 2, False, True),
+            ("nack", 4, False, False),
+            ("ack", 3, True),
+        ]
+
+    def test_a_range_of_nacks_only_acks_nothing(self):
+        acknowledger, channel, schedule = acknowledger_of(2, 1, 2)
+
+        acknowledger.nack(1, False)
+        acknowledger.nack(2, False)
+        schedule.run_due()
+        acknowledger.flush()
+
+        assert channel.frames == [("nack", 1, False, False), ("nack", 2, False, False)]
+
+    def test_pending_acks_are_flushed_once_due(self):
+        acknowledger, channel, schedule = acknowledger_of(10, 1, 2)
+
+        acknowledger.ack(1)
+        acknowledger.ack(2)
+        assert [delay for delay, _ in schedule.callbacks] == [0.5]
+
+        schedule.run_due()
+        assert channel.frames == [("ack", 2, True)]
+        assert acknowledger.pending_ack_count() == 0
+
+    def test_nothing_is_flushed_on_a_closed_channel(self):
+        acknowledger, channel, schedule = acknowledger_of(10, 1)
+
+        acknowledger.ack(1)
+        channel.is_open = False
+        schedule.run_due()
+
+        assert channel.frames == []
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from returns.maybe import Nothing, Some
+
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq import (
+    MessageException, RabbitMQConfirmWindow)
+
+
+def window_of(number_of_messages: int, max_in_flight: int = 10):
+    window = RabbitMQConfirmWindow(max_in_flight, 1)
+    for delivery_tag in range(1, number_of_messages + 1):
+        window.track(1, delivery_tag, delivery_tag * 10)
+    return window
+
+
+class TestConfirmWindow:
+    def test_confirmed_id_is_contiguous(self):
+        window = window_of(4)
+
+        window.resolve(1, 2, False, True)
+        assert window.confirmed_id() == Nothing
+
+        window.resolve(1, 1, False, True)
+        assert window.confirmed_id() == Some(20)
+
+        window.resolve(1, 4, False, True)
+        assert window.confirmed_id() == Some(20)
+        assert window.in_flight_count() == 2
+
+    def test_multiple_ack_resolves_previous_tags_of_its_channel(self):
+        window = window_of(3)
+        window.track(2, 1, 40)
+
+        window.resolve(1, 3, True, True)
+
+        assert window.confirmed_id() == Some(30)
+        assert window.in_flight_count() == 1
+
+    def test_nack_stops_the_confirmed_id(self):
+        window = window_of(3)
+
+        window.resolve(1, 2, False, False)
+        window.resolve(1, 3, True, True)
+
+        assert window.confirmed_id() == Some(10)
+        assert window.has_nack()
+
+    async def test_wait_for_space_until_confirmed(self):
+        window = window_of(2, max_in_flight=2)
+
+        waiting = asyncio.create_task(window.wait_for_space())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        window.resolve(1, 1, False, True)
+        await waiting
+
+        assert not window.is_full()
+
+    async def test_wait_until_drained_fails_on_nack(self):
+        window = window_of(1)
+        window.resolve(1, 1, False, False)
+
+        with pytest.raises(MessageException):
+            await window.wait_until_drained()
+
+    async def test_wait_until_drained_times_out(self):
+        window = RabbitMQConfirmWindow(10, 0.01)
+        window.track(1, 1, 10)
+
+        with pytest.raises(MessageException):
+            await window.wait_until_drained()
@@ -0,0 +1,56 @@
+from typing import Any, Callable, List, Tuple
+
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq.DeliveryBatcher import (
+    Delivery, DeliveryBatcher)
+
+
+class ManualSchedule:
+    def __init__(self) -> None:
+        self.callbacks: List[Tuple[float, Callable[[], Any]]] = []
+
+    def __call__(self, a_delay: float, a_callback: Callable[[], Any]):
+        self.callbacks.append((a_delay, a_callback))
+
+    def run_due(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for _, callback in callbacks:
+            callback()
+
+
+def batcher_of(
+    a_batch_size: int,
+) -> Tuple[DeliveryBatcher, List[List[Delivery]], ManualSchedule]:
+    batches: List[List[Delivery]] = []
+    schedule = ManualSchedule()
+    return (
+        DeliveryBatcher(a_batch_size, 0.05, schedule, batches.append),
+        batches,
+        schedule,
+    )
+
+
+class TestDeliveryBatcher:
+    def test_a_full_batch_is_handed_over_in_delivery_order(self):
+        batcher, batches, _ = batcher_of(3)
+
+        for body in [b"1", b"2", b"3", b"4"]:
+            batcher.add(None, None, None, body)  # type: ignore
+
+        assert [[delivery.body for delivery in batch] for batch in batches] == [
+            [b"1", b"2", b"3"]
+        ]
+        assert batcher.pending_count() == 1
+
+    def test_a_partial_batch_is_handed_over_once_due(self):
+        batcher, batches, schedule = batcher_of(3)
+
+        batcher.add(None, None, None, b"1")  # type: ignore
+        batcher.add(None, None, None, b"2")  # type: ignore
+        assert [delay for delay, _ in schedule.callbacks] == [0.05]
+
+        schedule.run_due()
+        schedule.run_due()
+
+        assert [[delivery.body for delivery in batch] for batch in batches] == [
+            [b"1", b"2"]
+        ]
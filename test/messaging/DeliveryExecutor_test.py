@@ -0,0 +1,59 @@
+from threading import Event, Lock
+from time import sleep
+from typing import List
+
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq.DeliveryExecutor import \
+    DeliveryExecutor
+
+
+class TestDeliveryExecutor:
+    def test_deliveries_run_concurrently(self):
+        delivery_executor = DeliveryExecutor(2)
+        first_started = Event()
+        second_done = Event()
+
+        def first():
+            first_started.set()
+            assert second_done.wait(1)
+
+        delivery_executor.submit("a", first)
+        assert first_started.wait(1)
+        delivery_executor.submit("a", second_done.set)
+        delivery_executor.shutdown()
+
+        assert second_done.is_set()
+
+    def test_deliveries_of_a_key_run_in_order(self):
+        delivery_executor = DeliveryExecutor(4, is_serial_per_key=True)
+        handled: List[str] = []
+        lock = Lock()
+
+        def handle(a_name: str):
+            sleep(0.001)
+            with lock:
+                handled.append(a_name)
+
+        for idx in range(20):
+            for key in ["a", "b"]:
+                delivery_executor.submit(key, lambda name=f"{key}{idx}": handle(name))
+        delivery_executor.shutdown()
+
+        assert [name for name in handled if name[0] == "a"] == [
+            f"a{idx}" for idx in range(20)
+        ]
+        assert [name for name in handled if name[0] == "b"] == [
+            f"b{idx}" for idx in range(20)
+        ]
+
+    def test_failed_delivery_does_not_stop_its_lane(self):
+        delivery_executor = DeliveryExecutor(1, is_serial_per_key=True)
+        handled = Event()
+
+        def fail():
+            raise ValueError("failed")
+
+        delivery_executor.submit("a", fail)
+        delivery_executor.submit("a", handled.set)
+        delivery_executor.shutdown()
+
+        assert handled.is_set()
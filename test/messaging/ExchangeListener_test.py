@@ -5,6 +5,7 @@ from uuid import uuid4
 import pytest
 from redis import Redis
 from returns.future import FutureResult, FutureSuccess
+from returns.pipeline import is_successful
 
 from dino_seedwork_be.adapters.messaging.notification.EventHandlingTracker import \
     EventHandlingTracker
@@ -169,3 +170,36 @@ class TestExchangeListener:
         await unwrap_future_result(
             redis_notification_tracker.unmark_notif_as_handled(message_id)
         )
+
+    async def test_idempotent_dispatch_many_dispatches_each_unhandled_message_once(
+        self, mock_notification_tracker: MockEventHandlingTracker
+    ):
+        dispatch_count = 0
+
+        def cb():
+            nonlocal dispatch_count
+            dispatch_count += 1
+
+        mock_listener = MockListener(cb, mock_notification_tracker)
+
+        handled_id = f"mock_message_id_{uuid4()}"
+        first_id = f"mock_message_id_{uuid4()}"
+        second_id = f"mock_message_id_{uuid4()}"
+        mock_notification_tracker._store[handled_id] = True
+
+        results = await unwrap_future_result(
+            mock_listener.itempotent_handle_dispatch_many(
+                [
+                    (first_id, "mock_type_message", b"mock_content"),
+                    (handled_id, "mock_type_message", b"mock_content"),
+                    (first_id, "mock_type_message", b"mock_content"),
+                    (second_id, "mock_type_message", b"mock_content"),
+                ]
+            )
+        )
+
+        assert all(is_successful(result) for result in results)
+        assert len(results) == 4
+        assert dispatch_count == 2
+        assert mock_notification_tracker._store[first_id] == True
+        assert mock_notification_tracker._store[second_id] == True
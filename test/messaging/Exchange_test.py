@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from pika.exchange_type import ExchangeType
+
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq import (
+    RabbitMQConnectionSettings, RabbitMQExchange)
+
+
+def exchange_with_channels(number_of_channels: int) -> RabbitMQExchange:
+    exchange = RabbitMQExchange(
+        RabbitMQConnectionSettings(
+            "localhost", 5672, "/", None, None, a_channel_pool_size=number_of_channels
+        ),
+        "exchange",
+        ExchangeType.topic,
+        True,
+    )
+    channels = [
+        SimpleNamespace(channel_number=number, is_open=True)
+        for number in range(1, number_of_channels + 1)
+    ]
+    exchange.set_channel(channels[0])
+    exchange._pooled_channels = channels[1:]
+    return exchange
+
+
+class TestExchange:
+    def test_channel_for_a_routing_key_is_stable(self):
+        exchange = exchange_with_channels(4)
+        routing_keys = [f"event_{idx}" for idx in range(50)]
+
+        channels = [exchange.channel_for(key).unwrap() for key in routing_keys]
+
+        assert channels == [exchange.channel_for(key).unwrap() for key in routing_keys]
+        assert {channel.channel_number for channel in channels} == {1, 2, 3, 4}
+
+    def test_single_channel_exchange_publishes_through_its_channel(self):
+        exchange = exchange_with_channels(1)
+
+        assert exchange.channel_for("event").unwrap() is exchange.channel().unwrap()
+
+    def test_channel_is_open_when_all_pooled_channels_are(self):
+        exchange = exchange_with_channels(3)
+        assert exchange.is_channel_open()
+
+        exchange._pooled_channels[0].is_open = False
+
+        assert not exchange.is_channel_open()
@@ -0,0 +1,74 @@
+from typing import Any, List
+
+from returns.result import Success
+
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq.MessageConsumer import \
+    MessageConsumer
+
+
+class QosChannel:
+    prefetch_counts: List[int]
+
+    def __init__(self) -> None:
+        self.prefetch_counts = []
+
+    def basic_qos(self, prefetch_count: int, callback: Any):
+        self.prefetch_counts.append(prefetch_count)
+
+
+class FakeQueue:
+    def __init__(self, a_channel: QosChannel) -> None:
+        self._channel = a_channel
+
+    def channel(self):
+        return Success(self._channel)
+
+
+class TestMessageConsumer:
+    def test_tuned_factory_takes_int_intervals(self):
+        channel = QosChannel()
+
+        consumer = MessageConsumer.tuned_factory(
+            FakeQueue(channel),
+            False,
+            prefetch_count=20,
+            ack_batch_size=10,
+            ack_flush_interval=1,
+        ).unwrap()
+
+        assert consumer.prefetch_count() == 20
+        assert consumer.ack_batch_size() == 10
+        assert consumer.is_ack_batched()
+        assert channel.prefetch_counts == [20]
+
+    def test_ack_batch_size_is_clamped_to_the_prefetch_count(self):
+        consumer = MessageConsumer(
+            FakeQueue(QosChannel()), False, prefetch_count=5, ack_batch_size=50
+        )
+
+        assert consumer.ack_batch_size() == 5
+
+    def test_ack_batch_size_is_kept_without_a_prefetch_limit(self):
+        consumer = MessageConsumer(
+            FakeQueue(QosChannel()), False, prefetch_count=0, ack_batch_size=50
+        )
+
+        assert consumer.ack_batch_size() == 50
+
+    def test_tuned_factory_takes_an_int_delivery_batch_interval(self):
+        consumer = MessageConsumer.tuned_factory(
+            FakeQueue(QosChannel()),
+            False,
+            prefetch_count=20,
+            delivery_batch_size=10,
+            delivery_batch_interval=1,
+        ).unwrap()
+
+        assert consumer.delivery_batch_size() == 10
+
+    def test_delivery_batch_size_is_clamped_to_the_prefetch_count(self):
+        consumer = MessageConsumer(
+            FakeQueue(QosChannel()), False, prefetch_count=5, delivery_batch_size=50
+        )
+
+        assert consumer.delivery_batch_size() == 5
@@ -0,0 +1,293 @@
+from datetime import datetime
+from test.events.MockEventStore import MockEventStore
+from time import monotonic
+from typing import Any, Callable, List, Optional, Tuple
+
+from pika.exchange_type import ExchangeType
+from returns.future import FutureFailure, FutureResult, FutureSuccess
+from returns.io import IOFailure
+from returns.maybe import Maybe, Nothing, Some
+from returns.pipeline import is_successful
+from returns.result import Failure, Success
+
+from dino_seedwork_be.adapters.messaging.notification import (
+    Notification, NotificationSerializer, PublishedNotificationTracker,
+    PublishedNotificationTrackerStore)
+from dino_seedwork_be.domain.DomainEvent import DomainEvent
+from dino_seedwork_be.domain.event.EventSerializer import EventSerializer
+from dino_seedwork_be.domain.event.StoredEvent import StoredEvent
+from dino_seedwork_be.exceptions import MainException
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq import (
+    RabbitMQConfirmWindow, RabbitMQConnectionSettings, RabbitMQMessageProducer)
+from dino_seedwork_be.implementation.adapter.messaging.rabbitmq.RabbitMQPublisher import \
+    RabbitMQPublisher
+from dino_seedwork_be.serializer import MsgPackEventCodec
+from dino_seedwork_be.utils.functional import unwrap_future_result
+
+
+class RecordingMessageProducer:
+    messages: List[Tuple[str, str]]
+    window: Optional[RabbitMQConfirmWindow]
+
+    def __init__(self, window: Optional[RabbitMQConfirmWindow] = None) -> None:
+        self.messages = []
+        self.window = window
+
+    def confirm_window(self) -> Maybe[RabbitMQConfirmWindow]:
+        return Maybe.from_optional(self.window)
+
+    def send(self, _, a_message: str, a_routing_key: str):
+        self.messages.append((a_routing_key, a_message))
+        return Success(None)
+
+    def send_confirmed(self, _, a_message: str, a_routing_key: str, an_id: int):
+        self.window.track(1, len(self.messages) + 1, an_id)
+        return FutureResult.from_result(self.send(_, a_message, a_routing_key))
+
+
+class RunOnceMessageProducer:
+    run_count: int
+
+    def __init__(self, on_run) -> None:
+        self.run_count = 0
+        self.on_run = on_run
+
+    def run(self):
+        self.run_count += 1
+        self.on_run()
+
+
+class PendingIOLoop:
+    callbacks: List[Callable[[], Any]]
+
+    def __init__(self) -> None:
+        self.callbacks = []
+
+    def add_callback_threadsafe(self, a_callback: Callable[[], Any]):
+        self.callbacks.append(a_callback)
+
+    def run_pending(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class FakeExchange:
+    is_closed: bool
+    is_ready: bool
+    close_count: int
+    ioloop: PendingIOLoop
+
+    def __init__(self, is_ready: bool) -> None:
+        self.is_closed = False
+        self.is_ready = is_ready
+        self.close_count = 0
+        self.ioloop = PendingIOLoop()
+
+    def connection(self):
+        return self
+
+    def is_exchange_ready(self) -> bool:
+        return self.is_ready
+
+    def is_connection_open(self) -> bool:
+        return not self.is_closed
+
+    def is_connection_closed(self) -> bool:
+        return self.is_closed
+
+    def is_channel_open(self) -> bool:
+        return not self.is_closed
+
+    def close(self):
+        self.close_count += 1
+        self.is_closed = True
+
+
+class RecordingTrackerStore(PublishedNotificationTrackerStore):
+    tracked_ids: List[Maybe[int]]
+
+    def __init__(self) -> None:
+        self.tracked_ids = []
+
+    def track_most_recent_published_notification_id(
+        self, a_tracker: PublishedNotificationTracker, a_notification_id: Maybe[int]
+    ):
+        self.tracked_ids.append(a_notification_id)
+        return FutureSuccess(a_notification_id)
+
+    def set_session(self, _: Any):
+        pass
+
+
+def publisher(is_pass_through: bool, event_serializer: EventSerializer):
+    return RabbitMQPublisher(
+        MockEventStore(),
+        "exchange",
+        ExchangeType.topic,
+        RecordingTrackerStore(),
+        event_serializer,
+        RabbitMQConnectionSettings("localhost", 5672, "/", None, None),
+        is_pass_through=is_pass_through,
+    )
+
+
+def stored_event_of(an_id: int, event_serializer: EventSerializer) -> StoredEvent:
+    domain_event = DomainEvent(
+        name="TestEvent",
+        occurred_on=datetime(2023, 1, 2, 3, 4, 5),
+        props={"name": "haichan", "tags": [1, 2]},
+    )
+    return StoredEvent.trusted(
+        event_serializer.serialize(domain_event).unwrap(),
+        domain_event.occurred_on(),
+        domain_event.type(),
+        an_id,
+    )
+
+
+def notification_of(a_stored_event: StoredEvent) -> str:
+    return (
+        a_stored_event.to_domain_event()
+        .map(lambda event: Notification(a_stored_event.id().unwrap(), event))
+        .bind(NotificationSerializer.instance().serialize)
+        .unwrap()
+    )
+
+
+class TestRabbitMQPublisher:
+    async def test_pass_through_publish_frames_the_stored_bodies(self):
+        event_serializer = EventSerializer.instance()
+        a_publisher = publisher(True, event_serializer)
+        producer = RecordingMessageProducer()
+        stored_events = [stored_event_of(an_id, event_serializer) for an_id in [4, 5]]
+
+        await unwrap_future_result(
+            a_publisher._publish_page(
+                producer,
+                PublishedNotificationTracker.factory(type_name="topic").unwrap(),
+                stored_events,
+            )
+        )
+
+        assert producer.messages == [
+            ("TestEvent", notification_of(stored_event))
+            for stored_event in stored_events
+        ]
+        assert a_publisher.published_notif_tracker_store().tracked_ids == [
+            stored_events[-1].id()
+        ]
+
+    def test_pass_through_frame_of_binary_body(self):
+        event_serializer = EventSerializer(MsgPackEventCodec())
+        stored_event = stored_event_of(4, event_serializer)
+
+        frame = publisher(True, event_serializer)._pass_through_frame(stored_event)
+
+        assert frame.unwrap() == notification_of(stored_event)
+
+    async def test_producer_is_kept_across_publish_cycles(self):
+        a_publisher = publisher(False, EventSerializer.instance())
+        exchange = FakeExchange(is_ready=False)
+        a_publisher._set_message_producer(RabbitMQMessageProducer(exchange))
+
+        for _ in range(2):
+            result = await a_publisher.publish_notifications().awaitable()
+            assert not is_successful(result)
+
+        assert exchange.close_count == 0
+        assert a_publisher._message_producer().unwrap().exchange() is exchange
+
+        a_publisher.close()
+
+        assert exchange.close_count == 0
+        exchange.ioloop.run_pending()
+        assert exchange.close_count == 1
+
+    async def test_only_run_builds_the_producer(self):
+        a_publisher = publisher(False, EventSerializer.instance())
+        built_count = 0
+
+        def build():
+            nonlocal built_count
+            built_count += 1
+            return Success(RabbitMQMessageProducer(FakeExchange(is_ready=True)))
+
+        a_publisher._build_message_producer = build
+
+        result = await a_publisher.publish_notifications().awaitable()
+
+        assert not is_successful(result)
+        assert a_publisher.is_ready() == Success(False)
+        assert built_count == 0
+
+        producer = a_publisher._producer_to_run().unwrap()
+        producer.exchange().close()
+        rebuilt_producer = a_publisher._producer_to_run().unwrap()
+
+        assert built_count == 2
+        assert rebuilt_producer is not producer
+        assert a_publisher._message_producer().unwrap() is rebuilt_producer
+        assert a_publisher.is_ready() == Success(True)
+
+        a_publisher.close()
+
+        assert not is_successful(a_publisher._producer_to_run())
+        assert built_count == 2
+
+    def test_run_backs_off_until_a_producer_is_built(self):
+        a_publisher = publisher(False, EventSerializer.instance())
+        a_publisher._reconnect_delay = 0.01
+        producer = RunOnceMessageProducer(a_publisher.close)
+        results = [
+            Failure(MainException("connection refused")),
+            Failure(MainException("connection refused")),
+            Success(producer),
+        ]
+        a_publisher._build_message_producer = lambda: results.pop(0)
+
+        started_at = monotonic()
+        a_publisher.run()
+
+        assert monotonic() - started_at >= 0.03
+        assert results == []
+        assert producer.run_count == 1
+
+    async def test_tracking_failure_does_not_hide_the_publish_failure(self):
+        a_publisher = publisher(False, EventSerializer.instance())
+        producer = RecordingMessageProducer(RabbitMQConfirmWindow(10))
+        publish_error = MainException("publish failed")
+        a_publisher._publish_page = lambda *_: FutureFailure(publish_error)
+        tracker_store = a_publisher.published_notif_tracker_store()
+        tracker_store.track_most_recent_published_notification_id = (
+            lambda *_: FutureFailure(MainException("track failed"))
+        )
+        tracker = PublishedNotificationTracker.factory(type_name="topic").unwrap()
+
+        result = await a_publisher._publish_pages(producer, tracker).awaitable()
+
+        assert result == IOFailure(publish_error)
+
+    async def test_confirm_mode_tracks_the_contiguously_confirmed_id(self):
+        event_serializer = EventSerializer.instance()
+        a_publisher = publisher(True, event_serializer)
+        window = RabbitMQConfirmWindow(10)
+        producer = RecordingMessageProducer(window)
+        stored_events = [
+            stored_event_of(an_id, event_serializer) for an_id in [4, 5, 6]
+        ]
+
+        tracker = PublishedNotificationTracker.factory(type_name="topic").unwrap()
+
+        await unwrap_future_result(
+            a_publisher._publish_page(producer, tracker, stored_events)
+        )
+        window.resolve(1, 1, False, True)
+        window.resolve(1, 3, False, True)
+        await unwrap_future_result(a_publisher._track_confirmed(tracker, window))
+
+        assert len(producer.messages) == 3
+        assert a_publisher.published_notif_tracker_store().tracked_ids == [
+            Nothing,
+            Some(4),
+        ]
@@ -0,0 +1,97 @@
+from test.mock.MockEventHandlingTracker import MockEventHandlingTracker
+from typing import List
+
+from returns.future import FutureResult, FutureSuccess
+
+from dino_seedwork_be.adapters.messaging.notification.BloomFilter import \
+    BloomFilter
+from dino_seedwork_be.adapters.messaging.notification.BloomFilteredEventHandlingTracker import \
+    BloomFilteredEventHandlingTracker
+from dino_seedwork_be.utils.functional import unwrap_future_result
+
+
+class CountingEventHandlingTracker(MockEventHandlingTracker):
+    looked_up_ids: List[str]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.looked_up_ids = []
+
+    def check_if_notif_handled(
+        self, a_message_id: str
+    ) -> FutureResult[bool, Exception]:
+        self.looked_up_ids.append(a_message_id)
+        return super().check_if_notif_handled(a_message_id)
+
+
+class TestBloomFilter:
+    def test_false_positive_rate_holds_at_capacity(self):
+        bloom_filter = BloomFilter(10_000, 0.01)
+        bloom_filter.add_all(str(idx) for idx in range(10_000))
+
+        assert all(bloom_filter.might_contain(str(idx)) for idx in range(10_000))
+        false_positive_count = sum(
+            bloom_filter.might_contain(str(idx)) for idx in range(10_000, 30_000)
+        )
+        assert false_positive_count / 20_000 < 0.02
+
+
+class TestBloomFilteredEventHandlingTracker:
+    async def test_unseen_message_is_not_looked_up_once_rebuilt(self):
+        tracker = CountingEventHandlingTracker()
+        filtered_tracker = BloomFilteredEventHandlingTracker(tracker, capacity=100)
+        await unwrap_future_result(filtered_tracker.rebuild([]))
+
+        await unwrap_future_result(filtered_tracker.mark_notif_as_handled("1"))
+
+        assert not await unwrap_future_result(
+            filtered_tracker.check_if_notif_handled("2")
+        )
+        assert await unwrap_future_result(filtered_tracker.check_if_notif_handled("1"))
+        assert tracker.looked_up_ids == ["1"]
+
+    async def test_every_message_is_looked_up_until_rebuilt(self):
+        tracker = CountingEventHandlingTracker()
+        filtered_tracker = BloomFilteredEventHandlingTracker(tracker, capacity=100)
+        tracker._store["1"] = True
+
+        assert await unwrap_future_result(filtered_tracker.check_if_notif_handled("1"))
+        assert tracker.looked_up_ids == ["1"]
+
+    async def test_rebuild_adds_the_handled_messages_of_the_tracker(self):
+        tracker = CountingEventHandlingTracker()
+        tracker._store.update({"1": True, "3": True})
+        filtered_tracker = BloomFilteredEventHandlingTracker(tracker, capacity=100)
+
+        await unwrap_future_result(
+            filtered_tracker.rebuild([str(idx) for idx in range(5)], a_chunk_size=2)
+        )
+        tracker.looked_up_ids.clear()
+
+        assert await unwrap_future_result(
+            filtered_tracker.check_many(["1", "2", "3"])
+        ) == [True, False, True]
+        assert "2" not in tracker.looked_up_ids
+
+    async def test_restart_rebuilds_from_the_redelivery_window(self):
+        tracker = CountingEventHandlingTracker()
+        filtered_tracker = BloomFilteredEventHandlingTracker(tracker, capacity=100)
+        await unwrap_future_result(filtered_tracker.rebuild([]))
+        await unwrap_future_result(filtered_tracker.mark_many(["3", "5"]))
+
+        restarted_tracker = CountingEventHandlingTracker()
+        restarted_tracker._store = tracker._store
+        restarted_filtered_tracker = BloomFilteredEventHandlingTracker(
+            restarted_tracker, capacity=100
+        )
+        await unwrap_future_result(restarted_filtered_tracker.rebuild_range(1, 6, 4))
+        restarted_tracker.looked_up_ids = []
+
+        assert restarted_filtered_tracker.is_rebuilt()
+        assert [
+            await unwrap_future_result(
+                restarted_filtered_tracker.check_if_notif_handled(str(an_id))
+            )
+            for an_id in range(1, 8)
+        ] == [False, False, True, False, True, False, False]
+        assert restarted_tracker.looked_up_ids == ["3", "5"]
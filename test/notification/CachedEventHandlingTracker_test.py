@@ -0,0 +1,57 @@
+from test.mock.MockEventHandlingTracker import MockEventHandlingTracker
+from time import sleep
+
+from dino_seedwork_be.adapters.messaging.notification.CachedEventHandlingTracker import \
+    CachedEventHandlingTracker
+from dino_seedwork_be.utils.functional import unwrap_future_result
+
+
+class TestCachedEventHandlingTracker:
+    async def test_marked_message_is_answered_from_the_cache(self):
+        tracker = MockEventHandlingTracker()
+        cached_tracker = CachedEventHandlingTracker(tracker)
+
+        await unwrap_future_result(cached_tracker.mark_notif_as_handled("1"))
+        tracker._store.clear()
+
+        assert await unwrap_future_result(cached_tracker.check_if_notif_handled("1"))
+        assert cached_tracker.hit_count() == 1
+        assert cached_tracker.miss_count() == 0
+
+    async def test_unhandled_message_is_never_cached(self):
+        tracker = MockEventHandlingTracker()
+        cached_tracker = CachedEventHandlingTracker(tracker)
+
+        assert not await unwrap_future_result(
+            cached_tracker.check_if_notif_handled("1")
+        )
+        tracker._store["1"] = True
+
+        assert await unwrap_future_result(cached_tracker.check_if_notif_handled("1"))
+        assert cached_tracker.miss_count() == 2
+
+    async def test_least_recently_used_message_is_evicted(self):
+        tracker = MockEventHandlingTracker()
+        cached_tracker = CachedEventHandlingTracker(tracker, max_size=2)
+
+        await unwrap_future_result(cached_tracker.mark_many(["1", "2"]))
+        await unwrap_future_result(cached_tracker.check_if_notif_handled("1"))
+        await unwrap_future_result(cached_tracker.mark_notif_as_handled("3"))
+        tracker._store.clear()
+
+        assert await unwrap_future_result(
+            cached_tracker.check_many(["1", "2", "3"])
+        ) == [True, False, True]
+        assert cached_tracker.size() == 2
+
+    async def test_cached_message_expires(self):
+        tracker = MockEventHandlingTracker()
+        cached_tracker = CachedEventHandlingTracker(tracker, expired_seconds=0.01)
+
+        await unwrap_future_result(cached_tracker.mark_notif_as_handled("1"))
+        tracker._store.clear()
+        sleep(0.02)
+
+        assert not await unwrap_future_result(
+            cached_tracker.check_if_notif_handled("1")
+        )
@@ -0,0 +1,49 @@
+from returns.maybe import Some
+
+from dino_seedwork_be.adapters.messaging.notification.KeyValueEventHandlingTracker import \
+    KeyValueEventHandlingTracker
+from dino_seedwork_be.utils.functional import unwrap_future_result
+from dino_seedwork_be.utils.test.InMemoryKeyValueRepository import \
+    InMemoryKeyValueRepository
+
+
+class TestKeyValueEventHandlingTracker:
+    async def test_check_many_answers_marked_messages(self):
+        tracker = KeyValueEventHandlingTracker(InMemoryKeyValueRepository())
+
+        await unwrap_future_result(tracker.mark_many(["1", "3"]))
+        await unwrap_future_result(tracker.unmark_notif_as_handled("3"))
+
+        assert await unwrap_future_result(tracker.check_many(["1", "2", "3"])) == [
+            True,
+            False,
+            False,
+        ]
+        assert await unwrap_future_result(tracker.check_if_notif_handled("1")) is True
+
+    async def test_marks_expire_after_expired_seconds(self):
+        key_value_repository = InMemoryKeyValueRepository()
+        tracker = KeyValueEventHandlingTracker(key_value_repository, expired_seconds=60)
+
+        await unwrap_future_result(tracker.mark_notif_as_handled("1"))
+
+        assert await unwrap_future_result(
+            key_value_repository.ttl("notification_tracker_1")
+        ) == Some(60)
+
+    async def test_compact_tracker_marks_numeric_ids_as_bits_of_segments(self):
+        key_value_repository = InMemoryKeyValueRepository()
+        tracker = KeyValueEventHandlingTracker(
+            key_value_repository, is_compact=True, segment_size=10
+        )
+
+        await unwrap_future_result(tracker.mark_many(["3", "12", "not-numeric"]))
+        await unwrap_future_result(tracker.mark_notif_as_handled("19"))
+        await unwrap_future_result(tracker.unmark_notif_as_handled("12"))
+
+        assert await unwrap_future_result(
+            tracker.check_many(["not-numeric", "3", "4", "12", "19", "other"])
+        ) == [True, True, False, False, True, False]
+        assert await unwrap_future_result(
+            key_value_repository.get_bits("notification_tracker_bitmap_1", [2, 9])
+        ) == [False, True]
@@ -1,10 +1,13 @@
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID as UUIDRaw
 
 from dino_seedwork_be.adapters.messaging.notification.Notification import \
     Notification
 from dino_seedwork_be.adapters.messaging.notification.NotificationSerializer import \
     NotificationSerializer
 from dino_seedwork_be.domain.DomainEvent import DomainEvent
+from dino_seedwork_be.domain.value_object.UUID import UUID
 from dino_seedwork_be.utils.functional import unwrap
 
 
@@ -24,3 +27,33 @@ class TestNotificationSerializer:
         assert restore_notif.occurred_on() == notification.occurred_on()
         assert restore_notif.version() == notification.version()
         assert restore_notif.event().props()["name"] == "haichan"
+
+    def test_serialize_pins_the_wire_format(self):
+        test_event = DomainEvent(
+            name="TestEvent",
+            occurred_on=datetime(2023, 1, 2, 3, 4, 5),
+            props={
+                "a": 1,
+                "d": datetime(2023, 1, 1),
+                "u": UUID(UUIDRaw(int=1)),
+                "raw_u": UUIDRaw(int=1),
+                "dec": Decimal("1.5"),
+                "n": None,
+                "l": [1, (2, 3)],
+                "s": {1},
+                "nested": {"x": [{"y": date(2020, 2, 2)}], 1: "i"},
+            },
+            id=3,
+        )
+
+        json = NotificationSerializer.instance().serialize(Notification(7, test_event))
+
+        # the output of jsonpickle.encode(notification, unpicklable=False)
+        assert json.unwrap() == (
+            '{"id": 7, "event": {"version": 0, "occurred_on": "2023-01-02T03:04:05", '
+            '"name": "TestEvent", "props": {"a": 1, "d": "2023-01-01T00:00:00", '
+            '"u": "UUID [id=<built-in function id>]", '
+            '"raw_u": {"hex": "00000000000000000000000000000001"}, "dec": null, '
+            '"n": null, "l": [1, [2, 3]], "s": [1], '
+            '"nested": {"x": [{"y": "2020-02-02"}], "1": "i"}}, "id": 3}}'
+        )
@@ -0,0 +1,52 @@
+from typing import List
+
+from returns.future import FutureSuccess
+from returns.maybe import Nothing, Some
+
+from dino_seedwork_be.adapters.messaging.notification.Notification import \
+    Notification
+from dino_seedwork_be.adapters.messaging.notification.PublishedNotificationTracker import \
+    PublishedNotificationTracker
+from dino_seedwork_be.adapters.messaging.notification.PublishedNotificationTrackerStore import \
+    PublishedNotificationTrackerStore
+from dino_seedwork_be.utils.functional import unwrap_future_result
+
+
+class NotificationsTrackerStore(PublishedNotificationTrackerStore):
+    tracked_notifications: List[List[Notification]]
+
+    def __init__(self) -> None:
+        self.tracked_notifications = []
+
+    def track_most_recent_published_notification(
+        self, a_tracker: PublishedNotificationTracker, notifications: List[Notification]
+    ):
+        self.tracked_notifications.append(notifications)
+        return FutureSuccess(Some(notifications[-1].id()))
+
+
+class TestPublishedNotificationTrackerStore:
+    async def test_track_most_recent_published_notification_id_delegates(self):
+        store = NotificationsTrackerStore()
+        tracker = PublishedNotificationTracker.factory(type_name="topic").unwrap()
+
+        result = await unwrap_future_result(
+            store.track_most_recent_published_notification_id(tracker, Some(7))
+        )
+
+        assert result == Some(7)
+        assert [
+            [notification.id() for notification in notifications]
+            for notifications in store.tracked_notifications
+        ] == [[7]]
+
+    async def test_track_most_recent_published_notification_id_of_nothing(self):
+        store = NotificationsTrackerStore()
+        tracker = PublishedNotificationTracker.factory(type_name="topic").unwrap()
+
+        result = await unwrap_future_result(
+            store.track_most_recent_published_notification_id(tracker, Nothing)
+        )
+
+        assert result == Nothing
+        assert store.tracked_notifications == []
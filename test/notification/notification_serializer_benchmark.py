@@ -0,0 +1,55 @@
+"""
+Notifications serialized per second with jsonpickle (before) versus the
+as_dict encoder of NotificationSerializer (after).
+
+    python -m test.notification.notification_serializer_benchmark [number]
+"""
+import sys
+from datetime import datetime
+from timeit import timeit
+from uuid import uuid4
+
+import jsonpickle
+
+from dino_seedwork_be.adapters.messaging.notification.Notification import \
+    Notification
+from dino_seedwork_be.adapters.messaging.notification.NotificationSerializer import \
+    NotificationSerializer
+from dino_seedwork_be.domain.DomainEvent import DomainEvent
+from dino_seedwork_be.domain.value_object.UUID import UUID
+
+
+def main(number: int):
+    notification = Notification(
+        1,
+        DomainEvent(
+            name="BenchmarkEvent",
+            occurred_on=datetime.now(),
+            props={
+                "id": UUID(uuid4()),
+                "name": "benchmark",
+                "tags": ["a", "b", "c"],
+                "created_at": datetime.now(),
+                "amounts": {"net": 10, "gross": 12},
+            },
+            id=1,
+        ),
+    )
+    serializer = NotificationSerializer.instance()
+    assert (
+        jsonpickle.encode(notification, unpicklable=False)
+        == serializer.serialize(notification).unwrap()
+    )
+
+    for name, serialize in [
+        ("jsonpickle", lambda: jsonpickle.encode(notification, unpicklable=False)),
+        ("as_dict", lambda: serializer.serialize(notification)),
+    ]:
+        print(
+            "%s: %.0f notifications/s"
+            % (name, number / timeit(serialize, number=number))
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
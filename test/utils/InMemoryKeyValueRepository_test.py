@@ -0,0 +1,34 @@
+from returns.maybe import Nothing, Some
+
+from dino_seedwork_be.utils.functional import unwrap_future_result
+from dino_seedwork_be.utils.test.InMemoryKeyValueRepository import \
+    InMemoryKeyValueRepository
+
+
+class TestInMemoryKeyValueRepository:
+    async def test_set_many_then_get_many_in_order(self):
+        repository = InMemoryKeyValueRepository("test")
+
+        await unwrap_future_result(repository.set_many({"a": "1", "b": "2"}))
+
+        assert await unwrap_future_result(
+            repository.get_many(["b", "missing", "a"])
+        ) == [Some("2"), Nothing, Some("1")]
+
+    async def test_expired_key_is_gone(self):
+        repository = InMemoryKeyValueRepository()
+
+        await unwrap_future_result(repository.set("a", "1", expired_seconds=0))
+        await unwrap_future_result(repository.set("b", "2", expired_seconds=60))
+
+        assert await unwrap_future_result(repository.get("a")) == Nothing
+        assert await unwrap_future_result(repository.ttl("b")) == Some(60)
+
+    async def test_expire_sets_the_ttl_of_an_existing_key(self):
+        repository = InMemoryKeyValueRepository()
+        await unwrap_future_result(repository.set("a", "1"))
+
+        assert await unwrap_future_result(repository.ttl("a")) == Nothing
+        assert await unwrap_future_result(repository.expire("a", 30)) is True
+        assert await unwrap_future_result(repository.ttl("a")) == Some(30)
+        assert await unwrap_future_result(repository.expire("missing", 30)) is False